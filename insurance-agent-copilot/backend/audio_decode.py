@@ -0,0 +1,99 @@
+"""
+Audio Decoding
+Decodes uploaded audio bytes into the float32 mono 16 kHz array Whisper expects, by
+piping them through ffmpeg (stdin -> raw PCM on stdout) instead of writing a temp file
+for Whisper to read back. Containers ffmpeg cannot read from a pipe (e.g. MP4/M4A with
+the index at the end) fall back to a temp file.
+"""
+
+import os
+import subprocess
+import tempfile
+import threading
+from typing import Dict
+
+import numpy as np
+
+SAMPLE_RATE = 16000  # whisper.audio.SAMPLE_RATE
+WHISPER_DECODE_TIMEOUT_SECONDS = float(os.getenv("WHISPER_DECODE_TIMEOUT_SECONDS", "30"))
+
+_counts = {"piped": 0, "temp_file": 0, "failed": 0, "bytes_in": 0, "seconds_out": 0.0}
+_lock = threading.Lock()
+
+
+class AudioDecodeError(ValueError):
+    """The upload could not be decoded as audio"""
+
+
+def _ffmpeg(source: str, data: bytes = None, sample_rate: int = SAMPLE_RATE) -> bytes:
+    """Run ffmpeg on a file path, or on "pipe:0" with data fed to stdin; returns s16le PCM"""
+    cmd = ["ffmpeg", "-loglevel", "error", "-threads", "0"]
+    if data is None:
+        cmd.append("-nostdin")
+    cmd += [
+        "-i", source,
+        "-f", "s16le", "-ac", "1", "-acodec", "pcm_s16le", "-ar", str(sample_rate),
+        "pipe:1",
+    ]
+    try:
+        result = subprocess.run(
+            cmd, input=data, capture_output=True, timeout=WHISPER_DECODE_TIMEOUT_SECONDS, check=True
+        )
+    except subprocess.CalledProcessError as e:
+        raise AudioDecodeError(e.stderr.decode(errors="replace").strip() or "ffmpeg failed") from e
+    except subprocess.TimeoutExpired as e:
+        raise AudioDecodeError("Audio decoding timed out") from e
+    except FileNotFoundError as e:
+        raise RuntimeError("ffmpeg is not installed (Whisper needs it to decode audio)") from e
+    return result.stdout
+
+
+def decode_audio(data: bytes, sample_rate: int = SAMPLE_RATE) -> np.ndarray:
+    """
+    Decode audio bytes (webm, ogg, mp3, wav, ...) in memory
+
+    Args:
+        data: Uploaded file contents
+        sample_rate: Output sample rate
+
+    Returns:
+        float32 mono samples in [-1, 1]
+
+    Raises:
+        AudioDecodeError: If ffmpeg cannot decode it
+    """
+    if not data:
+        raise AudioDecodeError("Empty audio")
+
+    try:
+        pcm = _ffmpeg("pipe:0", data, sample_rate)
+        route = "piped"
+    except AudioDecodeError:
+        # Some containers need a seekable input
+        with tempfile.NamedTemporaryFile(suffix=".audio") as temp_audio:
+            temp_audio.write(data)
+            temp_audio.flush()
+            try:
+                pcm = _ffmpeg(temp_audio.name, sample_rate=sample_rate)
+            except AudioDecodeError:
+                with _lock:
+                    _counts["failed"] += 1
+                raise
+        route = "temp_file"
+
+    if not pcm:
+        with _lock:
+            _counts["failed"] += 1
+        raise AudioDecodeError("No audio stream found")
+
+    audio = np.frombuffer(pcm, np.int16).astype(np.float32) / 32768.0
+    with _lock:
+        _counts[route] += 1
+        _counts["bytes_in"] += len(data)
+        _counts["seconds_out"] += len(audio) / sample_rate
+    return audio
+
+
+def stats() -> Dict:
+    with _lock:
+        return {**_counts, "seconds_out": round(_counts["seconds_out"], 1)}
@@ -0,0 +1,139 @@
+"""
+Crew Construction Benchmark
+Compares building a validated CrewAI crew per request (agents, tasks and Crew
+validation) with binding the request to a pre-built crew template, and optionally
+the end-to-end kickoff latency of both, of direct (single-specialist) dispatch and of
+a compound request run hierarchically vs. as parallel specialists plus a merge, with
+the scripted fake LLM.
+
+Usage (from backend/):
+    python -m benchmarks.bench_crews
+    python -m benchmarks.bench_crews --iterations 500 --kickoff 20
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from typing import Callable, Dict, List
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+# Construction never calls the model; kickoff runs use the offline fake unless configured otherwise
+os.environ.setdefault("LLM_PROVIDER", "fake")
+os.environ.setdefault("CREWAI_TRACING_ENABLED", "false")
+os.environ.setdefault("OTEL_SDK_DISABLED", "true")
+
+MESSAGES = {
+    'lead_management': "Show me all hot leads",
+    'communication': "Send WhatsApp to Priya",
+    'task_management': "What tasks are due today?",
+    'analytics': "Summarize today",
+    'compliance': "Is 'guaranteed returns' compliant?",
+    'text_analysis': "Generate a personalized WhatsApp message for Priya",
+}
+
+# Over 10 words and mentions IRDAI: lead task + compliance task
+COMPOUND_MESSAGE = "Show me all hot leads in Mumbai and check that our guaranteed returns pitch is IRDAI compliant"
+
+
+def construct_per_request(agents, intent: str, message: str):
+    """Build a crew the way requests did before templates (shared agents, fresh tasks and Crew)"""
+    from crewai import Crew, Process
+    manager = agents.root_agent
+    tasks = [agents.create_root_orchestration_task(message), agents.INTENT_TASKS[intent](message)]
+    return Crew(
+        agents=agents.SPECIALIST_AGENTS,
+        tasks=tasks,
+        process=Process.hierarchical,
+        manager_agent=manager,
+        verbose=True
+    )
+
+
+def bind_template(agents, intent: str, message: str):
+    """Bind the request to the pooled template and check a crew out and back in"""
+    bound = agents.create_hierarchical_crew(message, intent)
+    with bound.template.checkout() as crew:
+        return crew
+
+
+def time_calls(func: Callable[[], object], iterations: int) -> List[float]:
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def summarize(timings: List[float]) -> Dict:
+    ordered = sorted(timings)
+    return {
+        "mean_ms": statistics.fmean(ordered),
+        "p50_ms": ordered[len(ordered) // 2],
+        "p99_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))],
+    }
+
+
+def print_row(label: str, stats: Dict):
+    print(f"   {label:<32}{stats['mean_ms']:>10.3f}{stats['p50_ms']:>10.3f}{stats['p99_ms']:>10.3f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark crew construction vs. pre-built crew templates")
+    parser.add_argument("--iterations", type=int, default=200, help="Constructions per intent")
+    parser.add_argument("--kickoff", type=int, default=0, help="Also time N full kickoffs per intent and mode")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    import crew_agents as agents
+    print(f"📦 crew_agents imported in {(time.perf_counter() - start):.2f}s")
+
+    start = time.perf_counter()
+    agents.crew_templates.prebuild(1)
+    print(f"🏗️  {len(agents.crew_templates.names())} crew templates prebuilt in "
+          f"{(time.perf_counter() - start) * 1000:.0f} ms")
+
+    print(f"\n⏱️  Per-request crew setup ({args.iterations} iterations per intent)")
+    print(f"   {'':<32}{'mean ms':>10}{'p50 ms':>10}{'p99 ms':>10}")
+    before, after = [], []
+    for intent, message in MESSAGES.items():
+        before += time_calls(lambda: construct_per_request(agents, intent, message), args.iterations)
+        after += time_calls(lambda: bind_template(agents, intent, message), args.iterations)
+    before_stats, after_stats = summarize(before), summarize(after)
+    print_row("construct Crew per request", before_stats)
+    print_row("bind pre-built template", after_stats)
+    print(f"   → {before_stats['mean_ms'] / after_stats['mean_ms']:.0f}x less setup per request")
+
+    if args.kickoff:
+        print(f"\n🚀 End-to-end kickoff ({args.kickoff} runs per intent, LLM_PROVIDER={os.environ['LLM_PROVIDER']})")
+        print(f"   {'':<32}{'mean ms':>10}{'p50 ms':>10}{'p99 ms':>10}")
+        before, after, direct = [], [], []
+        for intent, message in MESSAGES.items():
+            before += time_calls(lambda: construct_per_request(agents, intent, message).kickoff(), args.kickoff)
+            after += time_calls(lambda: agents.create_hierarchical_crew(message, intent).kickoff(), args.kickoff)
+            direct += time_calls(lambda: agents.route_request(message, intent, confidence=1.0).kickoff(), args.kickoff)
+        print_row("construct + kickoff", summarize(before))
+        print_row("template kickoff", summarize(after))
+        print_row("direct dispatch kickoff", summarize(direct))
+
+        print(f"\n🔀 Compound request ({args.kickoff} runs): \"{COMPOUND_MESSAGE}\"")
+        print(f"   {'':<32}{'mean ms':>10}{'p50 ms':>10}{'p99 ms':>10}")
+        for label, parallel in (("hierarchical (tasks in series)", False), ("parallel specialists + merge", True)):
+            agents.PARALLEL_TASKS_ENABLED = parallel
+            print_row(label, summarize(time_calls(
+                lambda: agents.create_hierarchical_crew(COMPOUND_MESSAGE, 'lead_management').kickoff(), args.kickoff
+            )))
+
+    print("\n📊 Template pools")
+    for name, stats in agents.crew_templates.stats().items():
+        print(f"   {name:<32} idle={stats['idle']} built={stats['built']} reused={stats['reused']} "
+              f"avg_build={stats['avg_build_ms']} ms avg_llm_calls={stats['avg_llm_calls']}")
+
+
+if __name__ == "__main__":
+    main()
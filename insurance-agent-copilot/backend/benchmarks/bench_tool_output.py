@@ -0,0 +1,67 @@
+"""
+Tool Output Size Benchmark
+Compares what the CrewAI tool wrappers put into an agent's prompt before (indented
+json.dumps of the whole result) and with the shared compact encoder (projected fields,
+paged rows), in estimated tokens and encode time, on synthetic data.
+
+Usage (from backend/):
+    python -m benchmarks.bench_tool_output
+    python -m benchmarks.bench_tool_output --scale 10k
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Callable, Dict
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+from benchmarks.synthetic_data import generate_dataset, parse_scale, scale_label
+from tool_output import (
+    ToolOutputEncoder, estimate_tokens, LEAD_FIELDS, TASK_FIELDS, AUDIT_FIELDS, INTERACTION_FIELDS
+)
+
+
+def timed(func: Callable[[], str]) -> Dict:
+    start = time.perf_counter()
+    text = func()
+    return {"ms": (time.perf_counter() - start) * 1000, "tokens": estimate_tokens(text)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark tool output size: indented JSON vs. compact encoder")
+    parser.add_argument("--scale", default="1k", help="Records per dataset (e.g. 1k, 10k)")
+    args = parser.parse_args()
+
+    n = parse_scale(args.scale)
+    dataset = generate_dataset(n)
+    encoder = ToolOutputEncoder()
+    lead = dataset["leads"][0]
+
+    cases = {
+        "Lead Search Tool (all leads)": (dataset["leads"], LEAD_FIELDS),
+        "Lead Management Tool (one lead)": (lead, None),
+        "Task Management Tool (all tasks)": (dataset["tasks"], TASK_FIELDS),
+        "Audit Tool (50 logs)": (dataset["auditLog"][:50], AUDIT_FIELDS),
+        "Interaction Tool (one lead)": (
+            [i for i in dataset["interactions"] if i.get("leadId") == lead["id"]], INTERACTION_FIELDS
+        ),
+    }
+
+    print(f"📏 Tool output per call ({scale_label(n)} records, max_rows={encoder.max_rows}, "
+          f"max_chars={encoder.max_chars})")
+    print(f"   {'':<34}{'before tok':>12}{'after tok':>11}{'saved':>8}{'before ms':>11}{'after ms':>10}")
+    for label, (result, fields) in cases.items():
+        before = timed(lambda: json.dumps(result, indent=2))
+        after = timed(lambda: encoder.encode(label, result, fields))
+        saved = 1 - after["tokens"] / before["tokens"] if before["tokens"] else 0
+        print(f"   {label:<34}{before['tokens']:>12,}{after['tokens']:>11,}{saved:>8.0%}"
+              f"{before['ms']:>11.2f}{after['ms']:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,311 @@
+"""
+Tool Scaling Benchmarks
+Times every public function in tools/leads, analytics, daily_summary, interactions,
+compliance and formatting against seeded synthetic data at increasing scales, and
+records latency and peak memory as JSON so runs can be compared between commits.
+
+Usage (from backend/):
+    python -m benchmarks.bench_tools                          # 1k,10k,100k,1m
+    python -m benchmarks.bench_tools --scales 1k,10k --repeat 3
+    python -m benchmarks.bench_tools --compare benchmarks/results/<baseline>.json
+"""
+
+import argparse
+import contextlib
+import gc
+import inspect
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+from tools import leads, analytics, daily_summary, interactions, compliance, formatting
+from benchmarks.synthetic_data import (
+    generate_dataset, generate_message_text, write_dataset, parse_scale, scale_label
+)
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'results')
+BENCHMARKED_MODULES = [leads, analytics, daily_summary, interactions, compliance, formatting]
+
+
+@contextlib.contextmanager
+def use_dataset(paths: Dict[str, str]):
+    """
+    Point the tool modules at a synthetic dataset for the duration of the block
+
+    Args:
+        paths: Mapping returned by write_dataset
+    """
+    from tools import audit, templates
+    patches = [
+        (leads, 'DATA_PATH', paths['leads']),
+        (analytics, 'LEADS_PATH', paths['leads']),
+        (daily_summary, 'LEADS_PATH', paths['leads']),
+        (daily_summary, 'TASKS_PATH', paths['tasks']),
+        (daily_summary, 'INTERACTIONS_PATH', paths['interactions']),
+        (interactions, 'DATA_PATH', paths['interactions']),
+        (audit, 'DATA_PATH', paths['auditLog']),
+        (templates, 'DATA_PATH', paths['templates']),
+    ]
+    originals = [(module, attr, getattr(module, attr)) for module, attr, _ in patches]
+    try:
+        for module, attr, value in patches:
+            setattr(module, attr, value)
+        yield
+    finally:
+        for module, attr, value in originals:
+            setattr(module, attr, value)
+
+
+def build_cases(dataset: Dict[str, List[Dict]], n: int) -> List[Tuple[str, Callable[[], Any]]]:
+    """
+    Build (name, zero-arg callable) benchmark cases for one scale
+
+    Lookups target a lead in the middle of the dataset so linear scans are not short-circuited.
+    """
+    sample_leads = dataset['leads']
+    sample_tasks = dataset['tasks']
+    sample_interactions = dataset['interactions']
+    sample_templates = dataset['templates']
+    middle = sample_leads[len(sample_leads) // 2]
+    lead_id = middle['id']
+    message = generate_message_text(max(n // 10, 50))
+    compliance_result = compliance.check_compliance(message)
+
+    return [
+        # tools/leads.py
+        ("leads.get_lead", lambda: leads.get_lead(lead_id)),
+        ("leads.search_leads", lambda: leads.search_leads(temperature="hot", search_term="sharma")),
+        ("leads.update_lead", lambda: leads.update_lead(lead_id, temperature="warm", notes="benchmark")),
+        ("leads.create_lead", lambda: leads.create_lead("Bench Lead", "+91-9000000000", location="Pune")),
+        ("leads.get_all_leads", lambda: leads.get_all_leads()),
+        ("leads.filter_leads_by_tag", lambda: leads.filter_leads_by_tag("interested")),
+        ("leads.get_renewal_leads", lambda: leads.get_renewal_leads()),
+        ("leads.get_followup_leads", lambda: leads.get_followup_leads()),
+        ("leads.get_high_value_leads", lambda: leads.get_high_value_leads()),
+        ("leads.get_leads_by_assigned_user", lambda: leads.get_leads_by_assigned_user("user-1")),
+        ("leads.get_leads_by_location", lambda: leads.get_leads_by_location("Mumbai")),
+        ("leads.get_leads_with_policy", lambda: leads.get_leads_with_policy()),
+        # tools/analytics.py
+        ("analytics.get_conversion_stats", lambda: analytics.get_conversion_stats()),
+        ("analytics.get_revenue_forecast", lambda: analytics.get_revenue_forecast()),
+        ("analytics.get_lead_distribution", lambda: analytics.get_lead_distribution()),
+        ("analytics.get_top_leads", lambda: analytics.get_top_leads(5)),
+        ("analytics.get_performance_metrics", lambda: analytics.get_performance_metrics()),
+        # tools/daily_summary.py
+        ("daily_summary.get_daily_summary", lambda: daily_summary.get_daily_summary()),
+        ("daily_summary.get_todays_briefing", lambda: daily_summary.get_todays_briefing()),
+        ("daily_summary.create_tasks_from_action_items", lambda: daily_summary.create_tasks_from_action_items()),
+        # tools/interactions.py
+        ("interactions.get_lead_interactions", lambda: interactions.get_lead_interactions(lead_id)),
+        ("interactions.add_interaction", lambda: interactions.add_interaction(lead_id, "call", "Benchmark call", 0.6)),
+        ("interactions.analyze_sentiment", lambda: interactions.analyze_sentiment(lead_id)),
+        # tools/compliance.py
+        ("compliance.check_compliance", lambda: compliance.check_compliance(message)),
+        ("compliance.get_safe_alternative", lambda: compliance.get_safe_alternative(message)),
+        ("compliance.validate_message", lambda: compliance.validate_message(message)),
+        # tools/formatting.py
+        ("formatting.format_response", lambda: formatting.format_response(sample_leads)),
+        ("formatting.format_leads_list", lambda: formatting.format_leads_list(sample_leads)),
+        ("formatting.format_lead_card", lambda: formatting.format_lead_card(middle)),
+        ("formatting.format_templates_list", lambda: formatting.format_templates_list(sample_templates)),
+        ("formatting.format_compliance_result", lambda: formatting.format_compliance_result(compliance_result)),
+        ("formatting.format_interactions_list", lambda: formatting.format_interactions_list(sample_interactions)),
+        ("formatting.format_tasks_list", lambda: formatting.format_tasks_list(sample_tasks)),
+        ("formatting.format_task_card", lambda: formatting.format_task_card(sample_tasks[0])),
+    ]
+
+
+def public_functions() -> List[str]:
+    """List public functions defined in the benchmarked tool modules"""
+    names = []
+    for module in BENCHMARKED_MODULES:
+        short = module.__name__.split('.')[-1]
+        for name, obj in inspect.getmembers(module, inspect.isfunction):
+            if not name.startswith('_') and obj.__module__ == module.__name__:
+                names.append(f"{short}.{name}")
+    return sorted(names)
+
+
+def measure(func: Callable[[], Any], repeat: int, max_seconds: float) -> Dict:
+    """
+    Time a case and measure its peak traced memory
+
+    The first run doubles as warm-up and calibration; repeats are reduced so a case
+    stays within max_seconds. Peak memory is measured on a separate traced run because
+    tracemalloc slows execution down.
+    """
+    gc.collect()
+    start = time.perf_counter()
+    func()
+    first = time.perf_counter() - start
+
+    runs = max(1, min(repeat, int(max_seconds / first) if first > 0 else repeat))
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+
+    gc.collect()
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    timings.sort()
+    return {
+        "runs": runs,
+        "latency_ms": {
+            "min": round(timings[0], 4),
+            "median": round(statistics.median(timings), 4),
+            "mean": round(statistics.fmean(timings), 4),
+            "p95": round(timings[min(len(timings) - 1, int(len(timings) * 0.95))], 4),
+            "max": round(timings[-1], 4),
+        },
+        "peak_memory_mb": round(peak / (1024 * 1024), 3),
+    }
+
+
+def git_commit() -> Optional[str]:
+    """Current git commit hash, if available"""
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=BACKEND_DIR, stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except Exception:
+        return None
+
+
+def run_benchmarks(scales: List[int], repeat: int, max_seconds: float, seed: int, only: Optional[str] = None) -> Dict:
+    """Run every case at every scale and return the results document"""
+    results = []
+    covered = set()
+
+    for n in scales:
+        label = scale_label(n)
+        print(f"\n📦 Generating synthetic data: {label} records per dataset (seed={seed})")
+        data_dir = tempfile.mkdtemp(prefix=f"bench-{label}-")
+        try:
+            dataset = generate_dataset(n, seed)
+            paths = write_dataset(dataset, data_dir)
+            with use_dataset(paths):
+                for name, func in build_cases(dataset, n):
+                    covered.add(name)
+                    if only and only not in name:
+                        continue
+                    stats = measure(func, repeat, max_seconds)
+                    results.append({"function": name, "scale": n, "scale_label": label, **stats})
+                    print(f"  {name:<48} median {stats['latency_ms']['median']:>11.3f} ms"
+                          f"   peak {stats['peak_memory_mb']:>9.2f} MB   ({stats['runs']} runs)")
+        finally:
+            shutil.rmtree(data_dir, ignore_errors=True)
+
+    missing = sorted(set(public_functions()) - covered)
+    if missing:
+        print(f"\n⚠️  Public functions without a benchmark case: {', '.join(missing)}")
+
+    return {
+        "meta": {
+            "commit": git_commit(),
+            "timestamp": datetime.now().isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": seed,
+            "repeat": repeat,
+            "scales": scales,
+        },
+        "results": results,
+    }
+
+
+def print_curves(document: Dict):
+    """Print median latency and peak memory per function across scales"""
+    by_function: Dict[str, Dict[int, Dict]] = {}
+    for row in document['results']:
+        by_function.setdefault(row['function'], {})[row['scale']] = row
+    scales = document['meta']['scales']
+
+    header = "".join(f"{scale_label(n):>14}" for n in scales)
+    print(f"\n📈 Median latency (ms)\n{'function':<48}{header}")
+    for name, rows in sorted(by_function.items()):
+        cells = "".join(f"{rows[n]['latency_ms']['median']:>14.3f}" if n in rows else f"{'-':>14}" for n in scales)
+        print(f"{name:<48}{cells}")
+
+    print(f"\n💾 Peak memory (MB)\n{'function':<48}{header}")
+    for name, rows in sorted(by_function.items()):
+        cells = "".join(f"{rows[n]['peak_memory_mb']:>14.2f}" if n in rows else f"{'-':>14}" for n in scales)
+        print(f"{name:<48}{cells}")
+
+
+def compare(current: Dict, baseline: Dict, threshold: float) -> int:
+    """
+    Compare median latencies against a baseline run
+
+    Returns:
+        Number of regressions slower than threshold x baseline
+    """
+    base = {(r['function'], r['scale']): r for r in baseline['results']}
+    regressions = 0
+    print(f"\n🔍 Comparing against {baseline['meta'].get('commit')} ({baseline['meta'].get('timestamp')})")
+    for row in current['results']:
+        old = base.get((row['function'], row['scale']))
+        if not old:
+            continue
+        before, after = old['latency_ms']['median'], row['latency_ms']['median']
+        ratio = after / before if before > 0 else float('inf')
+        marker = "❌" if ratio > threshold else "✅" if ratio < 1 / threshold else "  "
+        if ratio > threshold:
+            regressions += 1
+        print(f"{marker} {row['function']:<48}{row['scale_label']:>6}  {before:>11.3f} -> {after:>11.3f} ms  x{ratio:.2f}")
+    print(f"\n{regressions} regression(s) above x{threshold}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark tools/* against synthetic data")
+    parser.add_argument("--scales", default="1k,10k,100k,1m", help="Comma-separated scales")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per case")
+    parser.add_argument("--max-seconds", type=float, default=10.0, help="Time budget per case")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--only", help="Only run cases whose name contains this text")
+    parser.add_argument("--output", help="Result file (default: benchmarks/results/<commit>-<time>.json)")
+    parser.add_argument("--compare", help="Baseline result file to compare against")
+    parser.add_argument("--threshold", type=float, default=1.2, help="Regression ratio threshold")
+    args = parser.parse_args()
+
+    scales = [parse_scale(s) for s in args.scales.split(',') if s.strip()]
+    document = run_benchmarks(scales, args.repeat, args.max_seconds, args.seed, args.only)
+    print_curves(document)
+
+    output = args.output
+    if not output:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        output = os.path.join(RESULTS_DIR, f"{document['meta']['commit'] or 'nogit'}-{stamp}.json")
+    with open(output, 'w') as f:
+        json.dump(document, f, indent=2)
+    print(f"\n✅ Results written to {output}")
+
+    if args.compare:
+        with open(args.compare, 'r') as f:
+            baseline = json.load(f)
+        if compare(document, baseline, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+"""
+Intent Classifier Evaluation
+Trains the local intent classifier and reports stratified k-fold accuracy, per-label
+precision/recall, accuracy vs. coverage at confidence thresholds, the misroute rate of
+direct dispatch (no crew manager) at its thresholds, and latency.
+
+Usage (from backend/):
+    python -m benchmarks.eval_intent
+    python -m benchmarks.eval_intent --folds 10 --sharpness 6 --alpha 0.3
+    python -m benchmarks.eval_intent --max-misroute 0.02
+    python -m benchmarks.eval_intent --query "Send WhatsApp to Priya"
+"""
+
+import argparse
+import random
+import statistics
+import time
+from collections import Counter, defaultdict
+from typing import List, Tuple
+
+from intent_classifier import (
+    IntentClassifier, load_examples, INTENT_CONFIDENCE_THRESHOLD, DIRECT_DISPATCH_CONFIDENCE
+)
+
+THRESHOLDS = [0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9]
+DISPATCH_THRESHOLDS = [0.8, 0.85, 0.9, 0.93, 0.95, 0.97, 0.98, 0.99]
+
+
+def stratified_folds(examples: List[Tuple[str, str]], k: int, seed: int) -> List[List[Tuple[str, str]]]:
+    """Split examples into k folds with the label mix preserved"""
+    rng = random.Random(seed)
+    by_label = defaultdict(list)
+    for example in examples:
+        by_label[example[1]].append(example)
+    folds = [[] for _ in range(k)]
+    for items in by_label.values():
+        rng.shuffle(items)
+        for i, item in enumerate(items):
+            folds[i % k].append(item)
+    return folds
+
+
+def cross_validate(examples, k: int, seed: int, alpha: float, sharpness: float) -> List[Tuple[str, str, float]]:
+    """
+    Returns:
+        (true label, predicted label, confidence) for every example
+    """
+    folds = stratified_folds(examples, k, seed)
+    predictions = []
+    for i, test in enumerate(folds):
+        train = [e for j, fold in enumerate(folds) if j != i for e in fold]
+        model = IntentClassifier(alpha=alpha, sharpness=sharpness).fit(train)
+        for text, label in test:
+            predicted, confidence = model.predict(text)
+            predictions.append((label, predicted, confidence))
+    return predictions
+
+
+def report_accuracy(predictions: List[Tuple[str, str, float]]):
+    correct = sum(1 for true, pred, _ in predictions if true == pred)
+    print(f"\n🎯 Cross-validated accuracy: {correct / len(predictions):.1%} ({correct}/{len(predictions)})")
+
+    print(f"\n   {'label':<20}{'precision':>10}{'recall':>10}{'support':>9}")
+    labels = sorted({p[0] for p in predictions})
+    for label in labels:
+        tp = sum(1 for t, p, _ in predictions if t == label and p == label)
+        predicted = sum(1 for _, p, _ in predictions if p == label)
+        support = sum(1 for t, _, _ in predictions if t == label)
+        precision = tp / predicted if predicted else 0.0
+        recall = tp / support if support else 0.0
+        print(f"   {label:<20}{precision:>10.1%}{recall:>10.1%}{support:>9}")
+
+    confusions = Counter((t, p) for t, p, _ in predictions if t != p)
+    if confusions:
+        print("\n   Most common confusions:")
+        for (true, pred), count in confusions.most_common(5):
+            print(f"   {true} → {pred}: {count}")
+
+
+def report_thresholds(predictions: List[Tuple[str, str, float]]):
+    """Accuracy of locally answered messages vs. share sent to the LLM"""
+    print(f"\n   {'threshold':>10}{'local':>9}{'local acc':>11}{'to LLM':>9}")
+    for threshold in THRESHOLDS:
+        local = [(t, p) for t, p, c in predictions if c >= threshold]
+        accuracy = sum(1 for t, p in local if t == p) / len(local) if local else 0.0
+        marker = "  ← INTENT_CONFIDENCE_THRESHOLD" if abs(threshold - INTENT_CONFIDENCE_THRESHOLD) < 1e-9 else ""
+        print(f"   {threshold:>10.1f}{len(local) / len(predictions):>9.1%}{accuracy:>11.1%}"
+              f"{1 - len(local) / len(predictions):>9.1%}{marker}")
+
+
+def report_dispatch(predictions: List[Tuple[str, str, float]], max_misroute: float):
+    """
+    Share of messages confident enough for direct dispatch, and how many of those the
+    local classifier alone sends to the wrong specialist (with no manager to correct it)
+    """
+    print(f"\n🚦 Direct dispatch on the local classifier alone (target misroute ≤ {max_misroute:.1%})")
+    print(f"   {'threshold':>10}{'direct':>9}{'misroute':>10}{'per 100 msgs':>14}")
+    supported = None
+    for threshold in sorted(set(DISPATCH_THRESHOLDS) | {DIRECT_DISPATCH_CONFIDENCE}):
+        direct = [(t, p) for t, p, c in predictions if c >= threshold]
+        wrong = sum(1 for t, p in direct if t != p)
+        rate = wrong / len(direct) if direct else 0.0
+        if supported is None and direct and rate <= max_misroute:
+            supported = threshold
+        marker = "  ← DIRECT_DISPATCH_CONFIDENCE" if abs(threshold - DIRECT_DISPATCH_CONFIDENCE) < 1e-9 else ""
+        print(f"   {threshold:>10.2f}{len(direct) / len(predictions):>9.1%}{rate:>10.1%}"
+              f"{100 * wrong / len(predictions):>14.1f}{marker}")
+    if supported is None:
+        print("   No threshold meets the target: keep DIRECT_DISPATCH_VERIFY on (the LLM must agree)")
+    else:
+        print(f"   Lowest threshold meeting the target: {supported:.2f}")
+
+
+def report_latency(model: IntentClassifier, examples: List[Tuple[str, str]], rounds: int):
+    texts = [text for text, _ in examples]
+    timings = []
+    for _ in range(rounds):
+        for text in texts:
+            start = time.perf_counter()
+            model.predict(text)
+            timings.append((time.perf_counter() - start) * 1_000_000)
+    timings.sort()
+    print(f"\n⚡ Prediction latency over {len(timings)} calls: "
+          f"mean {statistics.fmean(timings):.0f} µs | p50 {timings[len(timings) // 2]:.0f} µs | "
+          f"p99 {timings[int(len(timings) * 0.99)]:.0f} µs")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Evaluate the local intent classifier")
+    parser.add_argument("--examples", help="Labeled examples JSON (default: intent_examples.json)")
+    parser.add_argument("--folds", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--alpha", type=float, default=0.5)
+    parser.add_argument("--sharpness", type=float, default=8.0)
+    parser.add_argument("--rounds", type=int, default=20, help="Latency measurement rounds")
+    parser.add_argument("--max-misroute", type=float, default=0.02,
+                        help="Acceptable share of directly dispatched messages sent to the wrong specialist")
+    parser.add_argument("--query", help="Classify a single message and exit")
+    args = parser.parse_args()
+
+    examples = load_examples(args.examples)
+    start = time.perf_counter()
+    model = IntentClassifier(alpha=args.alpha, sharpness=args.sharpness).fit(examples)
+    train_ms = (time.perf_counter() - start) * 1000
+
+    if args.query:
+        proba = model.predict_proba(args.query)
+        for label, p in sorted(proba.items(), key=lambda item: -item[1]):
+            print(f"   {label:<20}{p:.3f}")
+        return
+
+    counts = Counter(label for _, label in examples)
+    print(f"📚 {len(examples)} examples, {len(counts)} labels, {len(model.vocabulary):,} features "
+          f"(trained in {train_ms:.1f} ms)")
+
+    predictions = cross_validate(examples, args.folds, args.seed, args.alpha, args.sharpness)
+    report_accuracy(predictions)
+    report_thresholds(predictions)
+    report_dispatch(predictions, args.max_misroute)
+    report_latency(model, examples, args.rounds)
+
+
+if __name__ == "__main__":
+    main()
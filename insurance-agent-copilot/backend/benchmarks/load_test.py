@@ -0,0 +1,473 @@
+"""
+Load Test Harness
+Open-loop load generator (asyncio + httpx) for the FastAPI backends. Sends a weighted
+mix of agent, streaming and legacy requests at a configurable arrival rate and reports
+latency percentiles/histograms, SSE time-to-first-token, error rates and server-side
+CPU/memory usage.
+
+Start a backend in fake-LLM mode first, e.g.:
+    LLM_PROVIDER=fake FAKE_LLM_LATENCY_MS=normal:300,50 uvicorn main:app --port 5000
+
+Usage (from backend/):
+    python -m benchmarks.load_test --url http://localhost:5000 --rate 20 --duration 60
+    python -m benchmarks.load_test --mix search=50,lead=30,compliance=20 --arrival constant
+    python -m benchmarks.load_test --ramp 5,10,20,40,80 --slo-ms 2000   # find max sustainable RPS
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import statistics
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+import httpx
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'results')
+
+# Histogram bucket upper bounds in milliseconds
+HISTOGRAM_BUCKETS_MS = [10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, math.inf]
+
+SEARCH_QUERIES = ["Show me all hot leads", "Find Priya Sharma", "Show leads in Mumbai", "Show high value leads"]
+BRIEFING_QUERIES = ["Summarize today", "Daily briefing", "What's my day like?"]
+DRAFT_QUERIES = ["Send WhatsApp to Priya", "Send email to Amit Patel", "Draft a renewal message for Sneha"]
+COMPLIANCE_TEXTS = [
+    "Our plan gives guaranteed returns with zero risk",
+    "Tax free income and the best policy in the market",
+    "Premiums start from Rs 500 per month with flexible payment options",
+]
+
+
+@dataclass
+class Scenario:
+    """One kind of request in the traffic mix"""
+    name: str
+    method: str
+    path: Callable[[random.Random], str]
+    body: Optional[Callable[[random.Random], Dict]] = None
+    stream: bool = False
+
+
+SCENARIOS = {
+    "search": Scenario("search", "POST", lambda r: "/api/agent",
+                       lambda r: {"message": r.choice(SEARCH_QUERIES)}),
+    "search_stream": Scenario("search_stream", "POST", lambda r: "/api/agent/stream",
+                              lambda r: {"message": r.choice(SEARCH_QUERIES)}, stream=True),
+    "briefing": Scenario("briefing", "POST", lambda r: "/api/agent/stream",
+                         lambda r: {"message": r.choice(BRIEFING_QUERIES)}, stream=True),
+    "draft": Scenario("draft", "POST", lambda r: "/api/agent",
+                      lambda r: {"message": r.choice(DRAFT_QUERIES)}),
+    "compliance": Scenario("compliance", "POST", lambda r: "/api/compliance/validate",
+                           lambda r: {"content": r.choice(COMPLIANCE_TEXTS)}),
+    "compliance_agent": Scenario("compliance_agent", "POST", lambda r: "/api/agent",
+                                 lambda r: {"message": f"Is '{r.choice(COMPLIANCE_TEXTS)}' IRDAI compliant?"}),
+    "lead": Scenario("lead", "GET", lambda r: f"/api/leads/lead-{r.randint(1, 4)}"),
+    "leads_list": Scenario("leads_list", "GET", lambda r: "/api/leads"),
+}
+
+DEFAULT_MIX = "search=25,search_stream=10,briefing=10,draft=15,compliance=10,compliance_agent=5,lead=20,leads_list=5"
+
+
+@dataclass
+class Sample:
+    scenario: str
+    start: float
+    latency_ms: float
+    ok: bool
+    status: Optional[int] = None
+    error: Optional[str] = None
+    ttft_ms: Optional[float] = None
+
+
+@dataclass
+class StageResult:
+    target_rps: float
+    duration: float
+    offered_for: float = 0.0
+    samples: List[Sample] = field(default_factory=list)
+    sent: int = 0
+    dropped: int = 0
+    resources: List[Dict] = field(default_factory=list)
+
+
+def parse_mix(spec: str) -> Dict[str, float]:
+    """Parse 'search=40,lead=60' into normalized weights"""
+    weights = {}
+    for part in spec.split(','):
+        if not part.strip():
+            continue
+        name, _, weight = part.partition('=')
+        name = name.strip()
+        if name not in SCENARIOS:
+            raise ValueError(f"Unknown scenario '{name}'. Available: {', '.join(SCENARIOS)}")
+        weights[name] = float(weight or 1)
+    total = sum(weights.values())
+    return {name: w / total for name, w in weights.items()}
+
+
+def percentile(sorted_values: List[float], pct: float) -> Optional[float]:
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, max(0, math.ceil(pct / 100 * len(sorted_values)) - 1))
+    return round(sorted_values[index], 2)
+
+
+def histogram(values: List[float]) -> Dict[str, int]:
+    counts = {}
+    for bound in HISTOGRAM_BUCKETS_MS:
+        counts["+Inf" if bound == math.inf else f"<={bound}ms"] = 0
+    for value in values:
+        for bound in HISTOGRAM_BUCKETS_MS:
+            if value <= bound:
+                counts["+Inf" if bound == math.inf else f"<={bound}ms"] += 1
+                break
+    return counts
+
+
+# ------------------------------
+# Request execution
+# ------------------------------
+async def execute(client: httpx.AsyncClient, scenario: Scenario, rng: random.Random) -> Sample:
+    """Send one request; SSE responses are read to the end and TTFT is recorded"""
+    path = scenario.path(rng)
+    body = scenario.body(rng) if scenario.body else None
+    start = time.perf_counter()
+    try:
+        if scenario.stream:
+            ttft = None
+            error = None
+            async with client.stream(scenario.method, path, json=body) as response:
+                async for line in response.aiter_lines():
+                    if not line.startswith("data:"):
+                        continue
+                    try:
+                        frame = json.loads(line[5:].strip())
+                    except ValueError:
+                        continue
+                    if frame.get("type") == "content" and ttft is None:
+                        ttft = (time.perf_counter() - start) * 1000
+                    elif frame.get("type") == "error":
+                        error = f"sse_error: {str(frame.get('data'))[:80]}"
+                status = response.status_code
+            latency = (time.perf_counter() - start) * 1000
+            ok = status < 400 and error is None
+            return Sample(scenario.name, start, latency, ok, status, error or (None if ok else f"http_{status}"), ttft)
+
+        response = await client.request(scenario.method, path, json=body)
+        latency = (time.perf_counter() - start) * 1000
+        ok = response.status_code < 400
+        error = None if ok else f"http_{response.status_code}"
+        # The CrewAI backend reports failures in a 200 body
+        if ok and path.startswith("/api/agent"):
+            try:
+                if response.json().get("process") == "error_fallback":
+                    ok, error = False, "agent_error_fallback"
+            except ValueError:
+                pass
+        return Sample(scenario.name, start, latency, ok, response.status_code, error)
+
+    except Exception as e:
+        latency = (time.perf_counter() - start) * 1000
+        return Sample(scenario.name, start, latency, False, None, type(e).__name__)
+
+
+def find_server_pid(url: str) -> Optional[int]:
+    """Find the PID listening on the URL's port (best effort)"""
+    if psutil is None:
+        return None
+    port = httpx.URL(url).port or 80
+    try:
+        for conn in psutil.net_connections(kind='tcp'):
+            if conn.laddr and conn.laddr.port == port and conn.status == psutil.CONN_LISTEN and conn.pid:
+                return conn.pid
+    except (psutil.AccessDenied, PermissionError):
+        pass
+    return None
+
+
+async def sample_resources(pid: int, stop: asyncio.Event, out: List[Dict], interval: float = 0.5):
+    """Sample CPU, RSS, threads and open files of the server process (and its children)"""
+    try:
+        process = psutil.Process(pid)
+        processes = [process] + process.children(recursive=True)
+        for p in processes:
+            p.cpu_percent(None)
+        while not stop.is_set():
+            await asyncio.sleep(interval)
+            cpu = rss = threads = fds = 0
+            for p in processes:
+                try:
+                    cpu += p.cpu_percent(None)
+                    rss += p.memory_info().rss
+                    threads += p.num_threads()
+                    fds += p.num_fds() if hasattr(p, 'num_fds') else 0
+                except psutil.NoSuchProcess:
+                    continue
+            out.append({
+                "t": round(time.perf_counter(), 3),
+                "cpu_percent": round(cpu, 1),
+                "rss_mb": round(rss / (1024 * 1024), 1),
+                "threads": threads,
+                "open_fds": fds,
+            })
+    except psutil.Error as e:
+        print(f"⚠️  Resource sampling stopped: {e}")
+
+
+async def run_stage(
+    url: str,
+    rate: float,
+    duration: float,
+    mix: Dict[str, float],
+    arrival: str,
+    max_inflight: int,
+    timeout: float,
+    seed: int,
+    server_pid: Optional[int]
+) -> StageResult:
+    """Generate open-loop traffic at `rate` requests/second for `duration` seconds"""
+    rng = random.Random(seed)
+    names = list(mix)
+    weights = [mix[n] for n in names]
+    result = StageResult(target_rps=rate, duration=duration)
+    inflight = set()
+
+    stop = asyncio.Event()
+    sampler = None
+    if server_pid and psutil is not None:
+        sampler = asyncio.create_task(sample_resources(server_pid, stop, result.resources))
+
+    limits = httpx.Limits(max_connections=max_inflight, max_keepalive_connections=max_inflight)
+    async with httpx.AsyncClient(base_url=url, timeout=timeout, limits=limits) as client:
+        start = time.perf_counter()
+        next_at = start
+        while True:
+            gap = rng.expovariate(rate) if arrival == "poisson" else 1.0 / rate
+            next_at += gap
+            if next_at - start >= duration:
+                break
+            delay = next_at - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            if len(inflight) >= max_inflight:
+                # Open-loop generator: never queue on the client side, count as dropped
+                result.dropped += 1
+                continue
+
+            scenario = SCENARIOS[rng.choices(names, weights)[0]]
+            result.sent += 1
+            task = asyncio.create_task(execute(client, scenario, random.Random(rng.random())))
+            inflight.add(task)
+            task.add_done_callback(lambda t: (inflight.discard(t), result.samples.append(t.result())))
+
+        offered_for = time.perf_counter() - start
+        if inflight:
+            await asyncio.wait(inflight)
+        result.duration = time.perf_counter() - start
+        result.offered_for = offered_for
+
+    stop.set()
+    if sampler:
+        await sampler
+    return result
+
+
+# ------------------------------
+# Reporting
+# ------------------------------
+def summarize(stage: StageResult) -> Dict:
+    """Build the report section for one stage"""
+    def latency_block(samples: List[Sample]) -> Dict:
+        latencies = sorted(s.latency_ms for s in samples if s.ok)
+        ttfts = sorted(s.ttft_ms for s in samples if s.ttft_ms is not None)
+        errors: Dict[str, int] = {}
+        for s in samples:
+            if not s.ok:
+                errors[s.error or "unknown"] = errors.get(s.error or "unknown", 0) + 1
+        block = {
+            "requests": len(samples),
+            "errors": sum(errors.values()),
+            "error_rate": round(sum(errors.values()) / len(samples), 4) if samples else 0,
+            "error_breakdown": errors,
+            "latency_ms": {
+                "p50": percentile(latencies, 50),
+                "p95": percentile(latencies, 95),
+                "p99": percentile(latencies, 99),
+                "mean": round(statistics.fmean(latencies), 2) if latencies else None,
+                "max": round(latencies[-1], 2) if latencies else None,
+            },
+            "histogram": histogram(latencies),
+        }
+        if ttfts:
+            block["ttft_ms"] = {
+                "p50": percentile(ttfts, 50),
+                "p95": percentile(ttfts, 95),
+                "p99": percentile(ttfts, 99),
+            }
+        return block
+
+    report = {
+        "target_rps": stage.target_rps,
+        "offered_rps": round((stage.sent + stage.dropped) / stage.offered_for, 2) if stage.offered_for else 0,
+        "achieved_rps": round(len(stage.samples) / stage.duration, 2) if stage.duration else 0,
+        "duration_s": round(stage.duration, 2),
+        "dropped_client_side": stage.dropped,
+        "overall": latency_block(stage.samples),
+        "scenarios": {},
+    }
+    for name in sorted({s.scenario for s in stage.samples}):
+        report["scenarios"][name] = latency_block([s for s in stage.samples if s.scenario == name])
+
+    if stage.resources:
+        cpu = [r["cpu_percent"] for r in stage.resources]
+        rss = [r["rss_mb"] for r in stage.resources]
+        report["server_resources"] = {
+            "cpu_percent_mean": round(statistics.fmean(cpu), 1),
+            "cpu_percent_max": max(cpu),
+            "rss_mb_max": max(rss),
+            "threads_max": max(r["threads"] for r in stage.resources),
+            "open_fds_max": max(r["open_fds"] for r in stage.resources),
+            "samples": stage.resources,
+        }
+    return report
+
+
+def print_report(report: Dict):
+    overall = report["overall"]
+    lat = overall["latency_ms"]
+    print(f"\n🎯 Target {report['target_rps']} rps, offered {report['offered_rps']} rps → achieved {report['achieved_rps']} rps "
+          f"({overall['requests']} requests, {report['dropped_client_side']} dropped client-side)")
+    print(f"   Latency p50 {lat['p50']} ms | p95 {lat['p95']} ms | p99 {lat['p99']} ms | "
+          f"errors {overall['errors']} ({overall['error_rate'] * 100:.2f}%)")
+    if overall["error_breakdown"]:
+        print(f"   Errors: {overall['error_breakdown']}")
+
+    print(f"\n   {'scenario':<18}{'reqs':>6}{'p50':>10}{'p95':>10}{'p99':>10}{'ttft p50':>11}{'err%':>8}")
+    for name, block in report["scenarios"].items():
+        l = block["latency_ms"]
+        ttft = block.get("ttft_ms", {}).get("p50")
+        print(f"   {name:<18}{block['requests']:>6}{str(l['p50']):>10}{str(l['p95']):>10}{str(l['p99']):>10}"
+              f"{str(ttft if ttft is not None else '-'):>11}{block['error_rate'] * 100:>8.2f}")
+
+    print("\n   Latency histogram (successful requests):")
+    total = max(1, sum(overall["histogram"].values()))
+    for bucket, count in overall["histogram"].items():
+        bar = "█" * int(40 * count / total)
+        print(f"   {bucket:>10} {count:>6} {bar}")
+
+    resources = report.get("server_resources")
+    if resources:
+        print(f"\n   Server: CPU mean {resources['cpu_percent_mean']}% (max {resources['cpu_percent_max']}%), "
+              f"RSS max {resources['rss_mb_max']} MB, threads max {resources['threads_max']}, "
+              f"fds max {resources['open_fds_max']}")
+
+
+def is_sustainable(report: Dict, slo_ms: float, max_error_rate: float) -> bool:
+    """A stage is sustainable if completions keep up with offered load, p95 meets the SLO and errors stay low"""
+    overall = report["overall"]
+    p95 = overall["latency_ms"]["p95"]
+    return (
+        report["achieved_rps"] >= 0.9 * report["offered_rps"]
+        and report["dropped_client_side"] == 0
+        and overall["error_rate"] <= max_error_rate
+        and p95 is not None and p95 <= slo_ms
+    )
+
+
+async def main_async(args):
+    mix = parse_mix(args.mix)
+    server_pid = args.server_pid or find_server_pid(args.url)
+    if server_pid:
+        print(f"📊 Sampling server resources of PID {server_pid}")
+    else:
+        print("⚠️  Server PID not found - pass --server-pid to record server resource usage")
+
+    async with httpx.AsyncClient(base_url=args.url, timeout=10) as client:
+        health = (await client.get("/health")).json()
+    print(f"✅ {args.url} is up (llm_provider={health.get('llm_provider', 'unknown')})")
+    if health.get("llm_provider") not in (None, "fake"):
+        print("⚠️  Backend is not in fake-LLM mode, every agent request will call Gemini")
+
+    rates = [float(r) for r in args.ramp.split(',')] if args.ramp else [args.rate]
+    stages = []
+    max_sustainable = None
+    for i, rate in enumerate(rates):
+        print(f"\n🚀 Stage {i + 1}/{len(rates)}: {rate} rps for {args.duration}s ({args.arrival} arrivals)")
+        stage = await run_stage(
+            args.url, rate, args.duration, mix, args.arrival, args.max_inflight,
+            args.timeout, args.seed + i, server_pid
+        )
+        report = summarize(stage)
+        report["sustainable"] = is_sustainable(report, args.slo_ms, args.max_error_rate)
+        print_report(report)
+        stages.append(report)
+        if report["sustainable"]:
+            max_sustainable = rate
+        elif args.ramp:
+            print(f"\n🛑 {rate} rps is not sustainable (p95 SLO {args.slo_ms} ms, max error rate {args.max_error_rate})")
+            break
+
+    if args.ramp:
+        print(f"\n🏁 Max sustainable rate: {max_sustainable if max_sustainable is not None else '< ' + str(rates[0])} rps")
+
+    document = {
+        "meta": {
+            "url": args.url,
+            "timestamp": datetime.now().isoformat(),
+            "mix": mix,
+            "arrival": args.arrival,
+            "duration_s": args.duration,
+            "seed": args.seed,
+            "slo_ms": args.slo_ms,
+            "server": health,
+        },
+        "max_sustainable_rps": max_sustainable,
+        "stages": stages,
+    }
+    output = args.output
+    if not output:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        output = os.path.join(RESULTS_DIR, f"load-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json")
+    with open(output, 'w') as f:
+        json.dump(document, f, indent=2)
+    print(f"\n✅ Report written to {output}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the Insurance Agent Copilot API")
+    parser.add_argument("--url", default="http://localhost:5000")
+    parser.add_argument("--rate", type=float, default=10, help="Target requests per second")
+    parser.add_argument("--ramp", help="Comma-separated rates to step through (finds max sustainable RPS)")
+    parser.add_argument("--duration", type=float, default=30, help="Seconds per stage")
+    parser.add_argument("--arrival", choices=["poisson", "constant"], default="poisson")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help=f"Scenario weights ({', '.join(SCENARIOS)})")
+    parser.add_argument("--max-inflight", type=int, default=500, help="Client-side concurrency cap")
+    parser.add_argument("--timeout", type=float, default=60)
+    parser.add_argument("--slo-ms", type=float, default=2000, help="p95 latency SLO for --ramp")
+    parser.add_argument("--max-error-rate", type=float, default=0.01)
+    parser.add_argument("--server-pid", type=int, help="Server PID for resource sampling (auto-detected)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="Report file (default: benchmarks/results/load-<time>.json)")
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(main_async(args))
+    except httpx.ConnectError:
+        print(f"❌ Cannot connect to {args.url} - start the backend first")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
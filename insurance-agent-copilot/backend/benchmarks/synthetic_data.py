@@ -0,0 +1,256 @@
+"""
+Synthetic Data Generator
+Seeded generator for leads, interactions, tasks, audit logs and templates
+shaped like the mock data in src/data/mock, at any scale.
+
+Usage:
+    python -m benchmarks.synthetic_data --scale 10k --out /tmp/bench-data
+"""
+
+import argparse
+import json
+import os
+import random
+from datetime import datetime, timedelta
+from typing import Dict, List
+
+FIRST_NAMES = [
+    "Priya", "Amit", "Sneha", "Rahul", "Aakash", "Ananya", "Vikram", "Kavya", "Arjun", "Meera",
+    "Rohan", "Divya", "Karan", "Pooja", "Suresh", "Neha", "Aditya", "Isha", "Manish", "Ritu"
+]
+LAST_NAMES = [
+    "Sharma", "Patel", "Reddy", "Mehta", "Iyer", "Gupta", "Singh", "Nair", "Joshi", "Kumar",
+    "Das", "Rao", "Verma", "Chopra", "Menon", "Bose", "Kulkarni", "Pillai", "Shah", "Agarwal"
+]
+LOCATIONS = [
+    ("Mumbai, Maharashtra", 19.076, 72.8777), ("Delhi, Delhi", 28.7041, 77.1025),
+    ("Bangalore, Karnataka", 12.9716, 77.5946), ("Hyderabad, Telangana", 17.385, 78.4867),
+    ("Chennai, Tamil Nadu", 13.0827, 80.2707), ("Pune, Maharashtra", 18.5204, 73.8567),
+    ("Kolkata, West Bengal", 22.5726, 88.3639), ("Ahmedabad, Gujarat", 23.0225, 72.5714),
+    ("Jaipur, Rajasthan", 26.9124, 75.7873), ("Lucknow, Uttar Pradesh", 26.8467, 80.9462)
+]
+PRODUCTS = [
+    "Term Assurance Plans", "Endowment Plans", "Health Insurance", "Child Plans",
+    "Pension Plans", "Money Back Plans", "ULIP", "Whole Life Plans"
+]
+TAGS = ["high-value", "interested", "follow-up", "renewal-due", "new-lead", "urgent", "existing-customer"]
+TEMPERATURES = (["hot"] * 2) + (["warm"] * 3) + (["cold"] * 5)
+INTERACTION_TYPES = ["call", "message", "email", "meeting", "whatsapp"]
+TASK_PRIORITIES = ["low", "medium", "high", "urgent"]
+TASK_STATUSES = ["pending", "in-progress", "completed"]
+AUDIT_ACTIONS = ["update_lead", "send_message", "create_task", "schedule_meeting", "check_compliance"]
+TEMPLATE_CATEGORIES = ["Renewal", "Follow-up", "Welcome", "Birthday", "Product Info"]
+SUMMARIES = [
+    "Discussed term life policy options. Very interested in 1 crore coverage.",
+    "Sent renewal reminder and upgrade options",
+    "Asked for a premium comparison with existing policy",
+    "Requested callback in the evening",
+    "Shared KYC documents, awaiting medical reports",
+    "Not interested right now, follow up next quarter",
+]
+MESSAGE_SNIPPETS = [
+    "This plan offers potential returns based on market performance.",
+    "Our policy gives guaranteed returns with zero risk.",
+    "Tax benefits as per prevailing tax laws apply.",
+    "Premiums start from Rs 500 per month with flexible payment options.",
+    "This is the best policy with highest returns in the market.",
+    "Coverage includes critical illness and accidental riders.",
+]
+
+BASE_DATE = datetime(2024, 11, 15, 9, 0, 0)
+
+SCALES = {"1k": 1_000, "10k": 10_000, "100k": 100_000, "1m": 1_000_000}
+
+
+def parse_scale(value: str) -> int:
+    """Parse '10k', '1m' or a plain integer"""
+    value = value.strip().lower()
+    if value in SCALES:
+        return SCALES[value]
+    if value.endswith('k'):
+        return int(float(value[:-1]) * 1_000)
+    if value.endswith('m'):
+        return int(float(value[:-1]) * 1_000_000)
+    return int(value)
+
+
+def scale_label(n: int) -> str:
+    """Human readable scale label (1000 -> '1k')"""
+    if n >= 1_000_000 and n % 1_000_000 == 0:
+        return f"{n // 1_000_000}m"
+    if n >= 1_000 and n % 1_000 == 0:
+        return f"{n // 1_000}k"
+    return str(n)
+
+
+def _iso(rng: random.Random, days_back: int = 90) -> str:
+    return (BASE_DATE - timedelta(minutes=rng.randint(0, days_back * 24 * 60))).isoformat() + "Z"
+
+
+def generate_leads(n: int, seed: int = 42) -> List[Dict]:
+    """Generate n leads"""
+    rng = random.Random(seed)
+    leads = []
+    for i in range(1, n + 1):
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        location, lat, lng = rng.choice(LOCATIONS)
+        lead = {
+            "id": f"lead-{i}",
+            "name": f"{first} {last}",
+            "age": rng.randint(22, 65),
+            "email": f"{first.lower()}.{last.lower()}{i}@example.com",
+            "phone": f"+91-9{rng.randint(100000000, 999999999)}",
+            "location": location,
+            "address": f"{rng.randint(1, 999)} MG Road, {location.split(',')[0]}",
+            "temperature": rng.choice(TEMPERATURES),
+            "tags": rng.sample(TAGS, rng.randint(0, 3)),
+            "productInterest": rng.sample(PRODUCTS, rng.randint(1, 3)),
+            "premium": rng.randrange(5000, 200000, 500),
+            "conversionProbability": rng.randint(0, 100),
+            "lastInteractionSummary": rng.choice(SUMMARIES),
+            "lastInteractionDate": _iso(rng),
+            "assignedTo": f"user-{rng.randint(1, 20)}",
+            "lat": round(lat + rng.uniform(-0.2, 0.2), 4),
+            "lng": round(lng + rng.uniform(-0.2, 0.2), 4),
+        }
+        if rng.random() < 0.3:
+            lead["policyNumber"] = f"LIC{rng.randint(100000000, 999999999)}"
+        leads.append(lead)
+    return leads
+
+
+def generate_interactions(n: int, num_leads: int, seed: int = 43) -> List[Dict]:
+    """Generate n interactions spread over num_leads leads"""
+    rng = random.Random(seed)
+    return [
+        {
+            "id": f"int-{i}",
+            "leadId": f"lead-{rng.randint(1, max(num_leads, 1))}",
+            "userId": f"user-{rng.randint(1, 20)}",
+            "type": rng.choice(INTERACTION_TYPES),
+            "summary": rng.choice(SUMMARIES),
+            "content": rng.choice(MESSAGE_SNIPPETS),
+            "sentiment": round(rng.random(), 2),
+            "duration": rng.randint(60, 1200) if rng.random() < 0.4 else None,
+            "createdAt": _iso(rng),
+        }
+        for i in range(1, n + 1)
+    ]
+
+
+def generate_tasks(n: int, num_leads: int, seed: int = 44) -> List[Dict]:
+    """Generate n tasks"""
+    rng = random.Random(seed)
+    tasks = []
+    for i in range(1, n + 1):
+        lead_num = rng.randint(1, max(num_leads, 1))
+        due = BASE_DATE + timedelta(days=rng.randint(-10, 20))
+        tasks.append({
+            "id": f"task-{i}",
+            "title": f"Follow-up call #{i}",
+            "description": rng.choice(SUMMARIES),
+            "leadId": f"lead-{lead_num}",
+            "leadName": f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+            "priority": rng.choice(TASK_PRIORITIES),
+            "status": rng.choice(TASK_STATUSES),
+            "dueDate": due.strftime("%Y-%m-%d"),
+            "assignedTo": f"user-{rng.randint(1, 20)}",
+            "createdAt": _iso(rng),
+            "tags": rng.sample(TAGS, rng.randint(0, 2)),
+        })
+    return tasks
+
+
+def generate_audit_logs(n: int, num_leads: int, seed: int = 45) -> List[Dict]:
+    """Generate n audit log entries"""
+    rng = random.Random(seed)
+    return [
+        {
+            "id": f"audit-{i}",
+            "userId": f"user-{rng.randint(1, 20)}",
+            "actionType": rng.choice(AUDIT_ACTIONS),
+            "entityType": "lead",
+            "entityId": f"lead-{rng.randint(1, max(num_leads, 1))}",
+            "changes": {"temperature": rng.choice(TEMPERATURES)},
+            "source": rng.choice(["autopilot", "user"]),
+            "aiConfidence": rng.randint(40, 99),
+            "aiReasoning": rng.choice(SUMMARIES),
+            "userDecision": rng.choice(["applied", "rejected", "pending"]),
+            "complianceStatus": rng.choice(["safe", "warning"]),
+            "createdAt": _iso(rng),
+        }
+        for i in range(1, n + 1)
+    ]
+
+
+def generate_templates(n: int, seed: int = 46) -> List[Dict]:
+    """Generate n message templates"""
+    rng = random.Random(seed)
+    return [
+        {
+            "id": f"tmpl-{i}",
+            "name": f"{rng.choice(TEMPLATE_CATEGORIES)} Template {i}",
+            "category": rng.choice(TEMPLATE_CATEGORIES),
+            "content": "Hi {{name}}, " + rng.choice(MESSAGE_SNIPPETS) + " Reply YES to know more.",
+            "channel": rng.choice(["whatsapp", "email", "sms"]),
+            "dynamicFields": ["name"],
+            "isApproved": rng.random() < 0.9,
+        }
+        for i in range(1, n + 1)
+    ]
+
+
+def generate_message_text(n_words: int, seed: int = 47) -> str:
+    """Generate a marketing text of roughly n_words words for compliance checks"""
+    rng = random.Random(seed)
+    words, parts = 0, []
+    while words < n_words:
+        snippet = rng.choice(MESSAGE_SNIPPETS)
+        parts.append(snippet)
+        words += len(snippet.split())
+    return " ".join(parts)
+
+
+def generate_dataset(n: int, seed: int = 42) -> Dict[str, List[Dict]]:
+    """Generate every dataset with n records each"""
+    return {
+        "leads": generate_leads(n, seed),
+        "interactions": generate_interactions(n, n, seed + 1),
+        "tasks": generate_tasks(n, n, seed + 2),
+        "auditLog": generate_audit_logs(n, n, seed + 3),
+        "templates": generate_templates(n, seed + 4),
+    }
+
+
+def write_dataset(dataset: Dict[str, List[Dict]], out_dir: str) -> Dict[str, str]:
+    """
+    Write a dataset as <name>.json files
+
+    Returns:
+        Mapping of dataset name to file path
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    paths = {}
+    for name, records in dataset.items():
+        path = os.path.join(out_dir, f"{name}.json")
+        with open(path, 'w') as f:
+            json.dump(records, f)
+        paths[name] = path
+    return paths
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate seeded synthetic mock data")
+    parser.add_argument("--scale", default="1k", help="Records per dataset (1k, 10k, 100k, 1m or an integer)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--out", required=True, help="Output directory")
+    args = parser.parse_args()
+
+    n = parse_scale(args.scale)
+    paths = write_dataset(generate_dataset(n, args.seed), args.out)
+    for name, path in paths.items():
+        print(f"✅ {name}: {n:,} records -> {path}")
+
+
+if __name__ == "__main__":
+    main()
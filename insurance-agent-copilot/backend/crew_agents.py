@@ -0,0 +1,743 @@
+"""
+Insurance Agent Copilot - CrewAI Agents
+CrewAI tools (generated from the tool registry), the supervisor and specialist agents,
+task factories and crew routing. Imported lazily by crewai_main.py during background
+warm-up, so the CrewAI import and agent construction stay off the startup path.
+"""
+
+import os
+import re
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple, Union
+from crewai import Agent, Task, Crew, Process
+
+from llm_provider import create_chat_model, create_crew_llm
+from crew_templates import CrewTemplateRegistry, BoundCrew, ParallelCrew
+import tool_catalog  # Registers the tools
+from tool_registry import registry
+from intent_classifier import classify_local, INTENT_CONFIDENCE_THRESHOLD, DIRECT_DISPATCH_CONFIDENCE
+
+GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
+INTENT_CACHE_SIZE = int(os.getenv("INTENT_CACHE_SIZE", "1024"))
+DIRECT_DISPATCH_ENABLED = os.getenv("DIRECT_DISPATCH_ENABLED", "true").lower() == "true"
+# Direct dispatch has no manager to catch a misclassified message, and the local classifier
+# alone misroutes ~10% even at high confidence; by default the LLM classification (one short,
+# cached call) must agree with it
+DIRECT_DISPATCH_VERIFY = os.getenv("DIRECT_DISPATCH_VERIFY", "true").lower() == "true"
+PARALLEL_TASKS_ENABLED = os.getenv("PARALLEL_TASKS_ENABLED", "true").lower() == "true"
+
+# Initialize LLM (Gemini, or the scripted fake model when LLM_PROVIDER=fake)
+llm = create_chat_model(
+    "gemini-1.5-flash",
+    temperature=0.1,
+    google_api_key=GEMINI_API_KEY,
+    convert_system_message_to_human=True
+)
+crew_llm = create_crew_llm(llm)
+
+# ================================
+# CrewAI Tools
+# ================================
+
+# The data tools are generated from the shared tool registry (see tool_catalog.py);
+# crew_tool() returns a new instance per agent
+crew_tool = registry.crew_tool
+
+# ================================
+# CrewAI Agents
+# ================================
+
+# Root Agent - Main Orchestrator
+root_agent = Agent(
+    role='Insurance Agent Supervisor',
+    goal='Act as the main point of contact for users, understand their needs, and delegate tasks to specialized agents to provide comprehensive insurance support',
+    backstory="""You are the primary AI assistant for insurance agents - a knowledgeable supervisor who understands 
+    the entire insurance workflow. You have a team of specialized agents under your supervision, each expert in their domain. 
+    Your role is to understand user requests, break them down into actionable tasks, and delegate to the right specialists. 
+    You coordinate responses and ensure users get comprehensive, accurate assistance. You're the friendly face of the system 
+    who makes complex insurance operations feel simple and intuitive.""",
+    verbose=True,
+    allow_delegation=True,  # Key: This agent can delegate to others
+    llm=crew_llm,
+    tools=[]  # CrewAI managers can't carry tools; the crew gives it the delegation tools
+)
+
+# Lead Manager Agent
+lead_manager = Agent(
+    role='Lead Manager',
+    goal='Efficiently manage and organize lead information, track lead progression, and identify high-value opportunities',
+    backstory="""You are an experienced lead management specialist with deep knowledge of insurance sales processes. 
+    You excel at organizing lead data, tracking customer journeys, and identifying the most promising opportunities. 
+    You understand lead scoring, temperature classification, and conversion optimization. You report to the Insurance Agent Supervisor.""",
+    verbose=True,
+    allow_delegation=False,
+    llm=crew_llm,
+    tools=[
+        crew_tool("Lead Search Tool"), crew_tool("Lead Management Tool"), crew_tool("Interaction Tool"),
+        crew_tool("UI Action Tool"), crew_tool("Policy Tool"), crew_tool("Formatting Tool")
+    ]
+)
+
+# Communication Specialist Agent
+communicator = Agent(
+    role='Communication Specialist',
+    goal='Handle all customer communications professionally and effectively, ensuring IRDAI compliance',
+    backstory="""You are a skilled communication expert specializing in insurance industry interactions. 
+    You craft compelling, compliant messages that build trust and drive engagement. You understand the nuances 
+    of different communication channels (WhatsApp, SMS, Email) and tailor messages accordingly. You work under 
+    the Insurance Agent Supervisor's guidance.""",
+    verbose=True,
+    allow_delegation=False,
+    llm=crew_llm,
+    tools=[
+        crew_tool("Communication Tool"), crew_tool("IRDAI Compliance Tool"), crew_tool("Notification Tool"),
+        crew_tool("Formatting Tool")
+    ]
+)
+
+# Task Coordinator Agent
+task_coordinator = Agent(
+    role='Task Coordinator',
+    goal='Organize and prioritize tasks, manage deadlines, and ensure nothing falls through the cracks',
+    backstory="""You are a meticulous task management expert who ensures optimal workflow efficiency. 
+    You excel at prioritizing activities, managing deadlines, and coordinating follow-up actions. 
+    You understand the importance of timely follow-ups in insurance sales. You coordinate with the 
+    Insurance Agent Supervisor to ensure all tasks align with business priorities.""",
+    verbose=True,
+    allow_delegation=False,
+    llm=crew_llm,
+    tools=[
+        crew_tool("Task Management Tool"), crew_tool("Notification Tool"), crew_tool("UI Action Tool"),
+        crew_tool("Formatting Tool")
+    ]
+)
+
+# Analytics Expert Agent
+analyst = Agent(
+    role='Analytics Expert',
+    goal='Provide data-driven insights, forecasts, and recommendations to optimize performance',
+    backstory="""You are a data analytics specialist with expertise in insurance sales metrics. 
+    You transform raw data into actionable insights, identify trends, and provide strategic recommendations. 
+    You understand conversion funnels, revenue forecasting, and performance optimization. You provide 
+    strategic insights to the Insurance Agent Supervisor for decision-making.""",
+    verbose=True,
+    allow_delegation=False,
+    llm=crew_llm,
+    tools=[crew_tool("Analytics Tool"), crew_tool("Audit Tool"), crew_tool("Formatting Tool")]
+)
+
+# Compliance Officer Agent
+compliance_officer = Agent(
+    role='Compliance Officer',
+    goal='Ensure all communications and actions comply with IRDAI regulations and industry standards',
+    backstory="""You are a compliance expert with deep knowledge of IRDAI regulations and insurance industry standards. 
+    You review all communications for compliance issues, suggest safe alternatives, and ensure regulatory adherence. 
+    You prioritize customer protection and regulatory compliance above all else. You work closely with the 
+    Insurance Agent Supervisor to maintain the highest compliance standards.""",
+    verbose=True,
+    allow_delegation=False,
+    llm=crew_llm,
+    tools=[crew_tool("IRDAI Compliance Tool"), crew_tool("Audit Tool"), crew_tool("Formatting Tool")]
+)
+
+# Text Analysis Agent
+text_analysis_agent = Agent(
+    role='Text Analysis Specialist',
+    goal='Generate personalized messages, analyze lead profiles, update interactions, ensure IRDAI compliance, and improve lead scoring based on interactions',
+    backstory="""You are an advanced text analysis and communication specialist with expertise in insurance industry communications. 
+    You excel at generating personalized WhatsApp messages, emails, and call scripts based on lead profiles and context. 
+    You can analyze lead information to provide comprehensive insights, update interaction summaries, ensure IRDAI compliance, 
+    and improve lead scoring based on new interactions. You understand the nuances of different communication channels and 
+    can adapt your analysis and generation accordingly. You work under the Insurance Agent Supervisor's guidance to provide 
+    contextual, compliant, and effective communication solutions.""",
+    verbose=True,
+    allow_delegation=False,
+    llm=crew_llm,
+    tools=[
+        crew_tool("Lead Search Tool"), crew_tool("IRDAI Compliance Tool"), crew_tool("Interaction Tool"),
+        crew_tool("Communication Tool"), crew_tool("Formatting Tool")
+    ]
+)
+
+# ================================
+# Root Agent Task Creation
+# ================================
+
+def create_root_orchestration_task(user_message: str) -> Task:
+    """Create the main orchestration task for the root agent"""
+    return Task(
+        description=f"""
+        Process user request: "{user_message}"
+        
+        As Insurance Agent Supervisor:
+        1. Analyze user intent
+        2. Delegate to appropriate specialists
+        3. Coordinate team responses
+        4. Provide comprehensive answer
+        
+        Keep response professional and helpful.
+        """,
+        agent=root_agent,
+        expected_output="Clear, comprehensive response addressing user's needs"
+    )
+
+def create_merge_task(user_message: str, findings: str) -> Task:
+    """Create the root agent task that combines independently produced specialist findings"""
+    return Task(
+        description=f"""
+        Combine the specialist findings into one answer for the user request: "{user_message}"
+        
+        Specialist findings:
+        {findings}
+        
+        As Insurance Agent Supervisor:
+        1. Merge the findings into a single, consistent response
+        2. Keep every compliance warning and safe alternative
+        3. Do not repeat information
+        
+        Keep response professional and helpful.
+        """,
+        agent=root_agent,
+        expected_output="Clear, comprehensive response addressing user's needs"
+    )
+
+# ================================
+# Specialized Agent Task Functions
+# ================================
+
+def create_lead_management_task(user_message: str) -> Task:
+    """Create a task for lead-related queries"""
+    return Task(
+        description=f"""
+        Process this lead-related request: "{user_message}"
+        
+        Analyze the request and:
+        1. Determine what lead information is needed
+        2. Search or retrieve the appropriate lead data
+        3. If it's an update request, modify the lead information
+        4. If it's a creation request, gather required details
+        5. Format the response in a user-friendly manner
+        
+        Provide clear, actionable information about the leads.
+        """,
+        agent=lead_manager,
+        expected_output="Formatted lead information or confirmation of lead management action"
+    )
+
+def create_communication_task(user_message: str) -> Task:
+    """Create a task for communication-related queries"""
+    return Task(
+        description=f"""
+        Handle this communication request: "{user_message}"
+        
+        Process the request by:
+        1. Identifying the communication type (WhatsApp, SMS, Email, Call)
+        2. Determining the target lead/customer
+        3. Crafting appropriate, compliant messaging
+        4. Ensuring IRDAI compliance for all communications
+        5. Executing or preparing the communication action
+        
+        Always check compliance before finalizing any message.
+        """,
+        agent=communicator,
+        expected_output="Communication action result or compliant message draft"
+    )
+
+def create_task_management_task(user_message: str) -> Task:
+    """Create a task for task-related queries"""
+    return Task(
+        description=f"""
+        Manage this task-related request: "{user_message}"
+        
+        Handle the request by:
+        1. Understanding the task management need
+        2. Retrieving relevant task information
+        3. Creating, updating, or organizing tasks as needed
+        4. Prioritizing tasks based on urgency and importance
+        5. Providing clear task status and next actions
+        
+        Focus on actionable task management outcomes.
+        """,
+        agent=task_coordinator,
+        expected_output="Task management result with clear next actions"
+    )
+
+def create_analytics_task(user_message: str) -> Task:
+    """Create a task for analytics and insights"""
+    return Task(
+        description=f"""
+        Provide analytics for this request: "{user_message}"
+        
+        Generate insights by:
+        1. Identifying the type of analytics needed
+        2. Gathering relevant data and metrics
+        3. Analyzing trends and patterns
+        4. Providing actionable recommendations
+        5. Formatting insights in an easy-to-understand manner
+        
+        Focus on data-driven insights that drive business decisions.
+        """,
+        agent=analyst,
+        expected_output="Analytics insights with actionable recommendations"
+    )
+
+def create_compliance_task(user_message: str) -> Task:
+    """Create a task for compliance checking"""
+    return Task(
+        description=f"""
+        Review this content for compliance: "{user_message}"
+        
+        Perform compliance review by:
+        1. Analyzing the content for IRDAI violations
+        2. Identifying risky phrases or claims
+        3. Providing safe alternatives where needed
+        4. Ensuring regulatory adherence
+        5. Offering compliant messaging suggestions
+        
+        Prioritize customer protection and regulatory compliance.
+        """,
+        agent=compliance_officer,
+        expected_output="Compliance assessment with safe alternatives if needed"
+    )
+
+def create_text_analysis_task(user_message: str, action_type: str = None, lead_info: str = None) -> Task:
+    """Create a task for text analysis and message generation"""
+    return Task(
+        description=f"""
+        Process this text analysis request: "{user_message}"
+        Action Type: {action_type or 'general'}
+        Lead Information: {lead_info or 'Not provided'}
+        
+        Based on the action type, perform the appropriate analysis:
+        
+        If action is 'whatsapp':
+        1. Analyze the lead profile and context
+        2. Generate a personalized WhatsApp message
+        3. Ensure IRDAI compliance
+        4. Include relevant product recommendations
+        5. Use appropriate tone and timing
+        
+        If action is 'email':
+        1. Analyze the lead profile and context
+        2. Generate a professional email with subject line
+        3. Include detailed product information
+        4. Ensure IRDAI compliance and disclaimers
+        5. Structure with proper email format
+        
+        If action is 'call':
+        1. Analyze the lead profile and context
+        2. Generate a call script with key talking points
+        3. Include objection handling suggestions
+        4. Provide next best action recommendations
+        5. Ensure compliance in verbal communication
+        
+        If action is 'analyze':
+        1. Provide comprehensive lead analysis
+        2. Highlight key insights and opportunities
+        3. Suggest improvement strategies
+        4. Identify risk factors and mitigation
+        5. Recommend next best actions
+        
+        For interaction updates:
+        1. Summarize the interaction professionally
+        2. Update lead scoring based on interaction
+        3. Identify sentiment changes
+        4. Recommend follow-up actions
+        5. Ensure compliance in documentation
+        
+        Always ensure IRDAI compliance and provide actionable insights.
+        """,
+        agent=text_analysis_agent,
+        expected_output="Personalized, compliant communication or comprehensive lead analysis based on action type"
+    )
+
+# ================================
+# Root Agent Orchestration
+# ================================
+
+VALID_INTENTS = ['lead_management', 'communication', 'task_management', 'analytics', 'compliance', 'policy_management', 'text_analysis']
+
+# LRU cache: normalized message -> intent
+_intent_cache: "OrderedDict[str, str]" = OrderedDict()
+_intent_cache_lock = threading.Lock()
+_intent_cache_stats = {"hits": 0, "misses": 0}
+
+def normalize_message(user_message: str) -> str:
+    """Normalize a message for intent caching (case, whitespace, surrounding punctuation)"""
+    return re.sub(r'\s+', ' ', user_message.lower()).strip(' \t\n.,!?;:\'"')
+
+def _cached_intent(key: str) -> Optional[str]:
+    with _intent_cache_lock:
+        intent = _intent_cache.get(key)
+        if intent is None:
+            _intent_cache_stats["misses"] += 1
+            return None
+        _intent_cache.move_to_end(key)
+        _intent_cache_stats["hits"] += 1
+        return intent
+
+def _store_intent(key: str, intent: str):
+    if INTENT_CACHE_SIZE <= 0:
+        return
+    with _intent_cache_lock:
+        _intent_cache[key] = intent
+        _intent_cache.move_to_end(key)
+        while len(_intent_cache) > INTENT_CACHE_SIZE:
+            _intent_cache.popitem(last=False)
+
+def intent_cache_info() -> Dict:
+    """Intent cache size and hit/miss counters"""
+    with _intent_cache_lock:
+        return {"size": len(_intent_cache), "max_size": INTENT_CACHE_SIZE, **_intent_cache_stats}
+
+def _classification_prompt(user_message: str) -> str:
+    return f"""
+    Classify this insurance agent query into ONE primary category:
+    
+    Query: "{user_message}"
+    
+    Categories:
+    1. lead_management - Finding, creating, updating leads, customer info
+    2. communication - Sending messages, calls, scheduling meetings
+    3. task_management - Tasks, deadlines, follow-ups, reminders
+    4. analytics - Reports, summaries, insights, performance metrics
+    5. compliance - IRDAI validation, safety checks, regulatory
+    6. policy_management - Policy operations, documents, renewals
+    7. text_analysis - Message generation, lead analysis, interaction updates, scoring improvements
+    
+    Return ONLY the category name (e.g., "lead_management").
+    """
+
+def _llm_intent(content: str) -> Optional[str]:
+    intent = content.strip().lower()
+    return intent if intent in VALID_INTENTS else None
+
+def _llm_classify(user_message: str) -> Tuple[Optional[str], str]:
+    """LLM intent through the intent cache; returns (intent or None, "cache" or "llm")"""
+    key = normalize_message(user_message)
+    cached = _cached_intent(key)
+    if cached:
+        return cached, "cache"
+    
+    try:
+        response = llm.invoke(_classification_prompt(user_message))
+        intent = _llm_intent(response.content)
+    except Exception as e:
+        print(f"❌ Intent classification error: {e}")
+        intent = None
+    
+    if intent:
+        _store_intent(key, intent)
+    return intent, "llm"
+
+async def _allm_classify(user_message: str) -> Tuple[Optional[str], str]:
+    """Async _llm_classify"""
+    key = normalize_message(user_message)
+    cached = _cached_intent(key)
+    if cached:
+        return cached, "cache"
+    
+    try:
+        response = await llm.ainvoke(_classification_prompt(user_message))
+        intent = _llm_intent(response.content)
+    except Exception as e:
+        print(f"❌ Intent classification error: {e}")
+        intent = None
+    
+    if intent:
+        _store_intent(key, intent)
+    return intent, "llm"
+
+def _needs_verification(confidence: float) -> bool:
+    """A local result confident enough for direct dispatch, which the LLM must confirm first"""
+    return DIRECT_DISPATCH_ENABLED and DIRECT_DISPATCH_VERIFY and confidence >= DIRECT_DISPATCH_CONFIDENCE
+
+def classify_intent_details(user_message: str) -> Dict:
+    """
+    Classify user intent: local classifier first, LLM only below INTENT_CONFIDENCE_THRESHOLD
+    (or, with DIRECT_DISPATCH_VERIFY, to confirm a result confident enough for direct dispatch)
+    
+    Returns:
+        {"intent", "confidence", "source"} where source is local, cache, llm or local_fallback,
+        plus "verified" (the LLM agreed) and "verify_source" (cache or llm) when direct
+        dispatch needed confirming
+    """
+    label, confidence = classify_local(user_message)
+    if confidence >= INTENT_CONFIDENCE_THRESHOLD:
+        details = {"intent": label, "confidence": confidence, "source": "local"}
+        if _needs_verification(confidence):
+            intent, details["verify_source"] = _llm_classify(user_message)
+            details["verified"] = intent == label
+        return details
+    
+    intent, source = _llm_classify(user_message)
+    if intent:
+        return {"intent": intent, "confidence": confidence, "source": source}
+    # LLM failed or returned an unknown label: the local guess beats a fixed default
+    return {"intent": label, "confidence": confidence, "source": "local_fallback"}
+
+async def aclassify_intent_details(user_message: str) -> Dict:
+    """Async classify_intent_details - doesn't block the event loop on the LLM call"""
+    label, confidence = classify_local(user_message)
+    if confidence >= INTENT_CONFIDENCE_THRESHOLD:
+        details = {"intent": label, "confidence": confidence, "source": "local"}
+        if _needs_verification(confidence):
+            intent, details["verify_source"] = await _allm_classify(user_message)
+            details["verified"] = intent == label
+        return details
+    
+    intent, source = await _allm_classify(user_message)
+    if intent:
+        return {"intent": intent, "confidence": confidence, "source": source}
+    return {"intent": label, "confidence": confidence, "source": "local_fallback"}
+
+def classify_intent(user_message: str) -> str:
+    """Classify user intent (see classify_intent_details)"""
+    return classify_intent_details(user_message)["intent"]
+
+async def aclassify_intent(user_message: str) -> str:
+    """Async classify_intent"""
+    return (await aclassify_intent_details(user_message))["intent"]
+
+def verification_llm_calls(classification: Dict) -> int:
+    """LLM calls spent confirming a direct dispatch (0 when not needed or answered from the cache)"""
+    return 1 if classification.get("verify_source") == "llm" else 0
+
+# ================================
+# Crew Templates (built once, parametrized per request)
+# ================================
+
+SPECIALIST_AGENTS = [lead_manager, communicator, task_coordinator, analyst, compliance_officer, text_analysis_agent]
+
+# Supporting task per intent
+INTENT_TASKS = {
+    'lead_management': create_lead_management_task,
+    'communication': create_communication_task,
+    'task_management': create_task_management_task,
+    'analytics': create_analytics_task,
+    'compliance': create_compliance_task,
+    'policy_management': create_lead_management_task,  # Reuse for now
+    'text_analysis': create_text_analysis_task,
+}
+
+FALLBACK_TEMPLATE = 'fallback'
+TEXT_ANALYSIS_TEMPLATE = 'text_analysis_endpoint'
+MERGE_TEMPLATE = 'merge'
+DIRECT_PREFIX = 'direct:'
+
+# Multi-task template -> intents of its supporting tasks, when those tasks are independent
+# (filled in by build_crew_templates)
+PARALLEL_TEMPLATES: Dict[str, List[str]] = {}
+
+# Manager LLM calls a hierarchical run adds at minimum (delegate, then review the answer);
+# used for llm_calls_saved until the hierarchical template has measured runs
+MIN_MANAGER_LLM_CALLS = 2
+
+def _copy_agents(agents: list) -> Dict:
+    """Per-crew agent copies, so pooled crews can run concurrently without sharing executor state"""
+    return {id(agent): agent.copy() for agent in agents}
+
+def _build_hierarchical_crew(task_factories: list) -> Crew:
+    """Hierarchical crew with {user_message} placeholders and the supervisor as manager"""
+    copies = _copy_agents(SPECIALIST_AGENTS)
+    manager = root_agent.copy()
+    manager.tools = []
+
+    tasks = [create_root_orchestration_task("{user_message}")]
+    for factory in task_factories:
+        task = factory("{user_message}")
+        task.agent = copies[id(task.agent)]
+        tasks.append(task)
+    tasks[0].agent = manager
+
+    return Crew(
+        agents=list(copies.values()),
+        tasks=tasks,
+        process=Process.hierarchical,  # Hierarchical process with manager
+        manager_agent=manager,  # Use root agent as manager instead of LLM
+        verbose=True
+    )
+
+def _build_merge_crew() -> Crew:
+    """Root agent alone, combining parallel branch outputs ({findings}); no delegation or tools"""
+    task = create_merge_task("{user_message}", "{findings}")
+    task.agent = root_agent.copy()
+    task.agent.tools = []
+    task.agent.allow_delegation = False
+    return Crew(
+        agents=[task.agent],
+        tasks=[task],
+        process=Process.sequential,
+        verbose=True
+    )
+
+def _build_sequential_crew(task: Task) -> Crew:
+    """Single-agent crew; the task is rebound to a private copy of its agent"""
+    task.agent = task.agent.copy()
+    return Crew(
+        agents=[task.agent],
+        tasks=[task],
+        process=Process.sequential,
+        verbose=True
+    )
+
+def _independent(task_factories: list) -> bool:
+    """True when none of the tasks reads another task's output (no Task.context)"""
+    for factory in task_factories:
+        context = factory("{user_message}").context
+        if isinstance(context, list) and context:
+            return False
+    return True
+
+def build_crew_templates() -> CrewTemplateRegistry:
+    """
+    Register one hierarchical template per intent, a "+compliance" variant for long
+    messages that also need a compliance review, a "direct:" single-specialist template
+    per intent, the merge crew, the fallback crew and the text analysis crew.
+    Crews are built lazily (or by prebuild() during warm-up).
+    """
+    registry = CrewTemplateRegistry()
+    for intent, factory in INTENT_TASKS.items():
+        registry.register(intent, lambda factory=factory: _build_hierarchical_crew([factory]), process="hierarchical")
+        if intent != 'compliance':
+            name = f"{intent}+compliance"
+            registry.register(
+                name,
+                lambda factory=factory: _build_hierarchical_crew([factory, create_compliance_task]),
+                process="hierarchical"
+            )
+            if _independent([factory, create_compliance_task]):
+                PARALLEL_TEMPLATES[name] = [intent, 'compliance']
+        registry.register(
+            f"{DIRECT_PREFIX}{intent}",
+            lambda factory=factory: _build_sequential_crew(factory("{user_message}")),
+            process="direct"
+        )
+    registry.register(MERGE_TEMPLATE, lambda: _build_merge_crew())
+    registry.register(FALLBACK_TEMPLATE, lambda: _build_sequential_crew(
+        Task(
+            description="Handle user request: {user_message}",
+            agent=lead_manager,
+            expected_output="Basic response to user query"
+        )
+    ))
+    registry.register(TEXT_ANALYSIS_TEMPLATE, lambda: _build_sequential_crew(
+        create_text_analysis_task("{user_message}", "{action_type}", "{lead_info}")
+    ))
+    return registry
+
+crew_templates = build_crew_templates()
+
+def select_template(user_message: str, primary_intent: str, confidence: float = None, verified: bool = False) -> str:
+    """
+    Template name for a message and its classified intent
+    
+    Args:
+        user_message: User request
+        primary_intent: Classified intent
+        confidence: Classifier confidence; at or above DIRECT_DISPATCH_CONFIDENCE a message
+            with a single supporting task goes straight to the specialist (no manager)
+        verified: The LLM classification agreed (required when DIRECT_DISPATCH_VERIFY is on)
+    """
+    if primary_intent not in INTENT_TASKS:
+        primary_intent = 'lead_management'  # Default fallback
+
+    # For complex queries, add a compliance review if needed
+    message_lower = user_message.lower()
+    if len(user_message.split()) > 10 and primary_intent != 'compliance':  # Complex query heuristic
+        if 'compliant' in message_lower or 'irdai' in message_lower:
+            return f"{primary_intent}+compliance"
+
+    if (DIRECT_DISPATCH_ENABLED and confidence is not None and confidence >= DIRECT_DISPATCH_CONFIDENCE
+            and (verified or not DIRECT_DISPATCH_VERIFY)):
+        return f"{DIRECT_PREFIX}{primary_intent}"
+    return primary_intent
+
+def bind_template(name: str, user_message: str) -> Union[BoundCrew, ParallelCrew]:
+    """
+    Bind a request to a template; multi-task templates with independent supporting tasks
+    run those tasks as concurrent direct crews and merge them with the root agent instead
+    """
+    if PARALLEL_TASKS_ENABLED and name in PARALLEL_TEMPLATES:
+        return ParallelCrew(
+            name,
+            {
+                intent: crew_templates.get(f"{DIRECT_PREFIX}{intent}").bind(user_message=user_message)
+                for intent in PARALLEL_TEMPLATES[name]
+            },
+            crew_templates.get(MERGE_TEMPLATE),
+            {"user_message": user_message}
+        )
+    return crew_templates.get(name).bind(user_message=user_message)
+
+def create_hierarchical_crew(user_message: str, primary_intent: str = None) -> Union[BoundCrew, ParallelCrew]:
+    """
+    Bind a request to the pre-built hierarchical crew for its intent (root agent as manager)
+    
+    Args:
+        user_message: User request
+        primary_intent: Intent already classified by the caller (classified here if omitted)
+    
+    Returns:
+        Crew-like object whose kickoff() runs a pooled crew with this message
+    """
+    if primary_intent is None:
+        primary_intent = classify_intent(user_message)
+    return bind_template(select_template(user_message, primary_intent), user_message)
+
+def route_request(user_message: str, intent: str = None, confidence: float = None,
+                  verified: bool = False) -> Union[BoundCrew, ParallelCrew]:
+    """
+    Route a user request: confident single-intent messages go directly to the specialist,
+    everything else through the root agent orchestration
+    
+    Args:
+        user_message: User request
+        intent: Pre-classified intent (classified here if omitted)
+        confidence: Classifier confidence for intent
+        verified: The LLM confirmed intent (classification "verified")
+    """
+    try:
+        # Validate input
+        if not user_message or len(user_message.strip()) == 0:
+            raise ValueError("Empty message provided")
+        
+        if len(user_message) > 5000:  # Reasonable limit
+            user_message = user_message[:5000] + "..."
+        
+        if intent is None:
+            classification = classify_intent_details(user_message)
+            intent, confidence = classification["intent"], classification["confidence"]
+            verified = classification.get("verified", False)
+        return bind_template(select_template(user_message, intent, confidence, verified), user_message)
+    except Exception as e:
+        print(f"❌ Routing error: {e}")
+        # Simple fallback crew
+        return crew_templates.get(FALLBACK_TEMPLATE).bind(user_message=user_message or "")
+
+def llm_calls_saved(crew: Union[BoundCrew, ParallelCrew], verification_calls: int = 0) -> int:
+    """
+    LLM calls a finished direct or parallel run saved compared with the hierarchical crew
+    it replaced (its measured average; before that has run, MIN_MANAGER_LLM_CALLS for
+    direct dispatch and 0 for parallel runs, which add a merge call)
+    
+    Args:
+        crew: The finished run
+        verification_calls: LLM calls made to confirm the routing (verification_llm_calls)
+    """
+    if crew.process not in ('direct', 'parallel') or crew.llm_calls is None:
+        return 0
+    name = crew.name[len(DIRECT_PREFIX):] if crew.process == 'direct' else crew.name
+    hierarchical = crew_templates.get(name).stats()["avg_llm_calls"]
+    if hierarchical is None:
+        hierarchical = crew.llm_calls + (MIN_MANAGER_LLM_CALLS if crew.process == 'direct' else 0)
+    return max(0, round(hierarchical - crew.llm_calls - verification_calls))
+
+def create_text_analysis_crew(user_message: str, action_type: str = None, lead_info: str = None) -> BoundCrew:
+    """Bind a request to the pre-built single-agent text analysis crew"""
+    return crew_templates.get(TEXT_ANALYSIS_TEMPLATE).bind(
+        user_message=user_message,
+        action_type=action_type or 'general',
+        lead_info=lead_info or 'Not provided'
+    )
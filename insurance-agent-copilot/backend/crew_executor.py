@@ -0,0 +1,142 @@
+"""
+Crew Executor
+One application-wide, bounded thread pool for CrewAI kickoffs (crews run synchronously).
+Tracks queue depth, queue wait and run time, enforces a per-crew timeout and cancels
+crews whose request timed out or was cancelled: queued crews never start, running
+template crews stop after their current agent step.
+"""
+
+import asyncio
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable
+
+from crew_templates import BoundCrew, CrewCancelledError, ParallelCrew
+
+CREW_MAX_WORKERS = int(os.getenv("CREW_MAX_WORKERS", "4"))
+CREW_TIMEOUT_SECONDS = float(os.getenv("CREW_TIMEOUT_SECONDS", "120"))
+
+
+class CrewTimeoutError(TimeoutError):
+    """Crew did not finish within its timeout"""
+
+
+def _summarize(samples: Iterable[float]) -> Dict:
+    ordered = sorted(samples)
+    if not ordered:
+        return {"count": 0, "avg": None, "p50": None, "p95": None, "max": None}
+    return {
+        "count": len(ordered),
+        "avg": round(sum(ordered) / len(ordered), 1),
+        "p50": round(ordered[len(ordered) // 2], 1),
+        "p95": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 1),
+        "max": round(ordered[-1], 1),
+    }
+
+
+class CrewExecutor:
+    """Bounded executor for crew kickoffs with queue metrics, timeouts and cancellation"""
+
+    def __init__(self, max_workers: int = CREW_MAX_WORKERS, timeout: float = CREW_TIMEOUT_SECONDS, window: int = 1000):
+        """
+        Args:
+            max_workers: Crews running at the same time; further crews wait in the queue
+            timeout: Default seconds from submission to result (0 disables)
+            window: Recent runs kept for the wait/run time percentiles
+        """
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self._pool = ThreadPoolExecutor(max_workers, thread_name_prefix="crew")
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._running = 0
+        self._counts = {"submitted": 0, "completed": 0, "failed": 0, "timed_out": 0, "cancelled": 0}
+        self._wait_ms = deque(maxlen=window)
+        self._run_ms = deque(maxlen=window)
+
+    def _execute(self, crew, cancel_event: threading.Event, submitted_at: float, listener: Callable[[Dict], None]):
+        started_at = time.perf_counter()
+        with self._lock:
+            self._queued -= 1
+            self._running += 1
+            self._wait_ms.append((started_at - submitted_at) * 1000)
+        try:
+            if cancel_event.is_set():
+                raise CrewCancelledError("Crew cancelled before it started")
+            if isinstance(crew, (BoundCrew, ParallelCrew)):
+                return crew.kickoff(cancel_event, listener)
+            return crew.kickoff()
+        finally:
+            with self._lock:
+                self._running -= 1
+                self._run_ms.append((time.perf_counter() - started_at) * 1000)
+
+    def _abandon(self, future, cancel_event: threading.Event, outcome: str):
+        cancel_event.set()
+        with self._lock:
+            if future.cancel():
+                self._queued -= 1  # Never started
+            self._counts[outcome] += 1
+
+    async def run(self, crew, timeout: float = None, listener: Callable[[Dict], None] = None) -> Any:
+        """
+        Run a Crew or BoundCrew on the shared pool without blocking the event loop
+
+        Args:
+            crew: Object with a kickoff() method
+            timeout: Seconds to wait for the result (default: CREW_TIMEOUT_SECONDS)
+            listener: Receives template crews' execution events, called from the crew thread
+
+        Returns:
+            The crew's result
+
+        Raises:
+            CrewTimeoutError: The crew did not finish in time (it is cancelled)
+        """
+        timeout = self.timeout if timeout is None else timeout
+        cancel_event = threading.Event()
+        with self._lock:
+            self._counts["submitted"] += 1
+            self._queued += 1
+        future = self._pool.submit(self._execute, crew, cancel_event, time.perf_counter(), listener)
+
+        try:
+            result = await asyncio.wait_for(asyncio.wrap_future(future), timeout or None)
+        except asyncio.TimeoutError:
+            self._abandon(future, cancel_event, "timed_out")
+            raise CrewTimeoutError(f"Crew did not finish within {timeout:g}s")
+        except asyncio.CancelledError:
+            # Client disconnected or the request task was cancelled
+            self._abandon(future, cancel_event, "cancelled")
+            raise
+        except Exception:
+            with self._lock:
+                self._counts["failed"] += 1
+            raise
+
+        with self._lock:
+            self._counts["completed"] += 1
+        return result
+
+    def metrics(self) -> Dict:
+        """Queue depth, outcome counts and recent wait/run time percentiles (ms)"""
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "timeout_s": self.timeout,
+                "running": self._running,
+                "queue_depth": self._queued,
+                **self._counts,
+                "wait_ms": _summarize(self._wait_ms),
+                "run_ms": _summarize(self._run_ms),
+            }
+
+    def shutdown(self):
+        """Drop queued crews; running crews finish in the background"""
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+crew_executor = CrewExecutor()
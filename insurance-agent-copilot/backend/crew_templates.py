@@ -0,0 +1,424 @@
+"""
+Crew Templates
+Pre-validated CrewAI crews built once and reused across requests. Task descriptions
+carry placeholders such as {user_message} that CrewAI fills in at kickoff(inputs=...),
+so serving a request checks an idle crew out of a pool instead of constructing and
+validating agents, tasks and a Crew every time. Pooled crews check a cancel flag after
+every agent step, so a run whose request timed out or went away stops early, count the
+LLM calls each run makes and can report model turns, tool calls, task outputs and
+streamed tokens to a per-run listener as they happen. Independent tasks can run as
+concurrent crews whose outputs a merge crew combines (ParallelCrew).
+"""
+
+import os
+import threading
+import time
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+CREW_POOL_SIZE = int(os.getenv("CREW_POOL_SIZE", "4"))
+CREW_BRANCH_WORKERS = int(os.getenv("CREW_BRANCH_WORKERS", "8"))
+
+
+class CrewCancelledError(Exception):
+    """Raised inside a crew run (between agent steps) after its request was cancelled"""
+
+
+class _RunControl:
+    """
+    Per-crew run state. Installed once as the crew's step and task callbacks, it points at
+    the current run's cancel flag and event listener; the CrewAI hooks below feed it LLM
+    call counts and execution events.
+    """
+
+    def __init__(self):
+        self.cancel_event: Optional[threading.Event] = None
+        self.listener: Optional[Callable[[Dict], None]] = None
+        self.llm_calls = 0
+
+    def reset(self, cancel_event: Optional[threading.Event] = None, listener: Callable[[Dict], None] = None):
+        self.cancel_event = cancel_event
+        self.listener = listener
+        self.llm_calls = 0
+
+    def emit(self, event: Dict):
+        if self.listener is not None:
+            self.listener(event)
+
+    def __call__(self, step):
+        if self.cancel_event is not None and self.cancel_event.is_set():
+            raise CrewCancelledError("Crew run cancelled")
+
+    def on_task(self, output):
+        self.emit({"type": "task", "agent": output.agent, "data": _preview(output.raw)})
+
+
+class _NoTaskOutputLog:
+    """
+    Replaces CrewAI's kickoff replay log on pooled crews. That log is one SQLite table per
+    project behind a cross-process file lock that waiters poll every 250 ms, so concurrent
+    crews queued on it, and each kickoff wiped the rows of the others anyway.
+    """
+
+    def reset(self):
+        pass
+
+    def update(self, task_index: int, log: Dict[str, Any]):
+        pass
+
+    def add(self, *args, **kwargs):
+        pass
+
+    def load(self):
+        return None
+
+
+# id(pooled crew) -> its run control (CrewAI models don't support weak references)
+_controls: Dict[int, _RunControl] = {}
+# Agent id -> run control of its crew (stream chunk events only carry the agent id)
+_agent_controls: Dict[str, _RunControl] = {}
+_hook_lock = threading.Lock()
+_hooks_installed = False
+
+EVENT_PREVIEW_CHARS = 500
+
+
+def _preview(value: Any, limit: int = EVENT_PREVIEW_CHARS) -> str:
+    text = value if isinstance(value, str) else str(value)
+    return text if len(text) <= limit else text[:limit] + "…"
+
+
+def _control_for(crew) -> Optional[_RunControl]:
+    return _controls.get(id(crew)) if crew is not None else None
+
+
+def _crew_agent_ids(crew) -> List[str]:
+    agents = list(crew.agents) + ([crew.manager_agent] if crew.manager_agent is not None else [])
+    return [str(agent.id) for agent in agents]
+
+
+def _track(crew, control: _RunControl):
+    _controls[id(crew)] = control
+    for agent_id in _crew_agent_ids(crew):
+        _agent_controls[agent_id] = control
+
+
+def _untrack(crew):
+    _controls.pop(id(crew), None)
+    for agent_id in _crew_agent_ids(crew):
+        _agent_controls.pop(agent_id, None)
+
+
+def _role(agent) -> Optional[str]:
+    return getattr(agent, "role", None)
+
+
+def _before_llm_call(context) -> None:
+    control = _control_for(context.crew)
+    if control is not None:
+        control.llm_calls += 1
+    return None
+
+
+def _after_llm_call(context) -> None:
+    # Raw model turn: the manager's delegation reasoning, tool choices or the final answer
+    control = _control_for(context.crew)
+    if control is not None and control.listener is not None and context.response:
+        control.emit({"type": "thought", "agent": _role(context.agent), "data": _preview(context.response)})
+    return None
+
+
+def _before_tool_call(context) -> None:
+    control = _control_for(context.crew)
+    if control is not None and control.listener is not None:
+        control.emit({
+            "type": "tool", "agent": _role(context.agent),
+            "tool": context.tool_name, "input": _preview(context.tool_input, 200)
+        })
+    return None
+
+
+def _after_tool_call(context) -> None:
+    control = _control_for(context.crew)
+    if control is not None and control.listener is not None:
+        control.emit({
+            "type": "tool_result", "agent": _role(context.agent),
+            "tool": context.tool_name, "data": _preview(context.tool_result or "")
+        })
+    return None
+
+
+def _on_stream_chunk(source, event):
+    control = _agent_controls.get(event.agent_id) if event.agent_id else None
+    if control is not None and control.listener is not None:
+        control.emit({"type": "token", "agent": event.agent_role, "data": event.chunk})
+
+
+def _install_hooks():
+    """
+    Register the global CrewAI hooks once (CrewAI is already imported when crews get built).
+    Hooks run synchronously in the crew's thread, so events keep their order.
+    """
+    global _hooks_installed
+    with _hook_lock:
+        if _hooks_installed:
+            return
+        from crewai.hooks import (
+            register_before_llm_call_hook, register_after_llm_call_hook,
+            register_before_tool_call_hook, register_after_tool_call_hook
+        )
+        from crewai.events import crewai_event_bus, LLMStreamChunkEvent
+        register_before_llm_call_hook(_before_llm_call)
+        register_after_llm_call_hook(_after_llm_call)
+        register_before_tool_call_hook(_before_tool_call)
+        register_after_tool_call_hook(_after_tool_call)
+        # Stream chunk events are delivered synchronously by the event bus
+        crewai_event_bus.on(LLMStreamChunkEvent)(_on_stream_chunk)
+        _hooks_installed = True
+
+
+class CrewTemplate:
+    """Pool of identical crews produced by one build function"""
+
+    def __init__(self, name: str, build: Callable[[], Any], max_idle: int = CREW_POOL_SIZE, process: str = "sequential"):
+        """
+        Args:
+            name: Template name (usually the intent)
+            build: Returns a new, fully validated Crew with placeholder task descriptions
+            max_idle: Idle crews kept for reuse; extra crews built under load are dropped
+            process: How the crew runs, reported to clients (e.g. hierarchical, direct)
+        """
+        self.name = name
+        self.process = process
+        self.max_idle = max_idle
+        self._build = build
+        self._idle: List[Tuple[Any, _RunControl]] = []
+        self._lock = threading.Lock()
+        self._built = 0
+        self._reused = 0
+        self._build_ms = 0.0
+        self._runs = 0
+        self._llm_calls = 0
+
+    def _new_crew(self) -> Tuple[Any, _RunControl]:
+        _install_hooks()
+        start = time.perf_counter()
+        crew = self._build()
+        # CrewAI copies the crew's step/task callbacks onto its agents and tasks on first
+        # kickoff and keeps them, so install stable per-crew callbacks and swap run state
+        control = _RunControl()
+        crew.step_callback = control
+        crew.task_callback = control.on_task
+        if "_task_output_handler" not in type(crew).__private_attributes__:
+            # Assigning it anyway would succeed silently and leave CrewAI's own log in use
+            raise RuntimeError(
+                "Crew._task_output_handler not found in this CrewAI version; "
+                "crew_templates was written against crewai 1.15"
+            )
+        crew._task_output_handler = _NoTaskOutputLog()
+        _track(crew, control)
+        with self._lock:
+            self._built += 1
+            self._build_ms += (time.perf_counter() - start) * 1000
+        return crew, control
+
+    def prebuild(self, count: int = 1):
+        """Build idle crews ahead of traffic (called during warm-up)"""
+        while True:
+            with self._lock:
+                if len(self._idle) >= min(count, self.max_idle):
+                    return
+            entry = self._new_crew()
+            with self._lock:
+                self._idle.append(entry)
+
+    @contextmanager
+    def _lease(self):
+        with self._lock:
+            entry = self._idle.pop() if self._idle else None
+            if entry is not None:
+                self._reused += 1
+        if entry is None:
+            entry = self._new_crew()
+
+        try:
+            yield entry
+        except BaseException:
+            _untrack(entry[0])
+            raise
+
+        entry[1].reset()
+        with self._lock:
+            if len(self._idle) < self.max_idle:
+                self._idle.append(entry)
+                return
+        _untrack(entry[0])
+
+    @contextmanager
+    def checkout(self):
+        """
+        Borrow an idle crew for one run (a new one is built when all are busy)
+
+        A crew whose run raised is not returned to the pool.
+        """
+        with self._lease() as (crew, _):
+            yield crew
+
+    def run(self, inputs: Dict[str, Any], cancel_event: threading.Event = None,
+            listener: Callable[[Dict], None] = None) -> Tuple[Any, int]:
+        """
+        Run a pooled crew with the given placeholder values
+
+        Args:
+            inputs: Placeholder values
+            cancel_event: When set, the run stops after the current agent step
+            listener: Called from the crew's thread with each execution event
+                ({"type": thought|tool|tool_result|task|token, "agent", "data", ...})
+
+        Returns:
+            (crew result, LLM calls made by the run)
+
+        Raises:
+            CrewCancelledError: cancel_event was set during the run
+        """
+        with self._lease() as (crew, control):
+            control.reset(cancel_event, listener)
+            result = crew.kickoff(inputs=inputs)
+            llm_calls = control.llm_calls
+        with self._lock:
+            self._runs += 1
+            self._llm_calls += llm_calls
+        return result, llm_calls
+
+    def kickoff(self, inputs: Dict[str, Any], cancel_event: threading.Event = None,
+                listener: Callable[[Dict], None] = None):
+        """Run a pooled crew and return its result (see run)"""
+        return self.run(inputs, cancel_event, listener)[0]
+
+    def bind(self, **inputs) -> "BoundCrew":
+        """Attach one request's inputs; the result runs like a Crew"""
+        return BoundCrew(self, inputs)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                "idle": len(self._idle),
+                "built": self._built,
+                "reused": self._reused,
+                "avg_build_ms": round(self._build_ms / self._built, 2) if self._built else None,
+                "runs": self._runs,
+                "avg_llm_calls": round(self._llm_calls / self._runs, 2) if self._runs else None,
+            }
+
+
+class BoundCrew:
+    """A crew template plus the inputs of one request"""
+
+    def __init__(self, template: CrewTemplate, inputs: Dict[str, Any]):
+        self.template = template
+        self.inputs = inputs
+        self.llm_calls: Optional[int] = None
+
+    @property
+    def name(self) -> str:
+        return self.template.name
+
+    @property
+    def process(self) -> str:
+        return self.template.process
+
+    def kickoff(self, cancel_event: threading.Event = None, listener: Callable[[Dict], None] = None):
+        """Check out a crew, run it with this request's inputs and return it to the pool"""
+        result, self.llm_calls = self.template.run(self.inputs, cancel_event, listener)
+        return result
+
+
+# Branch crews of parallel runs; separate from the crew executor, whose workers wait on them
+_branch_pool = ThreadPoolExecutor(CREW_BRANCH_WORKERS, thread_name_prefix="crew-branch")
+
+
+class ParallelCrew:
+    """
+    Independent bound crews run concurrently, then a merge crew combines their outputs.
+    Wall-clock time is the slowest branch plus the merge instead of the sum of all tasks.
+    """
+
+    process = "parallel"
+
+    def __init__(self, name: str, branches: Dict[str, BoundCrew], merge: CrewTemplate, inputs: Dict[str, Any]):
+        """
+        Args:
+            name: Name reported for the run (usually the multi-task template it replaces)
+            branches: Label -> bound crew; no branch may depend on another's output
+            merge: Template whose tasks take the inputs plus {findings} (the labelled branch outputs)
+            inputs: Placeholder values for the merge crew
+        """
+        self.name = name
+        self.branches = branches
+        self.merge = merge
+        self.inputs = inputs
+        self.llm_calls: Optional[int] = None
+
+    def kickoff(self, cancel_event: threading.Event = None, listener: Callable[[Dict], None] = None):
+        """Run all branches at once, then the merge crew; a failed branch cancels the others"""
+        cancel_event = cancel_event or threading.Event()
+        futures = {
+            label: _branch_pool.submit(branch.kickoff, cancel_event, listener)
+            for label, branch in self.branches.items()
+        }
+        try:
+            # Returns as soon as any branch raises, whichever order they finish in
+            wait(futures.values(), return_when=FIRST_EXCEPTION)
+            for future in futures.values():
+                if future.done() and future.exception() is not None:
+                    raise future.exception()
+            outputs = {label: future.result() for label, future in futures.items()}
+        except BaseException:
+            cancel_event.set()  # Stops the branches still running after their current step
+            raise
+
+        findings = "\n\n".join(f"[{label}]\n{output}" for label, output in outputs.items())
+        result, merge_calls = self.merge.run({**self.inputs, "findings": findings}, cancel_event, listener)
+        self.llm_calls = sum(branch.llm_calls or 0 for branch in self.branches.values()) + merge_calls
+        return result
+
+
+class CrewTemplateRegistry:
+    """Named crew templates"""
+
+    def __init__(self):
+        self._templates: Dict[str, CrewTemplate] = {}
+
+    def register(self, name: str, build: Callable[[], Any], max_idle: int = CREW_POOL_SIZE,
+                 process: str = "sequential") -> CrewTemplate:
+        template = CrewTemplate(name, build, max_idle, process)
+        self._templates[name] = template
+        return template
+
+    def get(self, name: str) -> CrewTemplate:
+        """
+        Raises:
+            KeyError: Unknown template
+        """
+        return self._templates[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._templates
+
+    def names(self) -> List[str]:
+        return list(self._templates)
+
+    def prebuild(self, count: int = 1, names: List[str] = None) -> Dict:
+        """
+        Build idle crews for the given templates (default: all)
+
+        Returns:
+            Template stats after building
+        """
+        for name in names or self.names():
+            self._templates[name].prebuild(count)
+        return self.stats()
+
+    def stats(self) -> Dict:
+        return {name: template.stats() for name, template in self._templates.items()}
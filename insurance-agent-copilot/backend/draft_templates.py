@@ -0,0 +1,253 @@
+"""
+Draft Templates
+Reply draft templates compiled once into renderers. Placeholders use the templates.json
+syntax, {{field}}, plus {{field|default}} for a value used when the field is missing or
+empty; a placeholder with no value and no default is left in the text for the agent to
+fill in. Code defaults cover every draft slot, a templates.json entry with a
+"draftSlot" replaces that slot's default, and every templates.json entry can also be
+rendered by id. Templates are recompiled only when templates.json changes, and rendered
+drafts are cached per lead, lead version and the lead values the templates use.
+"""
+
+import os
+import re
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from tools import lead_versions, templates
+from tools.data_cache import read_json
+
+DRAFT_CACHE_SIZE = int(os.getenv("DRAFT_CACHE_SIZE", "2048"))
+
+_PLACEHOLDER = re.compile(r"\{\{\s*(\w+)\s*(?:\|([^}]*))?\}\}")
+
+# Draft slots and their built-in text
+DEFAULT_TEMPLATES: Dict[str, str] = {
+    # Reply to an inbound message (no lead profile needed)
+    "reply.whatsapp": "Hi! Thanks for your message about insurance. I'd love to help you find the perfect policy. When would be a good time for a quick call? 😊",
+    "reply.email.subject": "Re: Your insurance inquiry",
+    "reply.email": """Dear Valued Customer,
+
+Thank you for reaching out to us regarding your insurance needs.
+
+Based on your inquiry, I believe we have excellent options that would suit your requirements perfectly. I would love to discuss these with you in detail.
+
+Could we schedule a brief call at your convenience? I'm available today between 2:00 PM - 6:00 PM.
+
+Best regards,
+Your LIC Agent""",
+    # Personalised from the lead profile (Communication Hub)
+    "lead.whatsapp": "Hi {{name|there}}! Hope you're doing well. I wanted to follow up on our discussion about {{product|insurance}}. I have some great options that might interest you. When would be a good time to chat? 😊",
+    "lead.email.subject": "Perfect {{product|Insurance}} Plan for {{name|}}",
+    "lead.email": """Dear {{name|Valued Customer}},
+
+I hope this email finds you in good health and spirits.
+
+Following our recent interactions, I wanted to share some personalized insurance recommendations that align perfectly with your needs:
+
+**Recommended for You:**
+1. {{product|LIC Term Assurance Plan}} - Ideal for your age group ({{age|35}} years)
+2. Flexible premium payment options
+3. Comprehensive coverage with additional riders
+
+**Why This Works for You:**
+- Affordable premiums starting from ₹500/month
+- Tax benefits under Section 80C
+- Financial security for your family
+
+I would love to discuss these options in detail and answer any questions you might have. 
+
+**Available for Call:**
+- Today: 2:00 PM - 6:00 PM  
+- Tomorrow: 10:00 AM - 4:00 PM
+
+Please let me know what time works best for you.
+
+Best regards,
+[Your Name]
+LIC Insurance Agent
+📞 +91-XXXXXXXXXX
+📧 agent@lic.co.in""",
+}
+
+
+class CompiledTemplate:
+    """A template split once into literal text and (field, default) placeholders"""
+
+    __slots__ = ("source", "fields", "_parts")
+
+    def __init__(self, source: str):
+        self.source = source
+        parts: List[Tuple[str, Optional[str], Optional[str]]] = []
+        fields = []
+        position = 0
+        for match in _PLACEHOLDER.finditer(source):
+            if match.start() > position:
+                parts.append((source[position:match.start()], None, None))
+            field, default = match.group(1), match.group(2)
+            parts.append((match.group(0), field, default))
+            if field not in fields:
+                fields.append(field)
+            position = match.end()
+        if position < len(source):
+            parts.append((source[position:], None, None))
+        self.fields: Tuple[str, ...] = tuple(fields)
+        self._parts = tuple(parts)
+
+    def render(self, values: Dict) -> str:
+        out = []
+        for text, field, default in self._parts:
+            if field is None:
+                out.append(text)
+                continue
+            value = values.get(field)
+            if value is not None and value != "":
+                out.append(str(value))
+            elif default is not None:
+                out.append(default)
+            else:
+                out.append(text)  # Unfilled placeholder stays visible
+        return "".join(out)
+
+
+def lead_value(lead: Dict, field: str):
+    """
+    Placeholder value for a lead: one of its scalar fields, or the derived product /
+    productType (first productInterest) and firstName
+    """
+    value = lead.get(field)
+    if value is None:
+        if field in ("product", "productType"):
+            products = lead.get("productInterest") or []
+            return products[0] if products else None
+        if field == "firstName":
+            name = lead.get("name")
+            return name.split()[0] if isinstance(name, str) and name.strip() else None
+        return None
+    if isinstance(value, bool) or not isinstance(value, (str, int, float)):
+        return None
+    return value
+
+
+def lead_values(lead: Dict, fields: Iterable[str]) -> Dict:
+    """Values of the given placeholder fields for a lead"""
+    return {field: lead_value(lead, field) for field in fields}
+
+
+class DraftTemplates:
+    """Compiled draft slots and templates.json templates, with a rendered-draft cache"""
+
+    def __init__(self, defaults: Dict[str, str] = None, cache_size: int = DRAFT_CACHE_SIZE):
+        """
+        Args:
+            defaults: Slot -> template text (DEFAULT_TEMPLATES)
+            cache_size: Rendered draft sets kept; least recently used are evicted first
+        """
+        self._defaults = {slot: CompiledTemplate(text) for slot, text in (defaults or DEFAULT_TEMPLATES).items()}
+        self.cache_size = cache_size
+        self._source = None  # templates.json data the compiled set was built from
+        self._slots: Dict[str, CompiledTemplate] = dict(self._defaults)
+        self._by_id: Dict[str, CompiledTemplate] = {}
+        self._generation = 0
+        self._cache: "OrderedDict[Tuple, Dict[str, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._counts = {"compiles": 0, "hits": 0, "misses": 0}
+
+    def _refresh(self):
+        """Recompile when templates.json changed (read_json returns the same object until then)"""
+        data = read_json(templates.DATA_PATH, [])
+        if data is self._source:
+            return
+        slots = dict(self._defaults)
+        by_id = {}
+        for entry in data if isinstance(data, list) else []:
+            content = entry.get("content") if isinstance(entry, dict) else None
+            if not isinstance(content, str):
+                continue
+            compiled = CompiledTemplate(content)
+            if entry.get("id"):
+                by_id[entry["id"]] = compiled
+            if entry.get("draftSlot") and entry.get("isApproved", True):
+                slots[entry["draftSlot"]] = compiled
+        with self._lock:
+            self._source = data
+            self._slots = slots
+            self._by_id = by_id
+            self._generation += 1
+            self._cache.clear()
+            self._counts["compiles"] += 1
+
+    def template(self, name: str) -> Optional[CompiledTemplate]:
+        """Compiled template for a draft slot or a templates.json id"""
+        self._refresh()
+        return self._slots.get(name) or self._by_id.get(name)
+
+    def render(self, name: str, values: Optional[Dict] = None) -> Optional[str]:
+        """Render one slot or templates.json template (None if it doesn't exist)"""
+        compiled = self.template(name)
+        return compiled.render(values or {}) if compiled is not None else None
+
+    def render_lead(self, slots: Tuple[str, ...], lead: Dict) -> Dict[str, str]:
+        """
+        Render several slots for one lead, through the cache
+
+        Args:
+            slots: Draft slots to render
+            lead: Lead record (from the data files or sent by the client)
+
+        Returns:
+            Slot -> rendered text
+        """
+        return self.render_bulk(slots, [lead])[0]
+
+    def render_bulk(self, slots: Tuple[str, ...], leads: Iterable[Dict]) -> List[Dict[str, str]]:
+        """render_lead for many leads; templates are resolved once for the whole batch"""
+        self._refresh()
+        with self._lock:
+            generation = self._generation
+            compiled = [(slot, self._slots[slot]) for slot in slots]
+        fields = tuple(dict.fromkeys(field for _, template in compiled for field in template.fields))
+        results = []
+        for lead in leads:
+            used = tuple(lead_value(lead, field) for field in fields)
+            lead_id = lead.get("id")
+            key = (
+                generation, slots, lead_id,
+                lead_versions.version(lead_versions.LEAD, lead_id) if lead_id else 0,
+                used,
+            )
+            results.append(self._cached(key, compiled, fields, used))
+        return results
+
+    def _cached(self, key: Tuple, compiled: List[Tuple[str, CompiledTemplate]],
+                fields: Tuple[str, ...], used: Tuple) -> Dict[str, str]:
+        with self._lock:
+            rendered = self._cache.get(key)
+            if rendered is not None:
+                self._cache.move_to_end(key)
+                self._counts["hits"] += 1
+                return rendered
+            self._counts["misses"] += 1
+
+        values = dict(zip(fields, used))
+        rendered = {slot: template.render(values) for slot, template in compiled}
+        if self.cache_size > 0:
+            with self._lock:
+                self._cache[key] = rendered
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return rendered
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                "slots": len(self._slots),
+                "templates": len(self._by_id),
+                "cached": len(self._cache),
+                "cache_size": self.cache_size,
+                **self._counts,
+            }
+
+
+draft_templates = DraftTemplates()
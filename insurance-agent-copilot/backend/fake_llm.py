@@ -0,0 +1,376 @@
+"""
+Fake LLM Backend
+Scripted chat model that replays deterministic tool-calling plans offline.
+Used for benchmarking and load testing both backends without network access.
+
+Configuration (environment variables):
+    LLM_PROVIDER=fake              Select this backend instead of Gemini
+    FAKE_LLM_PLANS=path.json       Plan file (default: fake_llm_plans.json)
+    FAKE_LLM_LATENCY_MS=spec       Time to first token, e.g. "normal:300,50"
+    FAKE_LLM_TOKENS_PER_SEC=spec   Streaming token rate, e.g. "uniform:40,80"
+    FAKE_LLM_SEED=42               Seed for the latency/token-rate samplers
+
+Distribution specs: fixed:X | uniform:A,B | normal:MEAN,STD | lognormal:MEDIAN,SIGMA | exp:MEAN
+"""
+
+import asyncio
+import json
+import math
+import os
+import random
+import re
+import threading
+import time
+import uuid
+from typing import Any, Callable, Dict, List, Optional
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage, HumanMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from langchain_core.utils.function_calling import convert_to_openai_tool
+
+DEFAULT_PLANS_PATH = os.path.join(os.path.dirname(__file__), 'fake_llm_plans.json')
+
+# Prompts built by the backends wrap the user request in quotes, e.g.
+# Query: "..." (classify_intent) or Process this lead-related request: "..." (CrewAI tasks)
+DEFAULT_FOCUS_PATTERN = r'(?:Query|Message|request|compliance):\s*"(.*?)"'
+
+_TOKEN_PATTERN = re.compile(r'\S+\s*|\s+')
+
+
+def parse_distribution(spec: str) -> Callable[[random.Random], float]:
+    """
+    Parse a distribution spec into a sampler
+
+    Args:
+        spec: "fixed:X", "uniform:A,B", "normal:MEAN,STD", "lognormal:MEDIAN,SIGMA" or "exp:MEAN"
+
+    Returns:
+        Function taking a Random instance and returning a non-negative sample
+    """
+    kind, _, params = spec.strip().partition(':')
+    if not params:
+        # Bare number means fixed value
+        kind, params = 'fixed', kind
+    values = [float(v) for v in params.split(',') if v.strip()]
+    kind = kind.lower()
+
+    if kind == 'fixed':
+        return lambda rng: max(0.0, values[0])
+    if kind == 'uniform':
+        return lambda rng: max(0.0, rng.uniform(values[0], values[1]))
+    if kind == 'normal':
+        return lambda rng: max(0.0, rng.gauss(values[0], values[1]))
+    if kind == 'lognormal':
+        return lambda rng: rng.lognormvariate(math.log(max(values[0], 1e-9)), values[1])
+    if kind == 'exp':
+        return lambda rng: rng.expovariate(1.0 / values[0]) if values[0] > 0 else 0.0
+
+    raise ValueError(f"Unknown distribution '{spec}'")
+
+
+class FakeLLMScript:
+    """
+    Plan engine shared by the LangChain and CrewAI fake models.
+
+    A plan file looks like:
+        {
+          "default_response": "...",
+          "plans": [
+            {"name": "...", "match": ["hot lead"],
+             "steps": [{"tool": "tool_search_leads", "args": {"temperature": "hot"}}],
+             "response": "Here are your hot leads."},
+            {"name": "intent_classification", "match": ["classify this"], "scope": "prompt",
+             "labels": {"analytics": ["summary", "report"]}, "default_label": "lead_management"}
+          ]
+        }
+
+    Each step is either a single tool call or a list of calls issued in the same model turn.
+    Steps may also carry "crew_tool"/"crew_args" so the CrewAI backend can replay them.
+    """
+
+    def __init__(
+        self,
+        plans: Dict[str, Any],
+        latency_ms: str = "fixed:0",
+        tokens_per_sec: str = "fixed:0",
+        seed: int = 42
+    ):
+        self.plans = plans.get('plans', [])
+        self.default_response = plans.get('default_response', "I can help with leads, tasks, analytics and compliance.")
+        self.focus_pattern = re.compile(plans.get('focus_pattern', DEFAULT_FOCUS_PATTERN), re.IGNORECASE | re.DOTALL)
+        self._latency = parse_distribution(latency_ms)
+        self._token_rate = parse_distribution(tokens_per_sec)
+        self._rng = random.Random(seed)
+        self._rng_lock = threading.Lock()
+        self.calls = 0
+
+    # ------------------------------
+    # Sampling
+    # ------------------------------
+    def sample_latency(self) -> float:
+        """Sample time to first token in seconds"""
+        with self._rng_lock:
+            self.calls += 1
+            return self._latency(self._rng) / 1000.0
+
+    def sample_token_delay(self) -> float:
+        """Sample the delay between two streamed tokens in seconds"""
+        with self._rng_lock:
+            rate = self._token_rate(self._rng)
+        return 1.0 / rate if rate > 0 else 0.0
+
+    # ------------------------------
+    # Plan selection
+    # ------------------------------
+    def focus(self, text: str) -> str:
+        """Extract the user request from a wrapping prompt, if any"""
+        found = self.focus_pattern.search(text)
+        return found.group(1) if found else text
+
+    def select_plan(self, prompt: str, message: str) -> Optional[Dict]:
+        """
+        Return the first plan whose match phrases appear in the request.
+        Plans with "scope": "prompt" match the whole prompt instead of the focused request.
+        """
+        prompt_lower = prompt.lower()
+        message_lower = message.lower()
+        for plan in self.plans:
+            text = prompt_lower if plan.get('scope') == 'prompt' else message_lower
+            if any(phrase.lower() in text for phrase in plan.get('match', [])):
+                return plan
+        return None
+
+    def next_turn(self, prompt: str, steps_done: int, allowed_tools: Optional[List[str]] = None, crew: bool = False) -> Dict:
+        """
+        Decide what the model says next
+
+        Args:
+            prompt: Latest user prompt
+            steps_done: Number of tool-calling turns already completed for this prompt
+            allowed_tools: Tool names bound to the model (None = no restriction)
+            crew: Use the CrewAI tool names of each step
+
+        Returns:
+            {"tool_calls": [...]} or {"content": "..."}
+        """
+        message = self.focus(prompt)
+        plan = self.select_plan(prompt, message)
+
+        if plan is None:
+            return {"content": self.default_response}
+
+        if 'labels' in plan:
+            return {"content": self._classify(message, plan)}
+
+        # Steps whose tools are not available to this model are skipped entirely
+        emitted = 0
+        for step in plan.get('steps', []):
+            calls = step if isinstance(step, list) else [step]
+            tool_calls = []
+            for call in calls:
+                name = call.get('crew_tool') if crew else call.get('tool')
+                if not name or (allowed_tools is not None and name not in allowed_tools):
+                    continue
+                args = call.get('crew_args' if crew else 'args', {})
+                tool_calls.append({"name": name, "args": args})
+            if not tool_calls:
+                continue
+            if emitted == steps_done:
+                return {"tool_calls": tool_calls}
+            emitted += 1
+
+        response = plan.get('response', self.default_response)
+        return {"content": response.replace('{message}', message)}
+
+    def _classify(self, message: str, plan: Dict) -> str:
+        """Answer a classification prompt with the first label whose keywords match"""
+        text = message.lower()
+        for label, keywords in plan['labels'].items():
+            if any(keyword.lower() in text for keyword in keywords):
+                return label
+        return plan.get('default_label', 'lead_management')
+
+    @staticmethod
+    def tokenize(text: str) -> List[str]:
+        """Split text into word-sized pseudo tokens for streaming"""
+        return _TOKEN_PATTERN.findall(text) or [text]
+
+
+_script: Optional[FakeLLMScript] = None
+_script_lock = threading.Lock()
+
+
+def get_fake_script() -> FakeLLMScript:
+    """Load the shared plan engine once from the environment configuration"""
+    global _script
+    with _script_lock:
+        if _script is None:
+            path = os.getenv("FAKE_LLM_PLANS", DEFAULT_PLANS_PATH)
+            with open(path, 'r') as f:
+                plans = json.load(f)
+            _script = FakeLLMScript(
+                plans,
+                latency_ms=os.getenv("FAKE_LLM_LATENCY_MS", "fixed:0"),
+                tokens_per_sec=os.getenv("FAKE_LLM_TOKENS_PER_SEC", "fixed:0"),
+                seed=int(os.getenv("FAKE_LLM_SEED", "42"))
+            )
+            print(f"🧪 Fake LLM loaded {len(_script.plans)} plans from {path}")
+        return _script
+
+
+def _last_human_index(messages: List[BaseMessage]) -> int:
+    for i in range(len(messages) - 1, -1, -1):
+        if isinstance(messages[i], HumanMessage):
+            return i
+    return -1
+
+
+def _content_text(message: BaseMessage) -> str:
+    content = message.content
+    if isinstance(content, str):
+        return content
+    return " ".join(part.get('text', '') if isinstance(part, dict) else str(part) for part in content)
+
+
+class FakeChatModel(BaseChatModel):
+    """LangChain chat model that replays FakeLLMScript plans with simulated latency"""
+
+    model_name: str = "fake-llm"
+    bound_tools: Optional[List[str]] = None
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-llm"
+
+    @property
+    def script(self) -> FakeLLMScript:
+        return get_fake_script()
+
+    def bind_tools(self, tools, *, tool_choice=None, **kwargs):
+        """Record tool names so plans only call tools the agent actually has"""
+        names = [convert_to_openai_tool(t)["function"]["name"] for t in tools]
+        return self.model_copy(update={"bound_tools": names}).bind(**kwargs)
+
+    def _plan_turn(self, messages: List[BaseMessage]) -> Dict:
+        start = _last_human_index(messages)
+        prompt = _content_text(messages[start]) if start >= 0 else ""
+        steps_done = sum(
+            1 for m in messages[start + 1:]
+            if isinstance(m, AIMessage) and m.tool_calls
+        )
+        return self.script.next_turn(prompt, steps_done, self.bound_tools)
+
+    @staticmethod
+    def _to_message(turn: Dict) -> AIMessage:
+        if 'tool_calls' in turn:
+            return AIMessage(content="", tool_calls=[
+                {"name": call["name"], "args": call["args"], "id": f"call_{uuid.uuid4().hex[:12]}", "type": "tool_call"}
+                for call in turn['tool_calls']
+            ])
+        return AIMessage(content=turn['content'])
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        turn = self._plan_turn(messages)
+        delay = self.script.sample_latency()
+        if 'content' in turn:
+            delay += self.script.sample_token_delay() * len(self.script.tokenize(turn['content']))
+        time.sleep(delay)
+        return ChatResult(generations=[ChatGeneration(message=self._to_message(turn))])
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        turn = self._plan_turn(messages)
+        delay = self.script.sample_latency()
+        if 'content' in turn:
+            delay += self.script.sample_token_delay() * len(self.script.tokenize(turn['content']))
+        await asyncio.sleep(delay)
+        return ChatResult(generations=[ChatGeneration(message=self._to_message(turn))])
+
+    def _chunks(self, turn: Dict):
+        if 'tool_calls' in turn:
+            message = self._to_message(turn)
+            yield ChatGenerationChunk(message=AIMessageChunk(
+                content="",
+                tool_call_chunks=[
+                    {"name": call["name"], "args": json.dumps(call["args"]), "id": call["id"], "index": i, "type": "tool_call_chunk"}
+                    for i, call in enumerate(message.tool_calls)
+                ]
+            ))
+            return
+        for token in self.script.tokenize(turn['content']):
+            yield ChatGenerationChunk(message=AIMessageChunk(content=token))
+
+    def _stream(self, messages, stop=None, run_manager=None, **kwargs):
+        turn = self._plan_turn(messages)
+        time.sleep(self.script.sample_latency())
+        for chunk in self._chunks(turn):
+            if chunk.message.content:
+                time.sleep(self.script.sample_token_delay())
+                if run_manager:
+                    run_manager.on_llm_new_token(chunk.message.content, chunk=chunk)
+            yield chunk
+
+    async def _astream(self, messages, stop=None, run_manager=None, **kwargs):
+        turn = self._plan_turn(messages)
+        await asyncio.sleep(self.script.sample_latency())
+        for chunk in self._chunks(turn):
+            if chunk.message.content:
+                await asyncio.sleep(self.script.sample_token_delay())
+                if run_manager:
+                    await run_manager.on_llm_new_token(chunk.message.content, chunk=chunk)
+            yield chunk
+
+
+# ------------------------------
+# CrewAI adapter (only when crewai is installed)
+# ------------------------------
+try:
+    from crewai.llms.base_llm import BaseLLM as _CrewBaseLLM
+except ImportError:
+    _CrewBaseLLM = None
+
+if _CrewBaseLLM is not None:
+
+    class FakeCrewLLM(_CrewBaseLLM):
+        """CrewAI LLM that answers in ReAct text format using FakeLLMScript plans"""
+
+        def __init__(self, model: str = "fake-llm", **kwargs):
+            super().__init__(model=model, **kwargs)
+
+        def call(self, messages, tools=None, callbacks=None, available_functions=None, **kwargs) -> str:
+            script = get_fake_script()
+            if isinstance(messages, str):
+                messages = [{"role": "user", "content": messages}]
+
+            prompt = next((m.get("content", "") for m in messages if m.get("role") == "user"), "")
+            transcript = "".join(str(m.get("content", "")) for m in messages if m.get("role") == "assistant")
+            steps_done = transcript.count("Observation:")
+
+            turn = script.next_turn(prompt, steps_done, crew=True)
+            time.sleep(script.sample_latency())
+            if 'tool_calls' in turn:
+                call = turn['tool_calls'][0]
+                return (
+                    f"Thought: I should use the {call['name']}\n"
+                    f"Action: {call['name']}\n"
+                    f"Action Input: {json.dumps(call['args'])}"
+                )
+
+            # Pace the final answer token by token and publish CrewAI stream chunk events
+            for token in script.tokenize(turn['content']):
+                time.sleep(script.sample_token_delay())
+                self._emit_stream_chunk_event(
+                    token, from_task=kwargs.get('from_task'), from_agent=kwargs.get('from_agent')
+                )
+            return f"Thought: I now know the final answer\nFinal Answer: {turn['content']}"
+
+        def supports_function_calling(self) -> bool:
+            return False
+
+        def supports_stop_words(self) -> bool:
+            return True
+
+        def get_context_window_size(self) -> int:
+            return 128000
+else:
+    FakeCrewLLM = None
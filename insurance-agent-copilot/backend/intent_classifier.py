@@ -0,0 +1,156 @@
+"""
+Local Intent Classifier
+Multinomial naive Bayes over word 1-2 grams and character 3-5 grams, trained from
+intent_examples.json at startup. Pure Python, predicts a label + confidence in well
+under a millisecond so the LLM is only needed for low-confidence messages.
+"""
+
+import json
+import math
+import os
+import re
+import threading
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+EXAMPLES_PATH = os.getenv(
+    "INTENT_EXAMPLES_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "intent_examples.json")
+)
+INTENT_CONFIDENCE_THRESHOLD = float(os.getenv("INTENT_CONFIDENCE_THRESHOLD", "0.9"))
+# Confidence at which a single-intent message may skip the crew manager (crew_agents.py);
+# benchmarks.eval_intent reports the misroute rate there
+DIRECT_DISPATCH_CONFIDENCE = float(os.getenv("DIRECT_DISPATCH_CONFIDENCE", "0.95"))
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def extract_features(text: str) -> List[str]:
+    """
+    Binary bag of features for a message
+
+    Args:
+        text: Raw message
+
+    Returns:
+        Unique feature strings (word unigrams/bigrams, char 3-5 grams)
+    """
+    tokens = _TOKEN_RE.findall(text.lower())
+    features = set()
+    for i, token in enumerate(tokens):
+        features.add(f"w:{token}")
+        if i:
+            features.add(f"b:{tokens[i - 1]}_{token}")
+        padded = f" {token} "
+        for n in (3, 4, 5):
+            for j in range(len(padded) - n + 1):
+                features.add(f"c:{padded[j:j + n]}")
+    return list(features)
+
+
+class IntentClassifier:
+    """Multinomial naive Bayes with softmax confidence"""
+
+    def __init__(self, alpha: float = 0.5, sharpness: float = 8.0):
+        """
+        Args:
+            alpha: Additive smoothing
+            sharpness: Scales the per-feature average log-likelihood before the softmax;
+                higher values give more peaked confidences
+        """
+        self.alpha = alpha
+        self.sharpness = sharpness
+        self.labels: List[str] = []
+        self.log_prior: Dict[str, float] = {}
+        self.log_prob: Dict[str, Dict[str, float]] = {}
+        self.log_unseen: Dict[str, float] = {}
+        self.vocabulary: set = set()
+
+    def fit(self, examples: Iterable[Tuple[str, str]]) -> "IntentClassifier":
+        """
+        Train from (text, label) pairs
+
+        Returns:
+            self
+        """
+        doc_counts: Counter = Counter()
+        feature_counts: Dict[str, Counter] = defaultdict(Counter)
+        for text, label in examples:
+            doc_counts[label] += 1
+            feature_counts[label].update(extract_features(text))
+
+        self.labels = sorted(doc_counts)
+        self.vocabulary = set()
+        for counts in feature_counts.values():
+            self.vocabulary.update(counts)
+        vocab_size = len(self.vocabulary)
+        total_docs = sum(doc_counts.values())
+
+        for label in self.labels:
+            counts = feature_counts[label]
+            denominator = sum(counts.values()) + self.alpha * vocab_size
+            self.log_prior[label] = math.log(doc_counts[label] / total_docs)
+            self.log_prob[label] = {f: math.log((c + self.alpha) / denominator) for f, c in counts.items()}
+            self.log_unseen[label] = math.log(self.alpha / denominator)
+        return self
+
+    def predict_proba(self, text: str) -> Dict[str, float]:
+        """Confidence per label (sums to 1)"""
+        features = [f for f in extract_features(text) if f in self.vocabulary]
+        if not features:
+            return {label: 1.0 / len(self.labels) for label in self.labels}
+
+        scores = {}
+        for label in self.labels:
+            log_prob = self.log_prob[label]
+            unseen = self.log_unseen[label]
+            likelihood = sum(log_prob.get(f, unseen) for f in features)
+            # Average per feature so confidence doesn't saturate on long messages
+            scores[label] = self.sharpness * likelihood / len(features) + self.log_prior[label]
+
+        top = max(scores.values())
+        exp_scores = {label: math.exp(score - top) for label, score in scores.items()}
+        total = sum(exp_scores.values())
+        return {label: value / total for label, value in exp_scores.items()}
+
+    def predict(self, text: str) -> Tuple[str, float]:
+        """
+        Classify a message
+
+        Returns:
+            (label, confidence)
+        """
+        proba = self.predict_proba(text)
+        label = max(proba, key=proba.get)
+        return label, proba[label]
+
+
+def load_examples(path: str = None) -> List[Tuple[str, str]]:
+    """
+    Load labeled examples ({"label": ["text", ...]})
+
+    Returns:
+        List of (text, label) pairs
+    """
+    with open(path or EXAMPLES_PATH, 'r') as f:
+        data = json.load(f)
+    return [(text, label) for label, texts in data.items() for text in texts]
+
+
+_classifier: Optional[IntentClassifier] = None
+_classifier_lock = threading.Lock()
+
+
+def get_intent_classifier() -> IntentClassifier:
+    """Shared classifier trained from EXAMPLES_PATH on first use"""
+    global _classifier
+    if _classifier is None:
+        with _classifier_lock:
+            if _classifier is None:
+                _classifier = IntentClassifier().fit(load_examples())
+    return _classifier
+
+
+def classify_local(text: str) -> Tuple[str, float]:
+    """Classify with the shared local model"""
+    return get_intent_classifier().predict(text)
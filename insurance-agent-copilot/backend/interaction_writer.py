@@ -0,0 +1,291 @@
+"""
+Interaction Writer
+Write-behind persistence for interactions.json. Request handlers only enqueue records
+(or updates to existing records); a background thread drains the queue and rewrites the
+file once per batch, when INTERACTION_BATCH_SIZE operations are waiting or the oldest
+has waited INTERACTION_FLUSH_INTERVAL_MS. The queue is bounded, so a stalled disk shows
+up as rejected enqueues instead of unbounded memory, and everything still queued is
+flushed on shutdown. The file is read and written through tools.data_cache under its
+file_lock, so the interaction tools running in the same process see every batch and
+never overwrite one.
+"""
+
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from tools.data_cache import file_lock, read_json, write_json
+
+INTERACTION_BATCH_SIZE = int(os.getenv("INTERACTION_BATCH_SIZE", "100"))
+INTERACTION_FLUSH_INTERVAL_MS = int(os.getenv("INTERACTION_FLUSH_INTERVAL_MS", "200"))
+INTERACTION_QUEUE_SIZE = int(os.getenv("INTERACTION_QUEUE_SIZE", "10000"))
+INTERACTION_ENQUEUE_TIMEOUT_MS = int(os.getenv("INTERACTION_ENQUEUE_TIMEOUT_MS", "1000"))
+# never: leave it to the OS; batch: fsync every flush; interval: fsync at most every INTERACTION_FSYNC_INTERVAL_MS
+INTERACTION_FSYNC = os.getenv("INTERACTION_FSYNC", "batch").lower()
+INTERACTION_FSYNC_INTERVAL_MS = int(os.getenv("INTERACTION_FSYNC_INTERVAL_MS", "1000"))
+
+FSYNC_POLICIES = ("never", "batch", "interval")
+
+_ADD = "add"
+_ADD_MANY = "add_many"
+_UPDATE = "update"
+
+
+class InteractionWriter:
+    """Queued, batched writer for a JSON list of interaction records"""
+
+    def __init__(
+        self,
+        path: str,
+        batch_size: int = INTERACTION_BATCH_SIZE,
+        flush_interval_ms: int = INTERACTION_FLUSH_INTERVAL_MS,
+        queue_size: int = INTERACTION_QUEUE_SIZE,
+        enqueue_timeout_ms: int = INTERACTION_ENQUEUE_TIMEOUT_MS,
+        fsync: str = INTERACTION_FSYNC,
+        fsync_interval_ms: int = INTERACTION_FSYNC_INTERVAL_MS,
+        on_write: Callable[[List[Dict]], None] = None
+    ):
+        """
+        Args:
+            path: interactions.json path
+            batch_size: Operations that trigger a flush
+            flush_interval_ms: Longest an operation waits for its flush
+            queue_size: Operations held before enqueues are rejected
+            enqueue_timeout_ms: How long an enqueue waits for room in a full queue
+            fsync: never, batch or interval (see FSYNC_POLICIES)
+            fsync_interval_ms: Minimum time between fsyncs for the interval policy
+            on_write: Called with the records added by each successful flush
+        """
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"INTERACTION_FSYNC must be one of {', '.join(FSYNC_POLICIES)}, got {fsync!r}")
+        self.path = path
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval_ms / 1000
+        self.enqueue_timeout = enqueue_timeout_ms / 1000
+        self.fsync = fsync
+        self.fsync_interval = fsync_interval_ms / 1000
+        self.on_write = on_write
+
+        self.queue_size = max(1, queue_size)
+        self._queue: Deque[Tuple[str, Any, float]] = deque()
+        # Guards _queue and _collecting; moving ops between them and _pending is atomic, so
+        # flush() sees every op whichever stage it is in
+        self._queue_cond = threading.Condition()
+        self._collecting: List[Tuple[str, Any, float]] = []  # Taken by the background thread for its next batch
+        self._pending: List[Tuple[str, Any, float]] = []  # Taken from the queue, not yet on disk
+        self._write_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self._last_fsync = 0.0
+        self._counts = {
+            "enqueued": 0, "rejected": 0, "records_written": 0, "updates_applied": 0, "updates_missed": 0,
+            "batches": 0, "write_errors": 0, "fsyncs": 0, "max_queue_depth": 0,
+        }
+        self._flush_ms = {"total": 0.0, "max": 0.0}
+        self._lag_ms = {"total": 0.0, "max": 0.0, "ops": 0}
+        self._last_flush: Optional[float] = None
+
+    # ---------------- Enqueue (request threads) ----------------
+
+    def add(self, record: Dict) -> bool:
+        """
+        Queue a new interaction record
+
+        Returns:
+            False when the queue stayed full for enqueue_timeout (the caller must not
+            acknowledge the record)
+        """
+        return self._enqueue(_ADD, record)
+
+    def add_many(self, records: List[Dict]) -> bool:
+        """
+        Queue several records as one operation: they take a single queue slot and are
+        written by the same flush, and are either all accepted or all rejected
+        """
+        return self._enqueue(_ADD_MANY, list(records)) if records else True
+
+    def update(self, record_id: str, fields: Dict) -> bool:
+        """Queue a field update for an existing (or still queued) record"""
+        return self._enqueue(_UPDATE, (record_id, fields))
+
+    def _enqueue(self, op: str, payload: Any) -> bool:
+        if self._stop.is_set():
+            raise RuntimeError("Interaction writer is closed")
+        self._ensure_started()
+        with self._queue_cond:
+            if not self._queue_cond.wait_for(lambda: len(self._queue) < self.queue_size, self.enqueue_timeout):
+                with self._stats_lock:
+                    self._counts["rejected"] += 1
+                return False
+            self._queue.append((op, payload, time.monotonic()))
+            depth = len(self._queue)
+            self._queue_cond.notify_all()
+        with self._stats_lock:
+            self._counts["enqueued"] += 1
+            self._counts["max_queue_depth"] = max(self._counts["max_queue_depth"], depth)
+        return True
+
+    def _ensure_started(self):
+        if self._thread is not None:
+            return
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="interaction-writer", daemon=True)
+                self._thread.start()
+
+    # ---------------- Background flushing ----------------
+
+    def _collect(self):
+        """Wait for the first operation, then collect until batch_size or its flush deadline"""
+        with self._queue_cond:
+            if not self._queue_cond.wait_for(lambda: self._queue, self.flush_interval):
+                return
+            deadline = self._queue[0][2] + self.flush_interval
+            while True:
+                while self._queue and len(self._collecting) < self.batch_size:
+                    self._collecting.append(self._queue.popleft())
+                self._queue_cond.notify_all()  # Room for waiting enqueues
+                remaining = deadline - time.monotonic()
+                # An empty batch here means flush() took it
+                if len(self._collecting) >= self.batch_size or remaining <= 0 or not self._collecting:
+                    return
+                self._queue_cond.wait_for(lambda: self._queue or not self._collecting, remaining)
+
+    def _take(self, queued: bool):
+        """Move the collected batch (and with queued, the whole queue) to _pending; caller holds _write_lock"""
+        with self._queue_cond:
+            self._pending.extend(self._collecting)
+            self._collecting = []
+            if queued:
+                self._pending.extend(self._queue)
+                self._queue.clear()
+                self._queue_cond.notify_all()
+
+    def _run(self):
+        while not self._stop.is_set():
+            # While a failed batch is waiting for its retry, leave the queue alone so it
+            # fills up and pushes back on callers instead of growing _pending
+            if not self._pending:
+                self._collect()
+            with self._write_lock:
+                self._take(queued=False)
+                written = self._write_pending() if self._pending else True
+            if not written:
+                self._stop.wait(self.flush_interval)  # Disk trouble: retry the same batch later
+
+    def flush(self) -> bool:
+        """
+        Write everything queued so far, on the calling thread (including the batch the
+        background thread is collecting); False if the write failed
+        """
+        with self._write_lock:
+            self._take(queued=True)
+            return self._write_pending() if self._pending else True
+
+    def close(self, timeout: float = 10.0) -> bool:
+        """Stop the background thread and flush what is left (registered to run at exit)"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        flushed = self.flush()
+        if not flushed:
+            print(f"❌ {len(self._pending)} interaction update(s) could not be written to {self.path}")
+        return flushed
+
+    def _write_pending(self) -> bool:
+        """Apply self._pending to the file (caller holds _write_lock); keeps the batch on failure"""
+        ops = self._pending
+        started = time.monotonic()
+        try:
+            with file_lock(self.path):
+                records, added, applied, missed = self._apply(read_json(self.path, [], for_update=True), ops)
+                self._save(records)
+        except Exception as e:
+            with self._stats_lock:
+                self._counts["write_errors"] += 1
+            print(f"Error writing interactions: {e}")
+            return False
+
+        self._pending = []
+        finished = time.monotonic()
+        elapsed = (finished - started) * 1000
+        lags = [(finished - enqueued) * 1000 for _, _, enqueued in ops]
+        with self._stats_lock:
+            self._counts["batches"] += 1
+            self._counts["records_written"] += added
+            self._counts["updates_applied"] += applied
+            self._counts["updates_missed"] += missed
+            self._flush_ms["total"] += elapsed
+            self._flush_ms["max"] = max(self._flush_ms["max"], elapsed)
+            self._lag_ms["total"] += sum(lags)
+            self._lag_ms["max"] = max(self._lag_ms["max"], max(lags))
+            self._lag_ms["ops"] += len(lags)
+            self._last_flush = finished
+        if self.on_write is not None and added:
+            try:
+                self.on_write([record for op, payload, _ in ops if op != _UPDATE
+                               for record in (payload if op == _ADD_MANY else [payload])])
+            except Exception as e:
+                print(f"Error in interaction write listener: {e}")
+        return True
+
+    @staticmethod
+    def _apply(records: List[Dict], ops: List[Tuple[str, Any, float]]) -> Tuple[List[Dict], int, int, int]:
+        index: Optional[Dict[str, Dict]] = None
+        added = applied = missed = 0
+        for op, payload, _ in ops:
+            if op in (_ADD, _ADD_MANY):
+                new_records = payload if op == _ADD_MANY else [payload]
+                records.extend(new_records)
+                if index is not None:
+                    index.update((record.get("id"), record) for record in new_records)
+                added += len(new_records)
+            else:
+                if index is None:
+                    index = {record.get("id"): record for record in records}
+                record_id, fields = payload
+                record = index.get(record_id)
+                if record is None:
+                    missed += 1
+                else:
+                    record.update(fields)
+                    applied += 1
+        return records, added, applied, missed
+
+    def _save(self, records: List[Dict]):
+        """Atomic rewrite through the data cache, fsynced per the fsync policy"""
+        now = time.monotonic()
+        sync = self.fsync == "batch" or (self.fsync == "interval" and now - self._last_fsync >= self.fsync_interval)
+        write_json(self.path, records, fsync=sync)
+        if sync:
+            self._last_fsync = now
+            with self._stats_lock:
+                self._counts["fsyncs"] += 1
+
+    # ---------------- Metrics ----------------
+
+    def stats(self) -> Dict:
+        """Queue depth and capacity, rejected enqueues, batch sizes, flush times and write lag"""
+        with self._stats_lock:
+            batches = self._counts["batches"]
+            lag_ops = self._lag_ms["ops"]
+            return {
+                "queue_depth": len(self._queue),
+                "queue_capacity": self.queue_size,
+                "in_flight": len(self._pending) + len(self._collecting),
+                **self._counts,
+                "avg_batch": round((self._counts["records_written"] + self._counts["updates_applied"]
+                                    + self._counts["updates_missed"]) / batches, 1) if batches else 0,
+                "avg_flush_ms": round(self._flush_ms["total"] / batches, 2) if batches else 0,
+                "max_flush_ms": round(self._flush_ms["max"], 2),
+                "avg_lag_ms": round(self._lag_ms["total"] / lag_ops, 2) if lag_ops else 0,
+                "max_lag_ms": round(self._lag_ms["max"], 2),
+                "last_flush_age_s": round(time.monotonic() - self._last_flush, 2) if self._last_flush else None,
+                "fsync": self.fsync,
+                "batch_size": self.batch_size,
+                "flush_interval_ms": round(self.flush_interval * 1000),
+            }
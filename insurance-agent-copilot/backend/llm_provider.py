@@ -0,0 +1,72 @@
+"""
+LLM Provider Selection
+Creates the chat models used by both backends based on LLM_PROVIDER (gemini | fake)
+"""
+
+import os
+
+
+def get_llm_provider() -> str:
+    """Return the configured LLM provider name"""
+    return os.getenv("LLM_PROVIDER", "gemini").strip().lower()
+
+
+def is_fake_llm() -> bool:
+    """True when the offline scripted model is selected"""
+    return get_llm_provider() == "fake"
+
+
+def require_llm_config() -> str:
+    """
+    Validate provider configuration at startup
+
+    Returns:
+        The provider name
+
+    Raises:
+        ValueError: If Gemini is selected but GEMINI_API_KEY is missing
+    """
+    provider = get_llm_provider()
+    if provider not in ("gemini", "fake"):
+        raise ValueError(f"Unknown LLM_PROVIDER '{provider}' (expected 'gemini' or 'fake')")
+    if provider == "gemini" and not os.getenv("GEMINI_API_KEY"):
+        raise ValueError("GEMINI_API_KEY not found in environment variables (set LLM_PROVIDER=fake to run offline)")
+    return provider
+
+
+def create_chat_model(model: str, temperature: float = 0, **kwargs):
+    """
+    Create a LangChain chat model for the configured provider
+
+    Args:
+        model: Gemini model name (ignored by the fake provider)
+        temperature: Sampling temperature
+        **kwargs: Extra ChatGoogleGenerativeAI options
+
+    Returns:
+        ChatGoogleGenerativeAI or FakeChatModel
+    """
+    if is_fake_llm():
+        from fake_llm import FakeChatModel
+        return FakeChatModel(model_name=f"fake-{model}")
+
+    from langchain_google_genai import ChatGoogleGenerativeAI
+    return ChatGoogleGenerativeAI(model=model, temperature=temperature, **kwargs)
+
+
+def create_crew_llm(chat_model):
+    """
+    Return the LLM handed to CrewAI agents
+
+    Args:
+        chat_model: Model returned by create_chat_model
+
+    Returns:
+        chat_model for Gemini, or a FakeCrewLLM speaking CrewAI's ReAct format
+    """
+    if is_fake_llm():
+        from fake_llm import FakeCrewLLM
+        if FakeCrewLLM is None:
+            raise ImportError("crewai is required for the fake CrewAI LLM")
+        return FakeCrewLLM()
+    return chat_model
@@ -0,0 +1,103 @@
+"""
+Message Drafts
+Reply drafts for inbound lead messages and the Communication Hub (template based, no LLM).
+The text comes from the compiled draft templates (draft_templates.py).
+"""
+
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+from draft_templates import draft_templates, lead_values
+
+REPLY_SLOTS = ("reply.whatsapp", "reply.email.subject", "reply.email")
+LEAD_SLOTS = ("lead.whatsapp", "lead.email.subject", "lead.email")
+
+
+def _stamp() -> int:
+    return int(datetime.now().timestamp() * 1000)
+
+def _draft_id(kind: str, lead_id: Optional[str] = None, stamp: Optional[int] = None) -> str:
+    stamp = stamp or _stamp()
+    return f"draft-{kind}-{lead_id}-{stamp}" if lead_id else f"draft-{kind}-{stamp}"
+
+
+def generate_ai_drafts(message):
+    """Generate AI draft responses"""
+    text = draft_templates.render_lead(REPLY_SLOTS, {})
+    drafts = []
+    
+    # WhatsApp draft
+    if message['type'] in ['whatsapp', 'sms']:
+        drafts.append({
+            'id': _draft_id('wa'),
+            'type': 'whatsapp',
+            'content': text['reply.whatsapp'],
+            'tone': 'friendly',
+            'confidence': 0.85,
+            'reasoning': 'Friendly response that acknowledges their interest and suggests next steps.'
+        })
+    
+    # Email draft
+    drafts.append({
+        'id': _draft_id('email'),
+        'type': 'email',
+        'subject': text['reply.email.subject'],
+        'content': text['reply.email'],
+        'tone': 'professional',
+        'confidence': 0.90,
+        'reasoning': 'Professional email response that provides structure while encouraging engagement.'
+    })
+    
+    return drafts
+
+def _lead_drafts(text: Dict[str, str], lead_id: Optional[str] = None, stamp: Optional[int] = None) -> List[Dict]:
+    return [
+        {
+            'id': _draft_id('wa', lead_id, stamp),
+            'type': 'whatsapp',
+            'content': text['lead.whatsapp'],
+            'tone': 'friendly',
+            'confidence': 0.88,
+            'reasoning': 'Personalized WhatsApp message based on lead profile and recent interactions.'
+        },
+        {
+            'id': _draft_id('email', lead_id, stamp),
+            'type': 'email',
+            'subject': text['lead.email.subject'],
+            'content': text['lead.email'],
+            'tone': 'professional',
+            'confidence': 0.92,
+            'reasoning': 'Comprehensive email with product recommendations based on lead analysis.'
+        }
+    ]
+
+def generate_lead_drafts(lead_info, context, template_id: Optional[str] = None):
+    """
+    WhatsApp and email drafts personalised from a lead's profile
+    
+    Args:
+        lead_info: Lead record (or the subset the client has)
+        context: Message context (not used by the templates yet)
+        template_id: Also render this templates.json template for the lead
+    """
+    drafts = _lead_drafts(draft_templates.render_lead(LEAD_SLOTS, lead_info))
+    if template_id:
+        template = draft_templates.template(template_id)
+        if template is not None:
+            drafts.append({
+                'id': _draft_id('tmpl'),
+                'type': 'template',
+                'templateId': template_id,
+                'content': template.render(lead_values(lead_info, template.fields)),
+                'tone': 'approved template',
+                'confidence': 0.95,
+                'reasoning': 'Approved template filled in from the lead profile.'
+            })
+    return drafts
+
+def generate_bulk_lead_drafts(leads: Iterable[Dict]) -> Dict[str, List[Dict]]:
+    """generate_lead_drafts for many leads at once (lead id -> drafts)"""
+    leads = list(leads)
+    rendered = draft_templates.render_bulk(LEAD_SLOTS, leads)
+    stamp = _stamp()
+    return {lead['id']: _lead_drafts(text, lead['id'], stamp) for lead, text in zip(leads, rendered)}
@@ -0,0 +1,167 @@
+"""
+Message Events
+Push channel for inbound messages. Each subscriber (one SSE connection) gets a bounded
+asyncio queue and is indexed by the leads and users it follows, so publishing touches
+only the interested connections. A subscriber that lets its queue fill up is dropped
+with a final "dropped" event and reconnects (and re-reads /api/messages/<lead_id>)
+instead of holding back the publisher or growing without bound. Idle connections cost
+one queue and one waiting coroutine, plus a heartbeat comment every
+MESSAGE_EVENTS_HEARTBEAT_SECONDS.
+"""
+
+import asyncio
+import itertools
+import json
+import os
+from typing import AsyncIterator, Dict, Iterable, Optional, Set
+
+MESSAGE_EVENTS_QUEUE_SIZE = int(os.getenv("MESSAGE_EVENTS_QUEUE_SIZE", "100"))
+MESSAGE_EVENTS_HEARTBEAT_SECONDS = float(os.getenv("MESSAGE_EVENTS_HEARTBEAT_SECONDS", "15"))
+MESSAGE_EVENTS_MAX_SUBSCRIBERS = int(os.getenv("MESSAGE_EVENTS_MAX_SUBSCRIBERS", "10000"))
+
+_DROPPED = object()  # Queued in place of the backlog when a subscriber is dropped
+
+
+class Subscriber:
+    """One push connection and the leads/users it follows (none = everything)"""
+
+    def __init__(self, sub_id: int, lead_ids: Set[str], user_ids: Set[str], queue_size: int):
+        self.id = sub_id
+        self.lead_ids = lead_ids
+        self.user_ids = user_ids
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.dropped = False
+
+    @property
+    def follows_all(self) -> bool:
+        return not self.lead_ids and not self.user_ids
+
+
+class MessageEventBroker:
+    """Fans message events out to subscribers; publish is called on the event loop"""
+
+    def __init__(
+        self,
+        queue_size: int = MESSAGE_EVENTS_QUEUE_SIZE,
+        heartbeat_seconds: float = MESSAGE_EVENTS_HEARTBEAT_SECONDS,
+        max_subscribers: int = MESSAGE_EVENTS_MAX_SUBSCRIBERS
+    ):
+        """
+        Args:
+            queue_size: Events buffered per subscriber before it is dropped
+            heartbeat_seconds: Idle time before a keep-alive comment is sent
+            max_subscribers: Open connections allowed at once
+        """
+        self.queue_size = max(1, queue_size)
+        self.heartbeat = heartbeat_seconds
+        self.max_subscribers = max_subscribers
+        self._ids = itertools.count(1)
+        self._subscribers: Dict[int, Subscriber] = {}
+        self._by_lead: Dict[str, Set[int]] = {}
+        self._by_user: Dict[str, Set[int]] = {}
+        self._all: Set[int] = set()
+        self._counts = {"connected": 0, "refused": 0, "published": 0, "delivered": 0, "dropped": 0}
+
+    # ---------------- Subscriptions ----------------
+
+    @property
+    def follows_users(self) -> bool:
+        """Whether any subscriber follows a user (publishers can skip the lead -> user lookup)"""
+        return bool(self._by_user)
+
+    def subscribe(self, lead_ids: Iterable[str] = (), user_ids: Iterable[str] = ()) -> Optional[Subscriber]:
+        """New subscriber for the given leads/users (none = everything); None when at max_subscribers"""
+        if len(self._subscribers) >= self.max_subscribers:
+            self._counts["refused"] += 1
+            return None
+        subscriber = Subscriber(next(self._ids), set(lead_ids), set(user_ids), self.queue_size)
+        self._subscribers[subscriber.id] = subscriber
+        if subscriber.follows_all:
+            self._all.add(subscriber.id)
+        for lead_id in subscriber.lead_ids:
+            self._by_lead.setdefault(lead_id, set()).add(subscriber.id)
+        for user_id in subscriber.user_ids:
+            self._by_user.setdefault(user_id, set()).add(subscriber.id)
+        self._counts["connected"] += 1
+        return subscriber
+
+    def unsubscribe(self, subscriber: Subscriber):
+        if self._subscribers.pop(subscriber.id, None) is None:
+            return
+        self._all.discard(subscriber.id)
+        for index, keys in ((self._by_lead, subscriber.lead_ids), (self._by_user, subscriber.user_ids)):
+            for key in keys:
+                ids = index.get(key)
+                if ids is not None:
+                    ids.discard(subscriber.id)
+                    if not ids:
+                        del index[key]
+
+    # ---------------- Publishing ----------------
+
+    def publish(self, event: Dict, lead_id: str, user_id: Optional[str] = None) -> int:
+        """
+        Queue an event for everyone following the lead, its assigned user or everything
+
+        Returns:
+            Number of subscribers it was queued for
+        """
+        targets = set(self._all)
+        targets.update(self._by_lead.get(lead_id, ()))
+        if user_id:
+            targets.update(self._by_user.get(user_id, ()))
+        self._counts["published"] += 1
+        if not targets:
+            return 0
+
+        data = f"data: {json.dumps(event)}\n\n"  # Encoded once for every subscriber
+        delivered = 0
+        for sub_id in targets:
+            subscriber = self._subscribers.get(sub_id)
+            if subscriber is None or subscriber.dropped:
+                continue
+            try:
+                subscriber.queue.put_nowait(data)
+                delivered += 1
+            except asyncio.QueueFull:
+                self._drop(subscriber)
+        self._counts["delivered"] += delivered
+        return delivered
+
+    def _drop(self, subscriber: Subscriber):
+        """Slow consumer: discard its backlog and end its stream"""
+        subscriber.dropped = True
+        while not subscriber.queue.empty():
+            subscriber.queue.get_nowait()
+        subscriber.queue.put_nowait(_DROPPED)
+        self.unsubscribe(subscriber)
+        self._counts["dropped"] += 1
+
+    # ---------------- Streaming ----------------
+
+    async def stream(self, subscriber: Subscriber) -> AsyncIterator[str]:
+        """SSE lines for one subscriber; unsubscribes when the client goes away"""
+        try:
+            yield f"data: {json.dumps({'type': 'subscribed', 'leadIds': sorted(subscriber.lead_ids), 'userIds': sorted(subscriber.user_ids)})}\n\n"
+            while True:
+                try:
+                    item = await asyncio.wait_for(subscriber.queue.get(), timeout=self.heartbeat)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                if item is _DROPPED:
+                    yield f"data: {json.dumps({'type': 'dropped', 'reason': 'slow consumer'})}\n\n"
+                    return
+                yield item
+        finally:
+            self.unsubscribe(subscriber)
+
+    def stats(self) -> Dict:
+        return {
+            "subscribers": len(self._subscribers),
+            "leads_followed": len(self._by_lead),
+            "users_followed": len(self._by_user),
+            "max_subscribers": self.max_subscribers,
+            "queue_size": self.queue_size,
+            **self._counts,
+        }
@@ -0,0 +1,107 @@
+"""
+Message Ingest
+Helpers for accepting gateway deliveries: collision-free, monotonic message ids and a
+bounded idempotency window, so a burst of messages gets distinct ids and a gateway retry
+of a message that was already accepted is answered with the original instead of being
+stored twice.
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional, Tuple
+
+MESSAGE_DEDUP_WINDOW = int(os.getenv("MESSAGE_DEDUP_WINDOW", "50000"))
+MESSAGE_DEDUP_TTL_SECONDS = int(os.getenv("MESSAGE_DEDUP_TTL_SECONDS", "86400"))
+
+
+class MessageIds:
+    """
+    Monotonic ids of the form {prefix}-{ms timestamp}-{sequence}
+
+    The sequence restarts when the millisecond advances; if the clock stands still or
+    steps back, the last timestamp is reused and the sequence keeps counting, so ids are
+    unique and increasing within the process.
+    """
+
+    def __init__(self, prefix: str = "msg"):
+        self.prefix = prefix
+        self._last_ms = 0
+        self._seq = 0
+        self._lock = threading.Lock()
+
+    def next(self) -> str:
+        now_ms = int(time.time() * 1000)
+        with self._lock:
+            if now_ms > self._last_ms:
+                self._last_ms, self._seq = now_ms, 0
+            else:
+                self._seq += 1
+            return f"{self.prefix}-{self._last_ms}-{self._seq}"
+
+
+class IdempotencyWindow:
+    """
+    Remembers the message accepted for each idempotency key, for the most recent
+    max_keys keys and at most ttl_seconds
+    """
+
+    def __init__(self, max_keys: int = MESSAGE_DEDUP_WINDOW, ttl_seconds: int = MESSAGE_DEDUP_TTL_SECONDS):
+        """
+        Args:
+            max_keys: Keys remembered; the oldest are forgotten first
+            ttl_seconds: How long a key is remembered
+        """
+        self.max_keys = max(1, max_keys)
+        self.ttl = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, Dict]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._counts = {"claimed": 0, "duplicates": 0, "released": 0, "evicted": 0, "expired": 0}
+
+    def claim(self, key: str, message: Dict) -> Optional[Dict]:
+        """
+        Claim a key for a message about to be accepted
+
+        Returns:
+            None if the key is new (it now maps to message), otherwise the message
+            already accepted under it
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._expire(now)
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._counts["duplicates"] += 1
+                return entry[1]
+            self._entries[key] = (now, message)
+            self._counts["claimed"] += 1
+            while len(self._entries) > self.max_keys:
+                self._entries.popitem(last=False)
+                self._counts["evicted"] += 1
+        return None
+
+    def release(self, keys: Iterable[str]):
+        """Forget keys whose messages were not accepted after all (so a retry goes through)"""
+        with self._lock:
+            for key in keys:
+                if self._entries.pop(key, None) is not None:
+                    self._counts["released"] += 1
+
+    def _expire(self, now: float):
+        # Insertion order is claim order, so expired keys are at the front
+        while self._entries:
+            claimed_at = next(iter(self._entries.values()))[0]
+            if now - claimed_at < self.ttl:
+                break
+            self._entries.popitem(last=False)
+            self._counts["expired"] += 1
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                "keys": len(self._entries),
+                "max_keys": self.max_keys,
+                "ttl_seconds": self.ttl,
+                **self._counts,
+            }
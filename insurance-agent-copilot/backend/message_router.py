@@ -0,0 +1,363 @@
+"""
+Message Router
+Async FastAPI routes for inbound lead messages, their push channel (SSE) and reply
+drafts. Mounted by main.py and crewai_main.py, and served on its own by message_api.py.
+Interactions are persisted through the shared data layer (tools.data_cache, under the
+interactions file lock), so the interaction tools and message ingest in one process
+never overwrite each other.
+"""
+
+import atexit
+import json
+import os
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from fastapi import APIRouter, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+from interaction_writer import InteractionWriter
+from draft_templates import draft_templates
+from message_drafts import generate_ai_drafts, generate_bulk_lead_drafts, generate_lead_drafts
+from message_events import MessageEventBroker
+from message_ingest import IdempotencyWindow, MessageIds
+from message_store import MessageStore
+from tools import interactions, lead_versions
+from tools.leads import get_all_leads, get_lead
+from tools.async_tools import run_io
+
+MESSAGE_BATCH_MAX = int(os.getenv("MESSAGE_BATCH_MAX", "5000"))
+NDJSON_TYPES = ("application/x-ndjson", "application/ndjson", "application/jsonl")
+
+router = APIRouter()
+
+
+def _error(status_code: int, error: str, headers: Optional[Dict] = None) -> JSONResponse:
+    return JSONResponse({"success": False, "error": error}, status_code=status_code, headers=headers)
+
+
+def _queue_full() -> JSONResponse:
+    return _error(503, "Message queue is full, retry later", {"Retry-After": "1"})
+
+
+async def _json_body(request: Request):
+    try:
+        return await request.json()
+    except ValueError:
+        return None
+
+
+@router.post("/api/messages/receive")
+async def receive_message(request: Request):
+    """
+    Endpoint to receive new messages from leads
+    Test with Postman:
+    POST http://localhost:5001/api/messages/receive
+    Body: {
+        "leadId": "lead-1",
+        "content": "Hi, I'm interested in term insurance. Can you help me?",
+        "type": "whatsapp",
+        "idempotencyKey": "gateway-msg-123"  (optional, or an Idempotency-Key header)
+    }
+    """
+    data = await _json_body(request)
+    if not valid_message(data):
+        return _error(400, "leadId and content are required")
+
+    new_message = build_message(data)
+
+    # A retried delivery gets the message accepted the first time
+    key = data.get("idempotencyKey") or request.headers.get("Idempotency-Key")
+    if key:
+        existing = dedup.claim(str(key), new_message)
+        if existing is not None:
+            return {"success": True, "duplicate": True, "message": existing}
+
+    # Queue the interaction write; only acknowledge what the writer accepted
+    # (off the event loop: a full queue makes the enqueue wait)
+    if not await run_io(interaction_writer.add, interaction_record(new_message)):
+        if key:
+            dedup.release([str(key)])
+        return _queue_full()
+
+    messages.add(new_message)
+    publish_messages([new_message])
+
+    return {
+        "success": True,
+        "message": new_message,
+        "aiDrafts": generate_ai_drafts(new_message)
+    }
+
+
+@router.post("/api/messages/receive/batch")
+async def receive_messages_batch(request: Request):
+    """
+    Endpoint for gateways delivering messages in bulk
+    POST http://localhost:5001/api/messages/receive/batch
+    Body: a JSON array (or {"messages": [...]}) of /receive bodies, or NDJSON
+    (Content-Type: application/x-ndjson) with one body per line. Each message should
+    carry an idempotencyKey so a retried batch only stores what is new.
+
+    Accepted messages are persisted together (one queued write for the whole batch);
+    if the writer queue is full nothing is accepted and the batch can be retried as is.
+    No AI drafts are generated here.
+    """
+    items, error = await parse_batch(request)
+    if error:
+        return _error(400, error)
+    if len(items) > MESSAGE_BATCH_MAX:
+        return _error(413, f"At most {MESSAGE_BATCH_MAX} messages per batch")
+
+    results = []
+    accepted = []
+    claimed_keys = []
+    for index, item in enumerate(items):
+        if not valid_message(item):
+            results.append({"index": index, "status": "invalid", "error": "leadId and content are required"})
+            continue
+        new_message = build_message(item)
+        key = item.get("idempotencyKey")
+        if key:
+            existing = dedup.claim(str(key), new_message)
+            if existing is not None:
+                results.append({"index": index, "status": "duplicate", "id": existing["id"]})
+                continue
+            claimed_keys.append(str(key))
+        accepted.append(new_message)
+        results.append({"index": index, "status": "accepted", "id": new_message["id"]})
+
+    if not await run_io(interaction_writer.add_many, [interaction_record(m) for m in accepted]):
+        dedup.release(claimed_keys)
+        return _queue_full()
+
+    for new_message in accepted:
+        messages.add(new_message)
+    publish_messages(accepted)
+
+    counts = {"accepted": 0, "duplicate": 0, "invalid": 0}
+    for result in results:
+        counts[result["status"]] += 1
+
+    return {"success": True, **counts, "results": results}
+
+
+async def parse_batch(request: Request) -> Tuple[Optional[List], Optional[str]]:
+    """Read a batch body as a list of message dicts; returns (items, error)"""
+    content_type = request.headers.get("content-type", "").split(";")[0].strip()
+    body = await request.body()
+    if content_type in NDJSON_TYPES:
+        items = []
+        for line in body.decode("utf-8").splitlines():
+            if not line.strip():
+                continue
+            try:
+                items.append(json.loads(line))
+            except ValueError:
+                items.append(None)  # Reported as invalid at its index
+        return items, None
+
+    try:
+        data = json.loads(body)
+    except ValueError:
+        data = None
+    if isinstance(data, dict):
+        data = data.get("messages")
+    if not isinstance(data, list):
+        return None, 'Expected a JSON array of messages, {"messages": [...]} or NDJSON'
+    return data, None
+
+
+@router.get("/api/messages/events")
+async def message_events(leadId: Optional[str] = None, userId: Optional[str] = None):
+    """
+    Server-Sent Events for new messages and unread counts
+    GET http://localhost:5001/api/messages/events?leadId=lead-1,lead-2&userId=user-1
+    (comma-separated; with neither, every lead's events are sent)
+    
+    Events (as `data:` JSON):
+        {"type": "messages", "leadId", "messages": [...], "unread"}  new messages for a lead
+        {"type": "unread", "leadId", "unread"}                        after mark-read
+        {"type": "dropped"}  the connection fell too far behind and is closed; reconnect
+                             and re-read /api/messages/<lead_id>
+    """
+    subscriber = events.subscribe(_split(leadId), _split(userId))
+    if subscriber is None:
+        return _error(503, "Too many event subscribers, retry later", {"Retry-After": "5"})
+    return StreamingResponse(
+        events.stream(subscriber),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+def _split(value: Optional[str]) -> List[str]:
+    return [part.strip() for part in value.split(",") if part.strip()] if value else []
+
+
+@router.get("/api/messages/stats")
+async def message_stats():
+    """In-memory store sizes, interaction writer queue/backpressure, dedup window, push channel and draft template metrics"""
+    return {
+        "success": True,
+        "store": messages.stats(),
+        "writer": interaction_writer.stats(),
+        "dedup": dedup.stats(),
+        "events": events.stats(),
+        "drafts": draft_templates.stats()
+    }
+
+
+@router.get("/api/messages/{lead_id}")
+async def get_messages(lead_id: str):
+    """Get a lead's recent messages (older ones are in the interaction history)"""
+    return {
+        "success": True,
+        "messages": messages.for_lead(lead_id),
+        "unread": messages.unread_count(lead_id)
+    }
+
+
+@router.post("/api/messages/mark-read")
+async def mark_messages_read(request: Request):
+    """Mark messages as read"""
+    data = await _json_body(request)
+    if not isinstance(data, dict):
+        return _error(400, "messageIds is required")
+
+    message_ids = data.get("messageIds", [])
+    if not isinstance(message_ids, list) or not all(isinstance(m, str) for m in message_ids):
+        return _error(400, "messageIds must be a list of message ids")
+    lead_ids = {m["leadId"] for m in map(messages.get, message_ids) if m is not None}
+    updated = messages.mark_read(message_ids)
+    if updated:
+        for lead_id in lead_ids:
+            publish(lead_id, {"type": "unread", "leadId": lead_id, "unread": messages.unread_count(lead_id)})
+
+    return {"success": True, "updated": updated}
+
+
+@router.post("/api/ai/drafts")
+async def generate_drafts(request: Request):
+    """
+    Generate AI drafts for communication
+    Body: {"leadInfo": {...}, "messageContext": "...", "templateId": "tmpl-1" (optional)}
+    """
+    data = await _json_body(request)
+    if not isinstance(data, dict):
+        data = {}
+    lead_info = data.get("leadInfo")
+    if not isinstance(lead_info, dict):
+        lead_info = {}
+    template_id = data.get("templateId")
+    if not isinstance(template_id, str):
+        template_id = None
+    drafts = generate_lead_drafts(lead_info, data.get("messageContext", ""), template_id)
+    return {"success": True, "drafts": drafts}
+
+
+@router.post("/api/ai/drafts/bulk")
+async def generate_drafts_bulk(request: Request):
+    """
+    Personalised drafts for many leads in one call
+    Body: {"leadIds": ["lead-1", "lead-2", ...]}
+    Returns drafts per lead id (unknown ids are listed under "missing")
+    """
+    data = await _json_body(request)
+    lead_ids = data.get("leadIds") if isinstance(data, dict) else None
+    if not isinstance(lead_ids, list):
+        return _error(400, "leadIds is required")
+    if len(lead_ids) > MESSAGE_BATCH_MAX:
+        return _error(413, f"At most {MESSAGE_BATCH_MAX} leads per request")
+
+    leads_by_id = {lead.get("id"): lead for lead in get_all_leads()}
+    found = [leads_by_id[lead_id] for lead_id in dict.fromkeys(lead_ids) if lead_id in leads_by_id]
+    missing = [lead_id for lead_id in lead_ids if lead_id not in leads_by_id]
+    return {"success": True, "drafts": generate_bulk_lead_drafts(found), "missing": missing}
+
+
+def valid_message(data) -> bool:
+    return isinstance(data, dict) and "leadId" in data and "content" in data
+
+
+def build_message(data: Dict) -> Dict:
+    """Message record for a /receive body"""
+    return {
+        "id": id_generator.next(),
+        "leadId": data["leadId"],
+        "type": data.get("type", "whatsapp"),
+        "content": data["content"],
+        "timestamp": datetime.now().isoformat() + "Z",
+        "sender": data.get("sender", "lead"),
+        "isNew": True
+    }
+
+
+def interaction_record(message: Dict) -> Dict:
+    """interactions.json record for a message"""
+    new_interaction = {
+        "id": message["id"],
+        "leadId": message["leadId"],
+        "type": message["type"],
+        "summary": message["content"],
+        "createdAt": message["timestamp"],
+        "isNew": True
+    }
+
+    if message["type"] == "call":
+        new_interaction["duration"] = 300  # 5 minutes
+
+    return new_interaction
+
+
+def spill_to_interactions(message: Dict):
+    """
+    Persist the read state of a message leaving the in-memory store
+    (the interaction itself was queued when the message arrived)
+    """
+    if not message.get("isNew"):
+        interaction_writer.update(message["id"], {"isNew": False})
+
+
+def publish_messages(new_messages: List[Dict]):
+    """Push new messages to their subscribers, one event per lead"""
+    by_lead: Dict[str, List[Dict]] = {}
+    for message in new_messages:
+        by_lead.setdefault(message["leadId"], []).append(message)
+    for lead_id, lead_messages in by_lead.items():
+        publish(lead_id, {
+            "type": "messages",
+            "leadId": lead_id,
+            "messages": lead_messages,
+            "unread": messages.unread_count(lead_id)
+        })
+
+
+def publish(lead_id: str, event: Dict):
+    user_id = None
+    if events.follows_users:
+        lead = get_lead(lead_id)
+        user_id = lead.get("assignedTo") if lead else None
+    events.publish(event, lead_id, user_id)
+
+
+def bump_interaction_versions(records: List[Dict]):
+    """Tell lead-keyed caches (e.g. text analysis) that these leads have new interactions"""
+    for lead_id in {record.get("leadId") for record in records}:
+        if lead_id:
+            lead_versions.bump(lead_versions.INTERACTIONS, lead_id)
+
+
+# interactions.json is written behind the requests, in batches; flushed on shutdown
+interaction_writer = InteractionWriter(interactions.DATA_PATH, on_write=bump_interaction_versions)
+atexit.register(interaction_writer.close)
+
+# Recent messages per lead in memory; older ones spill to the interaction store
+messages = MessageStore(spill=spill_to_interactions)
+
+# SSE subscribers (per lead, per assigned user or everything)
+events = MessageEventBroker()
+
+# Unique, increasing message ids and the idempotency keys of recently accepted messages
+id_generator = MessageIds()
+dedup = IdempotencyWindow()
@@ -0,0 +1,105 @@
+"""
+Message Store
+Bounded in-memory store for inbound lead messages. Each lead keeps its most recent
+messages in a ring buffer, an id index makes lookups and mark-read O(1) per id, and
+unread counters are kept per lead. Messages pushed out of a full buffer are handed to a
+spill callback (the persistent interaction store) instead of being kept forever.
+"""
+
+import os
+import threading
+from collections import deque
+from typing import Callable, Deque, Dict, Iterable, List, Optional
+
+MESSAGE_STORE_PER_LEAD = int(os.getenv("MESSAGE_STORE_PER_LEAD", "100"))
+
+
+class MessageStore:
+    """Per-lead ring buffers of messages with an id index and unread counters"""
+
+    def __init__(self, max_per_lead: int = MESSAGE_STORE_PER_LEAD, spill: Callable[[Dict], None] = None):
+        """
+        Args:
+            max_per_lead: Messages kept in memory per lead; older ones are spilled
+            spill: Called with each message pushed out of a lead's buffer
+        """
+        self.max_per_lead = max(1, max_per_lead)
+        self.spill = spill
+        self._by_lead: Dict[str, Deque[Dict]] = {}
+        self._index: Dict[str, Dict] = {}
+        self._unread: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._counts = {"added": 0, "spilled": 0, "spill_errors": 0}
+
+    def add(self, message: Dict):
+        """Store a message (needs id and leadId; isNew marks it unread)"""
+        lead_id = message["leadId"]
+        with self._lock:
+            if message["id"] in self._index:
+                return  # Already stored
+            buffer = self._by_lead.setdefault(lead_id, deque())
+            evicted = buffer.popleft() if len(buffer) >= self.max_per_lead else None
+            if evicted is not None:
+                del self._index[evicted["id"]]
+                if evicted.get("isNew"):
+                    self._unread[lead_id] -= 1
+            buffer.append(message)
+            self._index[message["id"]] = message
+            if message.get("isNew"):
+                self._unread[lead_id] = self._unread.get(lead_id, 0) + 1
+            self._counts["added"] += 1
+
+        if evicted is not None:
+            self._spill(evicted)
+
+    def _spill(self, message: Dict):
+        try:
+            if self.spill is not None:
+                self.spill(message)
+            with self._lock:
+                self._counts["spilled"] += 1
+        except Exception as e:
+            with self._lock:
+                self._counts["spill_errors"] += 1
+            print(f"Error spilling message {message.get('id')}: {e}")
+
+    def get(self, message_id: str) -> Optional[Dict]:
+        return self._index.get(message_id)
+
+    def for_lead(self, lead_id: str) -> List[Dict]:
+        """A lead's in-memory messages, oldest first"""
+        with self._lock:
+            return list(self._by_lead.get(lead_id, ()))
+
+    def mark_read(self, message_ids: Iterable[str]) -> int:
+        """
+        Mark messages as read
+
+        Args:
+            message_ids: Message IDs (unknown or already read ones are ignored)
+
+        Returns:
+            Number of messages that were unread
+        """
+        updated = 0
+        with self._lock:
+            for message_id in message_ids:
+                message = self._index.get(message_id)
+                if message is not None and message.get("isNew"):
+                    message["isNew"] = False
+                    self._unread[message["leadId"]] -= 1
+                    updated += 1
+        return updated
+
+    def unread_count(self, lead_id: str) -> int:
+        return self._unread.get(lead_id, 0)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                "leads": len(self._by_lead),
+                "messages": len(self._index),
+                "unread": sum(self._unread.values()),
+                "max_per_lead": self.max_per_lead,
+                **self._counts,
+            }
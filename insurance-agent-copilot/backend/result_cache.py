@@ -0,0 +1,150 @@
+"""
+Result Cache
+Versioned cache for per-lead AI results (text analysis, drafts). Keys carry the lead's
+data and interaction versions, so a result is reused only while neither has changed;
+entries are also dropped as soon as a write tool touches the lead, and expire after a
+TTL. Concurrent requests for the same key share one computation instead of running two
+crews.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from tools import lead_versions
+
+RESULT_CACHE_TTL_SECONDS = float(os.getenv("RESULT_CACHE_TTL_SECONDS", "3600"))
+RESULT_CACHE_SIZE = int(os.getenv("RESULT_CACHE_SIZE", "1024"))
+
+
+def query_hash(*parts: Any) -> str:
+    """Stable short hash of request inputs (query text, client-supplied lead info, ...)"""
+    text = json.dumps(parts, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()[:16]
+
+
+class ResultCache:
+    """LRU + TTL cache keyed on (action, lead id, lead version, interactions version, query hash)"""
+
+    def __init__(self, ttl: float = RESULT_CACHE_TTL_SECONDS, max_entries: int = RESULT_CACHE_SIZE):
+        """
+        Args:
+            ttl: Seconds an entry stays valid (0 disables the cache)
+            max_entries: Entries kept; least recently used are evicted first
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple, Tuple[float, Any]]" = OrderedDict()
+        self._inflight: Dict[Tuple, asyncio.Future] = {}
+        self._lock = threading.Lock()
+        self._counts = {"hits": 0, "misses": 0, "shared": 0, "invalidated": 0, "expired": 0}
+        lead_versions.on_change(self._on_lead_change)
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0 and self.max_entries > 0
+
+    @staticmethod
+    def key(action: str, lead_id: str, *query: Any) -> Tuple:
+        """Cache key for an action on a lead at its current versions"""
+        return (
+            action,
+            lead_id,
+            lead_versions.version(lead_versions.LEAD, lead_id),
+            lead_versions.version(lead_versions.INTERACTIONS, lead_id),
+            query_hash(*query),
+        )
+
+    def get(self, key: Tuple) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._counts["misses"] += 1
+                return None
+            if entry[0] < time.monotonic():
+                del self._entries[key]
+                self._counts["expired"] += 1
+                self._counts["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._counts["hits"] += 1
+            return entry[1]
+
+    def put(self, key: Tuple, value: Any):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    async def get_or_compute(self, key: Tuple, compute: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool]:
+        """
+        Return the cached value or compute it once, even for concurrent callers
+
+        Args:
+            key: Cache key (see key())
+            compute: Coroutine function producing the value; failures are not cached
+
+        Returns:
+            (value, True if it came from the cache or another caller's computation)
+        """
+        if not self.enabled:
+            return await compute(), False
+
+        value = self.get(key)
+        if value is not None:
+            return value, True
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            try:
+                value = await asyncio.shield(inflight)
+                with self._lock:
+                    self._counts["shared"] += 1
+                return value, True
+            except asyncio.CancelledError:
+                if not inflight.cancelled():
+                    raise  # This caller was cancelled
+                # The computing request went away; compute here instead
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await compute()
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # Waiters get it; don't log it as never retrieved
+            raise
+        except BaseException:
+            future.cancel()
+            raise
+        finally:
+            self._inflight.pop(key, None)
+        # A write to the lead during the computation already moved its versions past key
+        self.put(key, value)
+        future.set_result(value)
+        return value, False
+
+    def invalidate_lead(self, lead_id: str) -> int:
+        """Drop every entry for a lead; returns the number removed"""
+        with self._lock:
+            stale = [key for key in self._entries if key[1] == lead_id]
+            for key in stale:
+                del self._entries[key]
+            self._counts["invalidated"] += len(stale)
+        return len(stale)
+
+    def _on_lead_change(self, kind: str, lead_id: str):
+        self.invalidate_lead(lead_id)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {"entries": len(self._entries), "ttl_s": self.ttl, "max_entries": self.max_entries, **self._counts}
+
+
+result_cache = ResultCache()
@@ -0,0 +1,542 @@
+"""
+Tool Catalog
+Every agent tool, registered once in the tool registry: the LangChain agent gets the
+tools below as-is, and the CrewAI agents get the grouped tools declared at the end.
+Importing this module fills tool_registry.registry.
+"""
+
+import json
+from typing import Any, Dict, List, Optional, Union
+
+from llm_provider import create_chat_model
+from tool_registry import registry
+from tool_output import (
+    LEAD_FIELDS, TASK_FIELDS, NOTIFICATION_FIELDS, AUDIT_FIELDS, INTERACTION_FIELDS, POLICY_FIELDS
+)
+from tools.leads import (
+    get_lead, search_leads, update_lead, create_lead, get_all_leads,
+    filter_leads_by_tag, get_renewal_leads, get_followup_leads, get_high_value_leads,
+    get_leads_by_location, get_leads_with_policy
+)
+from tools.compliance import check_compliance
+from tools.templates import get_all_templates, get_template, search_templates
+from tools.interactions import get_lead_interactions, add_interaction, analyze_sentiment
+from tools.tasks import (
+    get_all_tasks, get_task, get_tasks_by_lead, search_tasks,
+    get_tasks_due_today, get_overdue_tasks, get_urgent_tasks
+)
+from tools.actions import (
+    open_lead_profile, open_maps_for_lead, send_message_to_lead, confirm_send_message,
+    call_lead, schedule_meeting, create_task_for_lead, send_template_to_lead,
+    show_create_lead_form, show_create_task_form, show_edit_lead_form
+)
+from tools.notifications import (
+    get_all_notifications, get_unread_notifications, get_unread_count,
+    get_notifications_by_lead, get_high_priority_notifications
+)
+from tools.audit import get_all_audit_logs, get_audit_logs_by_lead, get_audit_logs_by_action, get_ai_actions
+from tools.analytics import (
+    get_conversion_stats, get_revenue_forecast, get_lead_distribution,
+    get_top_leads, get_performance_metrics
+)
+from tools.daily_summary import get_daily_summary, get_todays_briefing, create_tasks_from_action_items
+from tools.formatting import format_response, format_leads_list, format_compliance_result
+from tools.policies import (
+    upload_policy_document, get_lead_policies, get_policy_by_id, get_all_policies,
+    get_policies_by_type, get_expiring_policies, create_policy
+)
+from tools.async_tools import (
+    aget_lead, asearch_leads, aupdate_lead, acreate_lead, aget_all_leads,
+    afilter_leads_by_tag, aget_renewal_leads, aget_followup_leads, aget_high_value_leads,
+    aget_leads_by_location, aget_leads_with_policy,
+    aget_all_templates, aget_template, asearch_templates,
+    aget_lead_interactions, aadd_interaction, aanalyze_sentiment,
+    aget_all_audit_logs, aget_audit_logs_by_lead, aget_audit_logs_by_action, aget_ai_actions,
+    aget_conversion_stats, aget_revenue_forecast, aget_lead_distribution,
+    aget_top_leads, aget_performance_metrics,
+    aget_daily_summary, aget_todays_briefing, acreate_tasks_from_action_items
+)
+
+
+# ------------------------------
+# Adapted tool functions (argument parsing the LLMs need)
+# ------------------------------
+def _json_arg(value: Union[str, Dict, None]) -> Optional[Dict]:
+    """Accept a JSON string (LangChain prompts ask for one) or an already parsed object"""
+    return json.loads(value) if isinstance(value, str) else value
+
+
+def _lead_updates(fields: Dict[str, Any]) -> Dict[str, Any]:
+    return {key: value for key, value in fields.items() if value is not None}
+
+
+def lead_fields() -> Dict:
+    return {
+        "required_fields": {
+            "name": "Lead's full name",
+            "phone": "Phone number with country code (e.g., +91-9876543210)"
+        },
+        "optional_fields": {
+            "email": "Email address",
+            "location": "City, State (e.g., Mumbai, Maharashtra)",
+            "age": "Age in years",
+            "address": "Full address",
+            "product_interest": "Comma-separated products (e.g., Term Life, Health, Investment)",
+            "premium": "Expected premium amount in rupees",
+            "notes": "Initial notes or comments about the lead"
+        },
+        "example": "name='Rajesh Kumar', phone='+91-9876543210', email='rajesh@example.com', location='Mumbai, Maharashtra', product_interest='Term Life, Health', premium=25000"
+    }
+
+
+def task_fields() -> Dict:
+    return {
+        "required_fields": {
+            "title": "Task title/description",
+            "lead_id": "ID of the lead this task is for",
+            "lead_name": "Name of the lead"
+        },
+        "optional_fields": {
+            "description": "Detailed task description",
+            "priority": "Priority level: low, medium, high, urgent (default: medium)",
+            "due_date": "Due date in YYYY-MM-DD format",
+            "tags": "Comma-separated tags (e.g., follow-up, documentation)"
+        },
+        "example": "title='Follow up with lead', lead_id='lead-1', lead_name='Priya Sharma', priority='high', due_date='2024-11-20'"
+    }
+
+
+def update_lead_fields(
+    lead_id: str,
+    temperature: str = None,
+    tags: List[str] = None,
+    notes: str = None,
+    productInterest: List[str] = None,
+    premium: int = None
+) -> Dict:
+    return update_lead(lead_id, **_lead_updates({
+        "temperature": temperature, "tags": tags, "notes": notes,
+        "productInterest": productInterest, "premium": premium
+    }))
+
+
+async def aupdate_lead_fields(lead_id: str, **fields) -> Dict:
+    return await aupdate_lead(lead_id, **_lead_updates(fields))
+
+
+def format_data(data: Union[str, Dict, List], format_type: str = "auto") -> str:
+    try:
+        parsed_data = json.loads(data) if isinstance(data, str) else data
+        if isinstance(parsed_data, dict) and "rows" in parsed_data and "total" in parsed_data:
+            parsed_data = parsed_data["rows"]  # One page of a paged tool result
+        if format_type == "leads":
+            return format_leads_list(parsed_data)
+        if format_type == "compliance":
+            return format_compliance_result(parsed_data)
+        return format_response(parsed_data, format_type)
+    except Exception:
+        return str(data)
+
+
+async def summarize_content(content: str, summary_type: str = "brief") -> str:
+    summarizer = create_chat_model("gemini-1.5-flash", temperature=0)
+
+    if summary_type == "brief":
+        prompt = f"Provide a brief 2-3 sentence summary of this content:\n\n{content}"
+    elif summary_type == "detailed":
+        prompt = f"Provide a detailed summary with key points of this content:\n\n{content}"
+    else:  # bullet_points
+        prompt = f"Summarize this content as bullet points:\n\n{content}"
+
+    response = await summarizer.ainvoke(prompt)
+    return response.content
+
+
+def send_message(
+    lead_id: str, lead_name: str, phone: str, message_type: str = "whatsapp", lead_data: Union[str, Dict] = None
+) -> str:
+    return send_message_to_lead(lead_id, lead_name, phone, message_type, _json_arg(lead_data))
+
+
+def create_lead_form(prefilled_data: Union[str, Dict] = None) -> Dict:
+    return show_create_lead_form(_json_arg(prefilled_data))
+
+
+def edit_lead_form(lead_id: str, lead_data: Union[str, Dict]) -> Dict:
+    return show_edit_lead_form(lead_id, _json_arg(lead_data))
+
+
+# ------------------------------
+# Leads
+# ------------------------------
+registry.register(
+    "tool_get_lead", "Get a lead by ID. Use this when user asks for a specific lead.",
+    func=get_lead, afunc=aget_lead
+)
+registry.register(
+    "tool_search_leads",
+    "Search leads by temperature (hot/warm/cold) or search term. Use this when user asks to find or show leads.",
+    func=search_leads, afunc=asearch_leads, fields=LEAD_FIELDS
+)
+registry.register(
+    "tool_get_all_leads", "Get all leads. Use this when user asks to see all leads.",
+    func=get_all_leads, afunc=aget_all_leads, fields=LEAD_FIELDS
+)
+registry.register(
+    "tool_get_lead_fields",
+    "Get information about what fields are needed to create a new lead.\n"
+    "Use this when user asks \"what do I need to add a lead\" or wants to create a lead.",
+    func=lead_fields
+)
+registry.register(
+    "tool_create_lead",
+    "Create a new lead. Ask user for required fields if not provided.\n\n"
+    "REQUIRED: name, phone\n"
+    "OPTIONAL: email, location, age, address, product_interest (comma-separated), premium, notes\n\n"
+    "Example: name=\"John Doe\", phone=\"+91-9876543210\", location=\"Mumbai\", product_interest=\"Term Life, Health\"",
+    func=create_lead, afunc=acreate_lead, writes=True
+)
+registry.register(
+    "tool_update_lead",
+    "Update a lead's information. Can update: temperature, tags, notes, productInterest, premium.\n\n"
+    "Example: tool_update_lead(lead_id=\"lead-1\", temperature=\"hot\", notes=\"Very interested\")",
+    func=update_lead_fields, afunc=aupdate_lead_fields, writes=True
+)
+registry.register(
+    "tool_get_task_fields",
+    "Get information about what fields are needed to create a new task.\n"
+    "Use this when user asks about creating a task.",
+    func=task_fields
+)
+
+# ------------------------------
+# Compliance, templates and interactions
+# ------------------------------
+registry.register(
+    "tool_check_compliance",
+    "Check if content is IRDAI compliant (returns violations and a safe alternative). "
+    "Use this when user asks about compliance.",
+    func=check_compliance
+)
+registry.register(
+    "tool_get_all_templates", "Get all message templates. Use this when user asks for templates.",
+    func=get_all_templates, afunc=aget_all_templates
+)
+registry.register("tool_get_template", "Get a specific template by ID.", func=get_template, afunc=aget_template)
+registry.register(
+    "tool_search_templates", "Search templates by category or keyword.",
+    func=search_templates, afunc=asearch_templates
+)
+registry.register(
+    "tool_get_lead_interactions", "Get all interactions for a lead.",
+    func=get_lead_interactions, afunc=aget_lead_interactions, fields=INTERACTION_FIELDS
+)
+registry.register(
+    "tool_add_interaction", "Record an interaction (call, email, message, meeting) with a lead.",
+    func=add_interaction, afunc=aadd_interaction, writes=True, langchain=False
+)
+registry.register(
+    "tool_analyze_sentiment", "Analyze sentiment of a lead's interactions.",
+    func=analyze_sentiment, afunc=aanalyze_sentiment
+)
+
+# ------------------------------
+# Tasks
+# ------------------------------
+registry.register(
+    "tool_get_all_tasks",
+    "Get all tasks, optionally filtered by status (pending/in-progress/completed) or priority (low/medium/high/urgent).",
+    func=get_all_tasks, fields=TASK_FIELDS
+)
+registry.register("tool_get_task", "Get a specific task by ID.", func=get_task)
+registry.register("tool_get_tasks_by_lead", "Get all tasks for a specific lead.", func=get_tasks_by_lead, fields=TASK_FIELDS)
+registry.register(
+    "tool_search_tasks", "Search tasks by title, description, or lead name.", func=search_tasks, fields=TASK_FIELDS
+)
+registry.register("tool_get_tasks_due_today", "Get tasks due today.", func=get_tasks_due_today, fields=TASK_FIELDS)
+registry.register("tool_get_overdue_tasks", "Get overdue tasks.", func=get_overdue_tasks, fields=TASK_FIELDS)
+registry.register("tool_get_urgent_tasks", "Get urgent priority tasks.", func=get_urgent_tasks, fields=TASK_FIELDS)
+
+# ------------------------------
+# Actions (UI instructions and drafts: never memoized)
+# ------------------------------
+registry.register(
+    "tool_open_lead_profile", "Open a lead's profile page to view full details.",
+    func=open_lead_profile, cacheable=False
+)
+registry.register(
+    "tool_open_maps",
+    "Open maps/navigation to a lead's location.\n"
+    "Use this when user asks \"where does X live\", \"show me X's location\", \"X location\", etc.",
+    func=open_maps_for_lead, cacheable=False
+)
+registry.register(
+    "tool_send_message",
+    "Generate a draft message for a lead via WhatsApp, SMS, or Email.\n"
+    "This shows the user a draft message and asks for confirmation.\n\n"
+    "IMPORTANT:\n"
+    "- Always pass lead_data as JSON string to generate contextual messages\n"
+    "- This returns a DRAFT message for user to review\n"
+    "- User must confirm with \"yes\" before message is \"sent\"\n\n"
+    "Example: lead_data='{\"productInterest\": [\"Term Life\"], \"temperature\": \"hot\", \"tags\": [\"follow-up\"]}'",
+    func=send_message, cacheable=False
+)
+registry.register(
+    "tool_confirm_send_message",
+    "Confirm that a message has been sent to a lead.\n"
+    "Use this ONLY after user confirms \"yes\" to send the draft message.",
+    func=confirm_send_message, cacheable=False
+)
+registry.register("tool_call_lead", "Initiate a phone call to a lead.", func=call_lead, cacheable=False)
+registry.register("tool_schedule_meeting", "Schedule a meeting with a lead.", func=schedule_meeting, cacheable=False)
+registry.register("tool_create_task", "Create a task for a lead.", func=create_task_for_lead, cacheable=False)
+registry.register(
+    "tool_send_template", "Send a template message to a lead.", func=send_template_to_lead, cacheable=False
+)
+registry.register(
+    "tool_show_create_lead_form",
+    "Show a form to create a new lead. Use this when user wants to add a lead through UI.\n"
+    "Pass prefilled_data as JSON string if you have some info already.",
+    func=create_lead_form, cacheable=False
+)
+registry.register(
+    "tool_show_create_task_form",
+    "Show a form to create a new task. Use this when user wants to create a task through UI.",
+    func=show_create_task_form, cacheable=False
+)
+registry.register(
+    "tool_show_edit_lead_form", "Show a form to edit a lead. Pass lead_data as JSON string.",
+    func=edit_lead_form, cacheable=False
+)
+
+# ------------------------------
+# Enhanced lead tools
+# ------------------------------
+registry.register(
+    "tool_filter_leads_by_tag", "Filter leads by tag (follow-up, renewal-due, high-value, interested, urgent, etc.).",
+    func=filter_leads_by_tag, afunc=afilter_leads_by_tag, fields=LEAD_FIELDS
+)
+registry.register(
+    "tool_get_renewal_leads", "Get leads with renewals due. Use this when user asks 'show renewals due'.",
+    func=get_renewal_leads, afunc=aget_renewal_leads, fields=LEAD_FIELDS
+)
+registry.register(
+    "tool_get_followup_leads", "Get leads needing follow-up.",
+    func=get_followup_leads, afunc=aget_followup_leads, fields=LEAD_FIELDS
+)
+registry.register(
+    "tool_get_high_value_leads", "Get high-value leads.",
+    func=get_high_value_leads, afunc=aget_high_value_leads, fields=LEAD_FIELDS
+)
+registry.register(
+    "tool_get_leads_by_location", "Get leads in a specific location.",
+    func=get_leads_by_location, afunc=aget_leads_by_location, fields=LEAD_FIELDS
+)
+registry.register(
+    "tool_get_leads_with_policy", "Get leads with existing policies.",
+    func=get_leads_with_policy, afunc=aget_leads_with_policy, fields=LEAD_FIELDS
+)
+
+# ------------------------------
+# Notifications
+# ------------------------------
+registry.register(
+    "tool_get_notifications",
+    "Get notifications, optionally filtered by type (renewal, followup, compliance, missed-call).",
+    func=get_all_notifications, fields=NOTIFICATION_FIELDS
+)
+registry.register(
+    "tool_get_unread_notifications", "Get unread notifications.",
+    func=get_unread_notifications, fields=NOTIFICATION_FIELDS
+)
+registry.register("tool_get_unread_count", "Get count of unread notifications.", func=get_unread_count)
+registry.register(
+    "tool_get_notifications_by_lead", "Get notifications for a specific lead.",
+    func=get_notifications_by_lead, fields=NOTIFICATION_FIELDS, langchain=False
+)
+registry.register(
+    "tool_get_high_priority_notifications", "Get high priority notifications.",
+    func=get_high_priority_notifications, fields=NOTIFICATION_FIELDS
+)
+
+# ------------------------------
+# Audit logs
+# ------------------------------
+registry.register(
+    "tool_get_audit_logs", "Get audit logs.", func=get_all_audit_logs, afunc=aget_all_audit_logs, fields=AUDIT_FIELDS
+)
+registry.register(
+    "tool_get_audit_logs_by_lead", "Get audit logs for a specific lead.",
+    func=get_audit_logs_by_lead, afunc=aget_audit_logs_by_lead, fields=AUDIT_FIELDS
+)
+registry.register(
+    "tool_get_audit_logs_by_action", "Get audit logs of one action type.",
+    func=get_audit_logs_by_action, afunc=aget_audit_logs_by_action, fields=AUDIT_FIELDS, langchain=False
+)
+registry.register(
+    "tool_get_ai_actions", "Get audit logs of AI-initiated actions.",
+    func=get_ai_actions, afunc=aget_ai_actions, fields=AUDIT_FIELDS, langchain=False
+)
+
+# ------------------------------
+# Analytics and daily summary
+# ------------------------------
+registry.register(
+    "tool_get_conversion_stats", "Get conversion probability statistics.",
+    func=get_conversion_stats, afunc=aget_conversion_stats
+)
+registry.register(
+    "tool_get_revenue_forecast", "Get revenue forecast based on premiums and conversion probability.",
+    func=get_revenue_forecast, afunc=aget_revenue_forecast
+)
+registry.register(
+    "tool_get_lead_distribution", "Get lead distribution by location and product interest.",
+    func=get_lead_distribution, afunc=aget_lead_distribution
+)
+registry.register(
+    "tool_get_top_leads", "Get top leads by conversion probability.",
+    func=get_top_leads, afunc=aget_top_leads, fields=LEAD_FIELDS
+)
+registry.register(
+    "tool_get_performance_metrics", "Get overall performance metrics.",
+    func=get_performance_metrics, afunc=aget_performance_metrics
+)
+registry.register(
+    "tool_get_daily_summary",
+    "Get comprehensive daily summary with leads, tasks, revenue, and action items.\n"
+    "Use this when user says 'summarize today', 'daily briefing', 'what's my day like', etc.",
+    func=get_daily_summary, afunc=aget_daily_summary
+)
+registry.register(
+    "tool_get_todays_briefing",
+    "Get formatted daily briefing text.\n"
+    "Use this when user wants a quick overview of the day.",
+    func=get_todays_briefing, afunc=aget_todays_briefing
+)
+registry.register(
+    "tool_create_tasks_from_action_items",
+    "Automatically create tasks from today's action items.\n"
+    "Use this when user says 'create tasks', 'create this as task', 'make tasks from action items' after viewing daily summary.\n"
+    "This will create tasks for all action items from the daily summary.",
+    func=create_tasks_from_action_items, afunc=acreate_tasks_from_action_items, writes=True
+)
+
+# ------------------------------
+# Policies (read straight from disk, so not memoized)
+# ------------------------------
+registry.register(
+    "tool_upload_policy_document", "Attach an uploaded policy document to a lead.",
+    func=upload_policy_document, writes=True, langchain=False
+)
+registry.register(
+    "tool_get_lead_policies", "Get a lead's policies.",
+    func=get_lead_policies, cacheable=False, fields=POLICY_FIELDS, langchain=False
+)
+registry.register("tool_get_policy", "Get a policy by ID.", func=get_policy_by_id, cacheable=False, langchain=False)
+registry.register(
+    "tool_get_all_policies", "Get all policies.",
+    func=get_all_policies, cacheable=False, fields=POLICY_FIELDS, langchain=False
+)
+registry.register(
+    "tool_get_policies_by_type", "Get policies of one type.",
+    func=get_policies_by_type, cacheable=False, fields=POLICY_FIELDS, langchain=False
+)
+registry.register(
+    "tool_get_expiring_policies", "Get policies expiring within the given number of days.",
+    func=get_expiring_policies, cacheable=False, fields=POLICY_FIELDS, langchain=False
+)
+registry.register(
+    "tool_create_policy", "Create a policy for a lead.", func=create_policy, writes=True, langchain=False
+)
+
+# ------------------------------
+# Utility
+# ------------------------------
+registry.register(
+    "tool_format_data",
+    "Format data into a clean, presentable text format.\n"
+    "Use this tool AFTER getting data to make it readable.\n\n"
+    "Args:\n"
+    "    data: JSON string of data to format\n"
+    "    format_type: Type of formatting (auto, table, list, card, leads, compliance)\n\n"
+    "Returns:\n"
+    "    Formatted, human-readable text",
+    func=format_data, cacheable=False
+)
+registry.register(
+    "tool_summarize_content",
+    "Use LLM to summarize content intelligently.\n\n"
+    "Args:\n"
+    "    content: Content to summarize\n"
+    "    summary_type: Type of summary (brief, detailed, bullet_points)\n\n"
+    "Returns:\n"
+    "    Summarized content",
+    afunc=summarize_content, cacheable=False
+)
+
+# ------------------------------
+# CrewAI tools (grouped by action, as the agents' prompts expect)
+# ------------------------------
+registry.group("Lead Search Tool", "Search and retrieve lead information by various criteria", "tool_search_leads")
+registry.group("Lead Management Tool", "Create, update, and manage lead information", {
+    "get": "tool_get_lead",
+    "create": "tool_create_lead",
+    "update": "tool_update_lead",
+})
+registry.group("IRDAI Compliance Tool", "Check IRDAI compliance and provide safe alternatives", "tool_check_compliance")
+registry.group("Task Management Tool", "Manage tasks, deadlines, and follow-ups", {
+    "get_all": "tool_get_all_tasks",
+    "get_due_today": "tool_get_tasks_due_today",
+    "get_overdue": "tool_get_overdue_tasks",
+    "get_urgent": "tool_get_urgent_tasks",
+    "create": "tool_create_task",
+})
+registry.group("Communication Tool", "Handle messaging, calls, and communication with leads", {
+    "send_message": "tool_send_message",
+    "call": "tool_call_lead",
+    "schedule_meeting": "tool_schedule_meeting",
+})
+registry.group("Analytics Tool", "Generate insights, forecasts, and performance metrics", {
+    "conversion": "tool_get_conversion_stats",
+    "revenue_forecast": "tool_get_revenue_forecast",
+    "lead_distribution": "tool_get_lead_distribution",
+    "top_leads": "tool_get_top_leads",
+    "performance": "tool_get_performance_metrics",
+    "daily_summary": "tool_get_daily_summary",
+    "todays_briefing": "tool_get_todays_briefing",
+    "create_tasks_from_action_items": "tool_create_tasks_from_action_items",
+}, selector="metric_type")
+registry.group("Notification Tool", "Manage notifications and alerts", {
+    "get_all": "tool_get_notifications",
+    "get_unread": "tool_get_unread_notifications",
+    "get_unread_count": "tool_get_unread_count",
+    "get_by_lead": "tool_get_notifications_by_lead",
+    "get_high_priority": "tool_get_high_priority_notifications",
+})
+registry.group("Audit Tool", "Access audit logs and track system activities", {
+    "get_all": "tool_get_audit_logs",
+    "get_by_lead": "tool_get_audit_logs_by_lead",
+    "get_by_action": "tool_get_audit_logs_by_action",
+    "get_ai_actions": "tool_get_ai_actions",
+})
+registry.group("Formatting Tool", "Format data for better presentation", "tool_format_data")
+registry.group("Interaction Tool", "Manage lead interactions and sentiment analysis", {
+    "get_interactions": "tool_get_lead_interactions",
+    "add_interaction": "tool_add_interaction",
+    "analyze_sentiment": "tool_analyze_sentiment",
+})
+registry.group("UI Action Tool", "Trigger UI actions and form displays", {
+    "show_create_lead_form": "tool_show_create_lead_form",
+    "show_create_task_form": "tool_show_create_task_form",
+    "show_edit_lead_form": "tool_show_edit_lead_form",
+    "open_lead_profile": "tool_open_lead_profile",
+})
+registry.group("Policy Tool", "Manage insurance policies and policy documents", {
+    "upload_document": "tool_upload_policy_document",
+    "get_lead_policies": "tool_get_lead_policies",
+    "get_policy": "tool_get_policy",
+    "get_all_policies": "tool_get_all_policies",
+    "get_by_type": "tool_get_policies_by_type",
+    "get_expiring": "tool_get_expiring_policies",
+    "create_policy": "tool_create_policy",
+})
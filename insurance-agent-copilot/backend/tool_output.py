@@ -0,0 +1,132 @@
+"""
+Tool Output Encoder
+Compact, size-bounded serialization of tool results for agent prompts (applied to both
+backends by the tool registry). Results are JSON without indentation, list rows keep
+only the fields the agents use, long lists are paged with a continuation hint, and the
+emitted size is tracked per tool as estimated tokens.
+"""
+
+import json
+import math
+import os
+import threading
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+TOOL_OUTPUT_MAX_ROWS = int(os.getenv("TOOL_OUTPUT_MAX_ROWS", "20"))
+TOOL_OUTPUT_MAX_CHARS = int(os.getenv("TOOL_OUTPUT_MAX_CHARS", "6000"))
+
+# Rough size of a token for JSON text; good enough for prompt budgeting
+CHARS_PER_TOKEN = 4
+
+# Row fields kept in list results (single records are returned in full)
+LEAD_FIELDS = [
+    "id", "name", "phone", "email", "location", "temperature", "tags", "productInterest", "premium",
+    "conversionProbability", "lastInteractionSummary", "lastInteractionDate"
+]
+TASK_FIELDS = ["id", "title", "leadId", "leadName", "priority", "status", "dueDate"]
+NOTIFICATION_FIELDS = ["id", "type", "title", "message", "leadId", "leadName", "priority", "isRead", "timestamp"]
+AUDIT_FIELDS = ["id", "actionType", "entityId", "changes", "source", "userDecision", "complianceStatus", "createdAt"]
+INTERACTION_FIELDS = ["id", "leadId", "type", "summary", "content", "sentiment", "createdAt"]
+POLICY_FIELDS = [
+    "id", "leadId", "leadName", "policyNumber", "policyType", "premium", "coverageAmount",
+    "startDate", "endDate", "status"
+]
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimated prompt tokens for a tool output"""
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+def _project(row: Any, fields: Optional[Sequence[str]]) -> Any:
+    if not fields or not isinstance(row, dict):
+        return row
+    return {field: row[field] for field in fields if field in row}
+
+
+class ToolOutputEncoder:
+    """Shared encoder for tool results, with per-tool size accounting"""
+
+    def __init__(self, max_rows: int = TOOL_OUTPUT_MAX_ROWS, max_chars: int = TOOL_OUTPUT_MAX_CHARS):
+        """
+        Args:
+            max_rows: Rows of a list result per call; the rest is left for the next page
+            max_chars: Upper bound for one encoded output (pages shrink to fit, other
+                results are cut)
+        """
+        self.max_rows = max_rows
+        self.max_chars = max_chars
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    def _page(self, rows: List, fields: Optional[Sequence[str]], offset: int) -> Tuple[Any, str]:
+        total = len(rows)
+        limit = self.max_rows
+        while True:
+            page = [_project(row, fields) for row in rows[offset:offset + limit]]
+            end = offset + len(page)
+            if end >= total and offset == 0:
+                value = page
+            else:
+                value = {"total": total, "offset": offset, "rows": page}
+                if end < total:
+                    value["next"] = f"{total - end} more row(s): call again with offset={end}"
+            text = _dumps(value)
+            if len(text) <= self.max_chars or limit <= 1:
+                return value, text
+            limit = max(1, limit // 2)
+
+    def shape(self, tool: str, result: Any, fields: Sequence[str] = None, offset: int = 0) -> Tuple[Any, str]:
+        """
+        Bound a tool result for an agent prompt
+
+        Args:
+            tool: Tool name (for accounting)
+            result: Tool function result
+            fields: Fields kept for each row of a list result (None keeps all)
+            offset: First row of a list result to return
+
+        Returns:
+            (value, text): the bounded result as data and as compact JSON. Lists longer
+            than max_rows, or larger than max_chars, come back as {"total", "offset",
+            "rows", "next"} where "next" tells the agent how to fetch the remaining rows.
+            Other results are returned as-is unless their JSON exceeds max_chars, in which
+            case both are the cut text.
+        """
+        if isinstance(result, list):
+            value, text = self._page(result, fields, max(0, int(offset or 0)))
+        elif isinstance(result, str):
+            value = text = result
+        else:
+            value, text = result, _dumps(result)
+
+        truncated = len(text) > self.max_chars
+        if truncated:
+            value = text = text[:self.max_chars] + f"... [truncated {len(text) - self.max_chars} chars]"
+
+        with self._lock:
+            stats = self._stats.setdefault(tool, {"calls": 0, "chars": 0, "tokens": 0, "truncated": 0})
+            stats["calls"] += 1
+            stats["chars"] += len(text)
+            stats["tokens"] += estimate_tokens(text)
+            stats["truncated"] += int(truncated)
+        return value, text
+
+    def encode(self, tool: str, result: Any, fields: Sequence[str] = None, offset: int = 0) -> str:
+        """Serialize a tool result for an agent prompt (the text half of shape())"""
+        return self.shape(tool, result, fields, offset)[1]
+
+    def stats(self) -> Dict:
+        """Per-tool calls, emitted chars and estimated tokens (total and average)"""
+        with self._lock:
+            return {
+                tool: {**stats, "avg_tokens": round(stats["tokens"] / stats["calls"], 1)}
+                for tool, stats in self._stats.items()
+            }
+
+
+tool_output = ToolOutputEncoder()
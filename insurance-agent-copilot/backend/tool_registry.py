@@ -0,0 +1,492 @@
+"""
+Tool Registry
+Declarative description of the agent tools, shared by both backends. Each tool function
+is registered once with its schema (taken from the signature), read/write flag,
+cacheability and output projection. The LangChain tools and the CrewAI tool classes are
+generated from the registry, and every call from either backend goes through the same
+middleware chain: timing, memoization of reads and output size limits.
+"""
+
+import asyncio
+import inspect
+import json
+import os
+import threading
+import time
+import typing
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from pydantic import Field, create_model
+
+from tool_output import tool_output
+from tools import data_cache, lead_versions
+
+TOOL_MEMO_TTL_SECONDS = float(os.getenv("TOOL_MEMO_TTL_SECONDS", "30"))
+TOOL_MEMO_SIZE = int(os.getenv("TOOL_MEMO_SIZE", "512"))
+
+
+def _offset_field() -> Tuple[Any, Any]:
+    return (int, Field(0, description="First row to return (see the 'next' hint of a paged result)"))
+
+
+def _returns_list(annotation: Any) -> bool:
+    return annotation is list or typing.get_origin(annotation) is list
+
+
+def _signature_fields(signature: inspect.Signature) -> Dict[str, Tuple[Any, Any]]:
+    fields = {}
+    for name, param in signature.parameters.items():
+        if param.kind in (param.VAR_POSITIONAL, param.VAR_KEYWORD):
+            continue
+        annotation = Any if param.annotation is param.empty else param.annotation
+        if param.default is param.empty:
+            fields[name] = (annotation, ...)
+        else:
+            if param.default is None:
+                annotation = Optional[annotation]
+            fields[name] = (annotation, param.default)
+    return fields
+
+
+def _schema_name(name: str) -> str:
+    return "".join(part.capitalize() for part in name.replace("-", " ").replace("_", " ").split()) + "Schema"
+
+
+@dataclass
+class ToolSpec:
+    """One tool function, described once for every backend"""
+    name: str
+    description: str
+    func: Optional[Callable] = None  # Sync implementation (CrewAI; LangChain runs it on the tools I/O pool)
+    afunc: Optional[Callable] = None  # Async implementation, preferred by LangChain
+    writes: bool = False  # Changes data: never memoized, and clears the memo when it runs
+    cacheable: bool = True  # Reads only: results may be memoized while the data files are unchanged
+    fields: Optional[Sequence[str]] = None  # Row fields kept in list results
+    langchain: bool = True  # Exposed to the LangChain agent (CrewAI uses the tools named by its groups)
+
+    def __post_init__(self):
+        signature = inspect.signature(self.func or self.afunc)
+        self.params = _signature_fields(signature)
+        self.required = [name for name, (_, default) in self.params.items() if default is ...]
+        self.paged = _returns_list(signature.return_annotation)
+        fields = dict(self.params)
+        if self.paged:
+            fields["offset"] = _offset_field()
+        self.schema = create_model(_schema_name(self.name), **fields)
+
+
+@dataclass
+class CrewToolGroup:
+    """A CrewAI tool dispatching on one argument (e.g. action) to registered tools"""
+    name: str
+    description: str
+    tools: Union[str, Dict[str, str]]  # One tool name, or selector value -> tool name
+    selector: str = "action"
+
+
+@dataclass
+class ToolCall:
+    """State of one tool call as it passes through the middleware chain"""
+    spec: ToolSpec
+    kwargs: Dict[str, Any]
+    offset: int = 0
+    result: Any = None
+    done: bool = False  # result is set (by the function, or by a middleware answering the call)
+    cached: bool = False
+    error: Optional[BaseException] = None
+    value: Any = None  # Size-limited result as data (returned to LangChain)
+    text: str = ""  # Size-limited result as compact JSON (returned to CrewAI)
+    state: Dict[str, Any] = field(default_factory=dict)
+
+
+class ToolMiddleware:
+    """
+    Hooks run around every tool call
+
+    before() hooks run in chain order and may answer the call by setting call.result and
+    call.done (later hooks and the tool function are then skipped); after() hooks of the
+    middleware that ran are called in reverse order, also when the call failed.
+    """
+
+    def before(self, call: ToolCall):
+        pass
+
+    def after(self, call: ToolCall):
+        pass
+
+
+class TimingMiddleware(ToolMiddleware):
+    """Per-tool calls, errors, memo hits and latency"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, float]] = {}
+
+    def before(self, call: ToolCall):
+        call.state["started"] = time.perf_counter()
+
+    def after(self, call: ToolCall):
+        elapsed = (time.perf_counter() - call.state["started"]) * 1000
+        with self._lock:
+            stats = self._stats.setdefault(
+                call.spec.name, {"calls": 0, "errors": 0, "cached": 0, "total_ms": 0.0, "max_ms": 0.0}
+            )
+            stats["calls"] += 1
+            stats["errors"] += int(call.error is not None)
+            stats["cached"] += int(call.cached)
+            stats["total_ms"] += elapsed
+            stats["max_ms"] = max(stats["max_ms"], elapsed)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                name: {
+                    **stats,
+                    "total_ms": round(stats["total_ms"], 2),
+                    "max_ms": round(stats["max_ms"], 2),
+                    "avg_ms": round(stats["total_ms"] / stats["calls"], 3),
+                }
+                for name, stats in self._stats.items()
+            }
+
+
+class MemoMiddleware(ToolMiddleware):
+    """
+    Memoizes cacheable reads on (tool, arguments, data file signatures)
+
+    Any change to a cached data file changes the key, so a memoized result is never
+    older than the files it was computed from. Write tools and lead changes clear the
+    memo (some data doesn't go through the data cache), and entries expire after a TTL
+    for results that depend on the date.
+    """
+
+    def __init__(self, ttl: float = TOOL_MEMO_TTL_SECONDS, max_entries: int = TOOL_MEMO_SIZE):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._counts = {"hits": 0, "misses": 0, "cleared": 0}
+        lead_versions.on_change(lambda kind, lead_id: self.clear())
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0 and self.max_entries > 0
+
+    def before(self, call: ToolCall):
+        spec = call.spec
+        if spec.writes or not spec.cacheable or not self.enabled:
+            return
+        key = (spec.name, json.dumps(call.kwargs, sort_keys=True, default=str), data_cache.snapshot())
+        call.state["memo_key"] = key
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] >= time.monotonic():
+                self._entries.move_to_end(key)
+                self._counts["hits"] += 1
+                call.result, call.done, call.cached = entry[1], True, True
+                return
+            if entry is not None:
+                del self._entries[key]
+            self._counts["misses"] += 1
+
+    def after(self, call: ToolCall):
+        if call.error is not None or call.cached:
+            return
+        if call.spec.writes:
+            self.clear()
+            return
+        key = call.state.get("memo_key")
+        if key is None:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, call.result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            if self._entries:
+                self._entries.clear()
+                self._counts["cleared"] += 1
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {"entries": len(self._entries), "ttl_s": self.ttl, "max_entries": self.max_entries, **self._counts}
+
+
+class OutputLimitMiddleware(ToolMiddleware):
+    """Projects, pages and caps results through the shared tool output encoder"""
+
+    def after(self, call: ToolCall):
+        if call.error is None:
+            call.value, call.text = tool_output.shape(call.spec.name, call.result, call.spec.fields, call.offset)
+
+
+class ToolRegistry:
+    """Registered tool functions, CrewAI tool groups and the middleware chain"""
+
+    def __init__(self):
+        self._specs: "OrderedDict[str, ToolSpec]" = OrderedDict()
+        self._groups: "OrderedDict[str, CrewToolGroup]" = OrderedDict()
+        self.timing = TimingMiddleware()
+        self.memo = MemoMiddleware()
+        # Memo sits innermost so memoized results are still paged and accounted per call
+        self.middleware: List[ToolMiddleware] = [self.timing, OutputLimitMiddleware(), self.memo]
+        # Sync calls of writes=True tools run one at a time, so read-modify-write tools never
+        # interleave even where the function itself doesn't lock its file (the async
+        # wrappers lock theirs)
+        self._write_lock = threading.RLock()
+
+    # ---------------- Declaration ----------------
+
+    def register(
+        self,
+        name: str,
+        description: str = None,
+        *,
+        func: Callable = None,
+        afunc: Callable = None,
+        writes: bool = False,
+        cacheable: bool = True,
+        fields: Sequence[str] = None,
+        langchain: bool = True
+    ) -> ToolSpec:
+        """
+        Register a tool function
+
+        Args:
+            name: Tool name shown to the LangChain agent (e.g. tool_get_lead)
+            description: Tool description for the LLM (defaults to the function docstring)
+            func: Sync implementation; its signature is the tool's argument schema
+            afunc: Async implementation with the same signature
+            writes: The tool changes data
+            cacheable: Results of this read may be memoized
+            fields: Row fields kept when the tool returns a list
+            langchain: Expose the tool to the LangChain agent
+
+        Returns:
+            The registered ToolSpec
+        """
+        if func is None and afunc is None:
+            raise ValueError(f"Tool {name} needs func or afunc")
+        if name in self._specs:
+            raise ValueError(f"Tool {name} is already registered")
+        spec = ToolSpec(
+            name=name,
+            description=description or inspect.getdoc(func or afunc) or name,
+            func=func,
+            afunc=afunc,
+            writes=writes,
+            cacheable=cacheable and not writes,
+            fields=fields,
+            langchain=langchain,
+        )
+        self._specs[name] = spec
+        return spec
+
+    def group(self, name: str, description: str, tools: Union[str, Dict[str, str]], selector: str = "action") -> CrewToolGroup:
+        """
+        Declare a CrewAI tool over registered tools
+
+        Args:
+            name: CrewAI tool name (e.g. "Task Management Tool")
+            description: What the tool is for; actions and paging are appended
+            tools: A registered tool name, or a mapping of selector values to tool names
+            selector: Argument choosing the tool (e.g. action, metric_type)
+
+        Returns:
+            The declared CrewToolGroup
+        """
+        for tool_name in ([tools] if isinstance(tools, str) else tools.values()):
+            if tool_name not in self._specs:
+                raise ValueError(f"{name}: unknown tool {tool_name}")
+        group = CrewToolGroup(name, description, tools, selector)
+        self._groups[name] = group
+        return group
+
+    def spec(self, name: str) -> ToolSpec:
+        return self._specs[name]
+
+    def specs(self) -> List[ToolSpec]:
+        return list(self._specs.values())
+
+    # ---------------- Calls ----------------
+
+    def _start(self, spec: ToolSpec, kwargs: Dict[str, Any]) -> Tuple[ToolCall, List[ToolMiddleware]]:
+        kwargs = dict(kwargs)
+        offset = kwargs.pop("offset", 0) if spec.paged else 0
+        call = ToolCall(spec, kwargs, offset=int(offset or 0))
+        ran = []
+        for middleware in self.middleware:
+            ran.append(middleware)
+            middleware.before(call)
+            if call.done:
+                break
+        return call, ran
+
+    @staticmethod
+    def _finish(call: ToolCall, ran: List[ToolMiddleware]) -> ToolCall:
+        for middleware in reversed(ran):
+            middleware.after(call)
+        if call.error is not None:
+            raise call.error
+        return call
+
+    def call(self, name: str, kwargs: Dict[str, Any]) -> ToolCall:
+        """Run a tool synchronously through the middleware chain"""
+        spec = self._specs[name]
+        call, ran = self._start(spec, kwargs)
+        if not call.done:
+            try:
+                if spec.func is not None:
+                    call.result = self._run_sync(spec, call.kwargs)
+                else:
+                    call.result = asyncio.run(spec.afunc(**call.kwargs))
+                call.done = True
+            except Exception as e:
+                call.error = e
+        return self._finish(call, ran)
+
+    def _run_sync(self, spec: ToolSpec, kwargs: Dict[str, Any]) -> Any:
+        if spec.writes:
+            with self._write_lock:
+                return spec.func(**kwargs)
+        return spec.func(**kwargs)
+
+    async def acall(self, name: str, kwargs: Dict[str, Any]) -> ToolCall:
+        """Run a tool without blocking the event loop (sync functions go to the tools I/O pool)"""
+        from tools.async_tools import run_io
+
+        spec = self._specs[name]
+        call, ran = self._start(spec, kwargs)
+        if not call.done:
+            try:
+                if spec.afunc is not None:
+                    call.result = await spec.afunc(**call.kwargs)
+                else:
+                    call.result = await run_io(self._run_sync, spec, call.kwargs)
+                call.done = True
+            except Exception as e:
+                call.error = e
+        return self._finish(call, ran)
+
+    # ---------------- LangChain adapters ----------------
+
+    def langchain_tools(self) -> List:
+        """LangChain StructuredTools for every tool exposed to the LangChain agent"""
+        from langchain_core.tools import StructuredTool
+
+        def build(spec: ToolSpec):
+            def run(**kwargs):
+                return self.call(spec.name, kwargs).value
+
+            async def arun(**kwargs):
+                return (await self.acall(spec.name, kwargs)).value
+
+            return StructuredTool(
+                name=spec.name,
+                description=spec.description,
+                args_schema=spec.schema,
+                func=run if spec.func is not None else None,
+                coroutine=arun,
+            )
+
+        return [build(spec) for spec in self._specs.values() if spec.langchain]
+
+    # ---------------- CrewAI adapters ----------------
+
+    def _group_specs(self, group: CrewToolGroup) -> List[ToolSpec]:
+        names = [group.tools] if isinstance(group.tools, str) else list(group.tools.values())
+        return [self._specs[name] for name in names]
+
+    def _group_schema(self, group: CrewToolGroup) -> type:
+        if isinstance(group.tools, str):
+            return self._specs[group.tools].schema
+        choices = ", ".join(group.tools)
+        fields: Dict[str, Tuple[Any, Any]] = {group.selector: (str, Field(..., description=f"One of: {choices}"))}
+        for spec in self._group_specs(group):
+            for name, (annotation, _) in spec.params.items():
+                if name not in fields:
+                    fields[name] = (Optional[annotation], None)
+        if any(spec.paged for spec in self._group_specs(group)):
+            fields["offset"] = _offset_field()
+        return create_model(_schema_name(group.name), **fields)
+
+    def _group_description(self, group: CrewToolGroup) -> str:
+        description = group.description
+        if not isinstance(group.tools, str):
+            actions = "; ".join(
+                f"{choice}({', '.join(self._specs[name].params)})" for choice, name in group.tools.items()
+            )
+            description += f". {group.selector}: {actions}"
+        if any(spec.paged for spec in self._group_specs(group)):
+            description += " (paged: pass offset for more rows)"
+        return description
+
+    def run_group(self, name: str, kwargs: Dict[str, Any]) -> str:
+        """
+        Dispatch a CrewAI tool call to the registered tool
+
+        Args:
+            name: CrewAI tool name
+            kwargs: Validated arguments (unset optional arguments are None)
+
+        Returns:
+            Size-limited compact JSON (or an error object naming the valid choices /
+            missing arguments)
+        """
+        group = self._groups[name]
+        kwargs = {key: value for key, value in kwargs.items() if value is not None}
+        if isinstance(group.tools, str):
+            choice, tool_name = None, group.tools
+        else:
+            choice = kwargs.pop(group.selector, None)
+            tool_name = group.tools.get(choice)
+            if tool_name is None:
+                return json.dumps({"error": f"Invalid {group.selector} '{choice}'. Use one of: {', '.join(group.tools)}"})
+
+        spec = self._specs[tool_name]
+        args = {key: value for key, value in kwargs.items() if key in spec.params or (key == "offset" and spec.paged)}
+        missing = [param for param in spec.required if param not in args]
+        if missing:
+            return json.dumps({"error": f"Missing parameters for {choice or name}: {', '.join(missing)}"})
+        return self.call(tool_name, args).text
+
+    def crew_tool(self, name: str):
+        """New CrewAI tool instance for a declared group (one per agent, like hand-written tools)"""
+        group = self._groups[name]
+        return _crew_tool_class()(
+            name=group.name,
+            description=self._group_description(group),
+            args_schema=self._group_schema(group),
+            registry=self,
+        )
+
+    def crew_tool_names(self) -> List[str]:
+        return list(self._groups)
+
+    def stats(self) -> Dict:
+        """Per-tool timing and memo hit/miss counts"""
+        return {"tools": self.timing.stats(), "memo": self.memo.stats()}
+
+
+@lru_cache(maxsize=None)
+def _crew_tool_class():
+    """CrewAI BaseTool adapter, defined on first use so the LangChain backend never imports CrewAI"""
+    from crewai.tools import BaseTool
+
+    class RegistryCrewTool(BaseTool):
+        """CrewAI tool generated from a registry group; arguments are validated by its schema"""
+        registry: Any = Field(default=None, exclude=True)
+
+        def _run(self, **kwargs) -> str:
+            return self.registry.run_group(self.name, kwargs)
+
+    return RegistryCrewTool
+
+
+registry = ToolRegistry()
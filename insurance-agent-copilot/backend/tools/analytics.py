@@ -4,18 +4,15 @@ Functions for analytics and insights
 """
 
 from typing import Dict, List
-import json
 import os
 
+from tools.data_cache import read_json
+
 LEADS_PATH = os.path.join(os.path.dirname(__file__), '../../src/data/mock/leads.json')
 
 def _load_leads() -> List[Dict]:
-    """Load leads from JSON file"""
-    try:
-        with open(LEADS_PATH, 'r') as f:
-            return json.load(f)
-    except:
-        return []
+    """Load leads from JSON file (cached until the file changes)"""
+    return read_json(LEADS_PATH, [])
 
 def get_conversion_stats() -> Dict:
     """
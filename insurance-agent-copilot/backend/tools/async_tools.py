@@ -0,0 +1,109 @@
+"""
+Async Data Tools
+Non-blocking variants of the file-backed tools. Each call runs the sync function on a
+dedicated bounded thread pool so the event loop never stalls on disk I/O, and writers
+to the same JSON file are serialized.
+"""
+
+import asyncio
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+
+from tools import leads, interactions, daily_summary
+from tools.data_cache import file_lock
+from tools.leads import (
+    get_lead, search_leads, update_lead, create_lead, get_all_leads,
+    filter_leads_by_tag, get_renewal_leads, get_followup_leads, get_high_value_leads,
+    get_leads_by_assigned_user, get_leads_by_location, get_leads_with_policy
+)
+from tools.templates import get_all_templates, get_template, search_templates
+from tools.interactions import get_lead_interactions, add_interaction, analyze_sentiment
+from tools.audit import (
+    get_all_audit_logs, get_audit_logs_by_lead, get_audit_logs_by_action, get_ai_actions
+)
+from tools.analytics import (
+    get_conversion_stats, get_revenue_forecast, get_lead_distribution,
+    get_top_leads, get_performance_metrics
+)
+from tools.daily_summary import get_daily_summary, get_todays_briefing, create_tasks_from_action_items
+
+TOOLS_IO_THREADS = int(os.getenv("TOOLS_IO_THREADS", "8"))
+
+_executor = ThreadPoolExecutor(max_workers=TOOLS_IO_THREADS, thread_name_prefix="tools-io")
+
+
+async def run_io(func: Callable, *args, **kwargs):
+    """Run a blocking tool function on the tools I/O pool"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor, functools.partial(func, *args, **kwargs))
+
+
+def make_async(func: Callable, lock_path: Optional[Callable[[], str]] = None) -> Callable:
+    """
+    Wrap a sync tool function as a coroutine function
+
+    Args:
+        func: Sync tool function
+        lock_path: For read-modify-write functions, returns the file to lock
+            (resolved per call so patched DATA_PATHs are honoured)
+
+    Returns:
+        Async function with the same signature
+    """
+    if lock_path is None:
+        target = func
+    else:
+        def target(*args, **kwargs):
+            with file_lock(lock_path()):
+                return func(*args, **kwargs)
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        return await run_io(target, *args, **kwargs)
+
+    return wrapper
+
+
+# Leads
+aget_lead = make_async(get_lead)
+asearch_leads = make_async(search_leads)
+aget_all_leads = make_async(get_all_leads)
+aupdate_lead = make_async(update_lead, lambda: leads.DATA_PATH)
+acreate_lead = make_async(create_lead, lambda: leads.DATA_PATH)
+afilter_leads_by_tag = make_async(filter_leads_by_tag)
+aget_renewal_leads = make_async(get_renewal_leads)
+aget_followup_leads = make_async(get_followup_leads)
+aget_high_value_leads = make_async(get_high_value_leads)
+aget_leads_by_assigned_user = make_async(get_leads_by_assigned_user)
+aget_leads_by_location = make_async(get_leads_by_location)
+aget_leads_with_policy = make_async(get_leads_with_policy)
+
+# Templates
+aget_all_templates = make_async(get_all_templates)
+aget_template = make_async(get_template)
+asearch_templates = make_async(search_templates)
+
+# Interactions
+aget_lead_interactions = make_async(get_lead_interactions)
+aadd_interaction = make_async(add_interaction, lambda: interactions.DATA_PATH)
+aanalyze_sentiment = make_async(analyze_sentiment)
+
+# Audit
+aget_all_audit_logs = make_async(get_all_audit_logs)
+aget_audit_logs_by_lead = make_async(get_audit_logs_by_lead)
+aget_audit_logs_by_action = make_async(get_audit_logs_by_action)
+aget_ai_actions = make_async(get_ai_actions)
+
+# Analytics
+aget_conversion_stats = make_async(get_conversion_stats)
+aget_revenue_forecast = make_async(get_revenue_forecast)
+aget_lead_distribution = make_async(get_lead_distribution)
+aget_top_leads = make_async(get_top_leads)
+aget_performance_metrics = make_async(get_performance_metrics)
+
+# Daily summary
+aget_daily_summary = make_async(get_daily_summary)
+aget_todays_briefing = make_async(get_todays_briefing)
+acreate_tasks_from_action_items = make_async(create_tasks_from_action_items, lambda: daily_summary.TASKS_PATH)
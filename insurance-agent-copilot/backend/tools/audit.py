@@ -4,18 +4,15 @@ Functions to access audit logs
 """
 
 from typing import Dict, List, Optional
-import json
 import os
 
+from tools.data_cache import read_json
+
 DATA_PATH = os.path.join(os.path.dirname(__file__), '../../src/data/mock/auditLog.json')
 
 def _load_audit_logs() -> List[Dict]:
-    """Load audit logs from JSON file"""
-    try:
-        with open(DATA_PATH, 'r') as f:
-            return json.load(f)
-    except:
-        return []
+    """Load audit logs from JSON file (cached until the file changes)"""
+    return read_json(DATA_PATH, [])
 
 def get_all_audit_logs(limit: int = 50) -> List[Dict]:
     """
@@ -3,6 +3,8 @@ IRDAI Compliance Tools
 Simple functions to validate compliance
 """
 
+import re
+from functools import lru_cache
 from typing import Dict, List
 
 # IRDAI risky phrases
@@ -19,6 +21,16 @@ RISKY_PHRASES = {
     "guaranteed growth": "growth potential based on market conditions",
 }
 
+@lru_cache(maxsize=1)
+def compile_patterns() -> Dict[str, "re.Pattern"]:
+    """
+    Compile the case-insensitive replacement pattern for every risky phrase (once)
+    
+    Returns:
+        Mapping of phrase to compiled pattern
+    """
+    return {phrase: re.compile(re.escape(phrase), re.IGNORECASE) for phrase in RISKY_PHRASES}
+
 def check_compliance(content: str) -> Dict:
     """
     Check if content is IRDAI compliant
@@ -46,10 +58,9 @@ def check_compliance(content: str) -> Dict:
     # Generate safe alternative if needed
     safe_content = content
     if not is_compliant:
+        patterns = compile_patterns()
         for violation in violations:
-            import re
-            pattern = re.compile(re.escape(violation["phrase"]), re.IGNORECASE)
-            safe_content = pattern.sub(violation["alternative"], safe_content)
+            safe_content = patterns[violation["phrase"]].sub(violation["alternative"], safe_content)
     
     return {
         "is_compliant": is_compliant,
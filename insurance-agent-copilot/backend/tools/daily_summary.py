@@ -5,20 +5,17 @@ Functions to generate daily summaries and briefings
 
 from typing import Dict, List
 from datetime import datetime
-import json
 import os
 
+from tools.data_cache import file_lock, read_json, write_json
+
 LEADS_PATH = os.path.join(os.path.dirname(__file__), '../../src/data/mock/leads.json')
 TASKS_PATH = os.path.join(os.path.dirname(__file__), '../../src/data/mock/tasks.json')
 INTERACTIONS_PATH = os.path.join(os.path.dirname(__file__), '../../src/data/mock/interactions.json')
 
-def _load_json(path: str) -> List[Dict]:
-    """Load JSON file"""
-    try:
-        with open(path, 'r') as f:
-            return json.load(f)
-    except:
-        return []
+def _load_json(path: str, for_update: bool = False) -> List[Dict]:
+    """Load JSON file (cached until the file changes)"""
+    return read_json(path, [], for_update)
 
 def get_daily_summary() -> Dict:
     """
@@ -199,13 +196,6 @@ def create_tasks_from_action_items() -> Dict:
             "tasks_created": 0
         }
     
-    # Load existing tasks
-    try:
-        with open(TASKS_PATH, 'r') as f:
-            tasks = json.load(f)
-    except:
-        tasks = []
-    
     created_tasks = []
     today = datetime.now().strftime("%Y-%m-%d")
     
@@ -240,13 +230,14 @@ def create_tasks_from_action_items() -> Dict:
             "tags": ["auto-generated", "daily-summary"]
         }
         
-        tasks.append(new_task)
         created_tasks.append(new_task)
     
-    # Save tasks
+    # Load existing tasks and save, locked so concurrent writers don't lose each other's tasks
     try:
-        with open(TASKS_PATH, 'w') as f:
-            json.dump(tasks, f, indent=2)
+        with file_lock(TASKS_PATH):
+            tasks = _load_json(TASKS_PATH, for_update=True)
+            tasks.extend(created_tasks)
+            write_json(TASKS_PATH, tasks)
     except Exception as e:
         return {
             "success": False,
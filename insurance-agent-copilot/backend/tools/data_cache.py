@@ -0,0 +1,173 @@
+"""
+JSON Data Cache
+Parsed JSON files cached in memory and re-read only when the file changes on disk
+(mtime/size/inode), so tools stop re-parsing the mock data on every call. Writes are
+atomic (each through its own temp file), and the tool functions that read-modify-write a
+file hold its file_lock around the whole update.
+"""
+
+import json
+import os
+import stat
+import tempfile
+import threading
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+_cache: Dict[str, Tuple[Tuple[int, int, int], Any]] = {}
+_lock = threading.Lock()
+_file_locks: Dict[str, threading.RLock] = {}
+
+
+def file_lock(path: str) -> threading.RLock:
+    """
+    Get the write lock for a data file
+
+    Args:
+        path: Path of the JSON file
+
+    Returns:
+        Lock shared by every writer of that file in this process (re-entrant, so a locked
+        caller can use tool functions that lock the same file)
+    """
+    path = os.path.abspath(path)
+    with _lock:
+        if path not in _file_locks:
+            _file_locks[path] = threading.RLock()
+        return _file_locks[path]
+
+
+def _signature(path: str) -> Optional[Tuple[int, int, int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def read_json(path: str, default: Any = None, for_update: bool = False) -> Any:
+    """
+    Load a JSON file through the cache
+
+    The returned object is shared between callers and must be treated as read-only.
+    Read-modify-write code passes for_update=True to get a private copy.
+
+    Args:
+        path: JSON file path
+        default: Returned when the file is missing or invalid
+        for_update: Return a copy (list and its dict records copied one level deep)
+
+    Returns:
+        Parsed JSON data or default
+    """
+    path = os.path.abspath(path)
+    signature = _signature(path)
+    if signature is None:
+        return default
+
+    entry = _cache.get(path)
+    if entry is not None and entry[0] == signature:
+        data = entry[1]
+    else:
+        try:
+            with open(path, 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return default
+        with _lock:
+            _cache[path] = (signature, data)
+
+    if for_update:
+        return _copy(data)
+    return data
+
+
+def write_json(path: str, data: Any, indent: int = 2, fsync: bool = False):
+    """
+    Write a JSON file atomically (temp file + rename) and keep the cache in sync with it
+
+    Args:
+        path: JSON file path
+        data: Data to write (owned by the cache afterwards, don't mutate it)
+        indent: JSON indentation
+        fsync: Flush the file and its directory entry to disk before returning
+    """
+    path = os.path.abspath(path)
+    # A unique temp file per write: concurrent writers never share (or rename away) each other's
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{os.path.basename(path)}.", suffix=".tmp", dir=os.path.dirname(path))
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(data, f, indent=indent)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        try:
+            mode = stat.S_IMODE(os.stat(path).st_mode)
+        except OSError:
+            mode = 0o644  # mkstemp creates the file owner-only
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+    if fsync:
+        directory = os.open(os.path.dirname(path), os.O_RDONLY)
+        try:
+            os.fsync(directory)
+        finally:
+            os.close(directory)
+    signature = _signature(path)
+    with _lock:
+        if signature is not None:
+            _cache[path] = (signature, data)
+        else:
+            _cache.pop(path, None)
+
+
+def prime(paths: Iterable[str]) -> Dict[str, int]:
+    """
+    Load files into the cache ahead of the first request
+
+    Args:
+        paths: JSON files to load
+
+    Returns:
+        Mapping of path to number of records loaded
+    """
+    loaded = {}
+    for path in paths:
+        data = read_json(path)
+        if data is not None:
+            loaded[path] = len(data) if isinstance(data, (list, dict)) else 1
+    return loaded
+
+
+def snapshot() -> Tuple:
+    """
+    On-disk signatures of every file the cache has loaded
+
+    Changes whenever one of them is written (by this process or another), so results
+    derived from the data can be keyed on it.
+    """
+    with _lock:
+        paths = sorted(_cache)
+    return tuple((path, _signature(path)) for path in paths)
+
+
+def invalidate(path: Optional[str] = None):
+    """Drop one file (or everything) from the cache"""
+    with _lock:
+        if path is None:
+            _cache.clear()
+        else:
+            _cache.pop(os.path.abspath(path), None)
+
+
+def _copy(data: Any) -> Any:
+    if isinstance(data, list):
+        return [dict(item) if isinstance(item, dict) else item for item in data]
+    if isinstance(data, dict):
+        return dict(data)
+    return data
@@ -3,28 +3,27 @@ Interaction Management Tools
 Simple functions to manage lead interactions
 """
 
-import json
 import os
 from typing import Dict, List, Optional
 from datetime import datetime
 
+from tools.data_cache import file_lock, read_json, write_json
+from tools import lead_versions
+
 DATA_PATH = os.path.join(os.path.dirname(__file__), '../../src/data/mock/interactions.json')
 
-def _load_interactions() -> List[Dict]:
-    """Load interactions from JSON file"""
-    try:
-        with open(DATA_PATH, 'r') as f:
-            return json.load(f)
-    except:
-        return []
+def _load_interactions(for_update: bool = False) -> List[Dict]:
+    """Load interactions from JSON file (cached until the file changes)"""
+    return read_json(DATA_PATH, [], for_update)
 
-def _save_interactions(interactions: List[Dict]):
-    """Save interactions to JSON file"""
+def _save_interactions(interactions: List[Dict]) -> Optional[str]:
+    """Save interactions to JSON file; returns the error message if it failed"""
     try:
-        with open(DATA_PATH, 'w') as f:
-            json.dump(interactions, f, indent=2)
+        write_json(DATA_PATH, interactions)
     except Exception as e:
         print(f"Error saving interactions: {e}")
+        return str(e)
+    return None
 
 def get_lead_interactions(lead_id: str) -> List[Dict]:
     """
@@ -52,8 +51,6 @@ def add_interaction(lead_id: str, interaction_type: str, content: str, sentiment
     Returns:
         Created interaction
     """
-    interactions = _load_interactions()
-    
     new_interaction = {
         "id": f"interaction-{int(datetime.now().timestamp())}",
         "leadId": lead_id,
@@ -64,8 +61,14 @@ def add_interaction(lead_id: str, interaction_type: str, content: str, sentiment
         "userId": "user-1"
     }
     
-    interactions.append(new_interaction)
-    _save_interactions(interactions)
+    # Locked so concurrent writers (e.g. the message ingest writer) don't lose updates
+    with file_lock(DATA_PATH):
+        interactions = _load_interactions(for_update=True)
+        interactions.append(new_interaction)
+        error = _save_interactions(interactions)
+    if error:
+        return {"success": False, "error": f"Failed to save interaction: {error}"}
+    lead_versions.bump(lead_versions.INTERACTIONS, lead_id)
     
     return {"success": True, "interaction": new_interaction}
 
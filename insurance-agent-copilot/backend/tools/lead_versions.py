@@ -0,0 +1,50 @@
+"""
+Lead Versions
+Per-lead change counters for lead data and interactions. The write tools bump them, so
+results derived from a lead (e.g. cached AI analyses) can be keyed on the versions and
+listeners can drop stale entries as soon as the lead changes.
+"""
+
+import threading
+from typing import Callable, Dict, List, Tuple
+
+LEAD = "lead"
+INTERACTIONS = "interactions"
+
+_versions: Dict[Tuple[str, str], int] = {}
+_listeners: List[Callable[[str, str], None]] = []
+_lock = threading.Lock()
+
+
+def version(kind: str, lead_id: str) -> int:
+    """
+    Current version of a lead's data or interactions
+
+    Args:
+        kind: LEAD or INTERACTIONS
+        lead_id: Lead ID
+
+    Returns:
+        Number of changes seen by this process (0 = unchanged since startup)
+    """
+    return _versions.get((kind, lead_id), 0)
+
+
+def bump(kind: str, lead_id: str) -> int:
+    """Record a change to a lead's data or interactions and notify listeners"""
+    with _lock:
+        value = _versions.get((kind, lead_id), 0) + 1
+        _versions[(kind, lead_id)] = value
+        listeners = list(_listeners)
+    for listener in listeners:
+        try:
+            listener(kind, lead_id)
+        except Exception as e:
+            print(f"Error in lead change listener: {e}")
+    return value
+
+
+def on_change(listener: Callable[[str, str], None]):
+    """Register listener(kind, lead_id), called after every bump"""
+    with _lock:
+        _listeners.append(listener)
@@ -3,28 +3,27 @@ Lead Management Tools
 Simple functions to manage leads
 """
 
-import json
 import os
 from typing import Dict, List, Optional
 
+from tools.data_cache import file_lock, read_json, write_json
+from tools import lead_versions
+
 # Load mock data
 DATA_PATH = os.path.join(os.path.dirname(__file__), '../../src/data/mock/leads.json')
 
-def _load_leads() -> List[Dict]:
-    """Load leads from JSON file"""
-    try:
-        with open(DATA_PATH, 'r') as f:
-            return json.load(f)
-    except:
-        return []
+def _load_leads(for_update: bool = False) -> List[Dict]:
+    """Load leads from JSON file (cached until the file changes)"""
+    return read_json(DATA_PATH, [], for_update)
 
-def _save_leads(leads: List[Dict]):
-    """Save leads to JSON file"""
+def _save_leads(leads: List[Dict]) -> Optional[str]:
+    """Save leads to JSON file; returns the error message if it failed"""
     try:
-        with open(DATA_PATH, 'w') as f:
-            json.dump(leads, f, indent=2)
+        write_json(DATA_PATH, leads)
     except Exception as e:
         print(f"Error saving leads: {e}")
+        return str(e)
+    return None
 
 def get_lead(lead_id: str) -> Optional[Dict]:
     """
@@ -78,18 +77,23 @@ def update_lead(lead_id: str, **updates) -> Dict:
     Returns:
         Updated lead data or error
     """
-    leads = _load_leads()
-    
-    for i, lead in enumerate(leads):
-        if lead.get('id') == lead_id:
-            # Update fields
-            for key, value in updates.items():
-                if key in ['temperature', 'tags', 'notes', 'productInterest', 'premium']:
-                    lead[key] = value
-            
-            leads[i] = lead
-            _save_leads(leads)
-            return {"success": True, "lead": lead}
+    # Locked so concurrent updates (agent threads, async tools) don't lose each other's changes
+    with file_lock(DATA_PATH):
+        leads = _load_leads(for_update=True)
+        
+        for i, lead in enumerate(leads):
+            if lead.get('id') == lead_id:
+                # Update fields
+                for key, value in updates.items():
+                    if key in ['temperature', 'tags', 'notes', 'productInterest', 'premium']:
+                        lead[key] = value
+                
+                leads[i] = lead
+                error = _save_leads(leads)
+                if error:
+                    return {"success": False, "error": f"Failed to save lead: {error}"}
+                lead_versions.bump(lead_versions.LEAD, lead_id)
+                return {"success": True, "lead": lead}
     
     return {"success": False, "error": "Lead not found"}
 
@@ -123,8 +127,6 @@ def create_lead(
     Returns:
         Created lead data with success status
     """
-    leads = _load_leads()
-    
     from datetime import datetime
     
     # Parse product interest
@@ -150,8 +152,12 @@ def create_lead(
         "assignedTo": "user-1"
     }
     
-    leads.append(new_lead)
-    _save_leads(leads)
+    with file_lock(DATA_PATH):
+        leads = _load_leads(for_update=True)
+        leads.append(new_lead)
+        error = _save_leads(leads)
+    if error:
+        return {"success": False, "error": f"Failed to save lead: {error}"}
     
     return {"success": True, "lead": new_lead, "message": f"Lead {name} created successfully"}
 
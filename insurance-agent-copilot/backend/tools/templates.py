@@ -3,19 +3,16 @@ Template Management Tools
 Simple functions to manage message templates
 """
 
-import json
 import os
 from typing import Dict, List, Optional
 
+from tools.data_cache import read_json
+
 DATA_PATH = os.path.join(os.path.dirname(__file__), '../../src/data/mock/templates.json')
 
 def _load_templates() -> List[Dict]:
-    """Load templates from JSON file"""
-    try:
-        with open(DATA_PATH, 'r') as f:
-            return json.load(f)
-    except:
-        return []
+    """Load templates from JSON file (cached until the file changes)"""
+    return read_json(DATA_PATH, [])
 
 def get_all_templates() -> List[Dict]:
     """
@@ -0,0 +1,94 @@
+"""
+Background Warm-up
+Runs the slow startup steps of a backend (heavy imports, LLM client, agents, data caches)
+in a background thread so the HTTP server answers /health immediately, and tracks
+readiness for the /ready endpoint.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+class Warmup:
+    """Ordered warm-up steps executed once in a daemon thread"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._steps: List[Tuple[str, Callable[[], Any]]] = []
+        self._status: Dict[str, Dict] = {}
+        self._results: Dict[str, Any] = {}
+        self._done: Future = Future()
+        self._started_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def add_step(self, name: str, func: Callable[[], Any]):
+        """Register a step; steps run in registration order"""
+        self._steps.append((name, func))
+        self._status[name] = {"status": "pending"}
+
+    def start(self):
+        """Start the warm-up thread (no-op if already started)"""
+        with self._lock:
+            if self._started_at is not None:
+                return
+            self._started_at = time.perf_counter()
+        threading.Thread(target=self._run, name=f"{self.name}-warmup", daemon=True).start()
+
+    def _run(self):
+        for name, func in self._steps:
+            self._status[name] = {"status": "running"}
+            start = time.perf_counter()
+            try:
+                self._results[name] = func()
+            except Exception as e:
+                self._status[name] = {"status": "failed", "error": str(e)}
+                print(f"❌ Warm-up step '{name}' failed: {e}")
+                self._done.set_exception(e)
+                return
+            self._status[name] = {"status": "done", "ms": round((time.perf_counter() - start) * 1000, 1)}
+        print(f"✅ Warm-up complete in {(time.perf_counter() - self._started_at):.2f}s")
+        self._done.set_result(self._results)
+
+    @property
+    def ready(self) -> bool:
+        return self._done.done() and self._done.exception() is None
+
+    def result(self, step: str) -> Any:
+        """Return value of a finished step"""
+        return self._results.get(step)
+
+    async def wait(self, step: str = None) -> Any:
+        """
+        Wait (without blocking the event loop) until warm-up has finished
+
+        Args:
+            step: Step whose return value should be returned
+
+        Returns:
+            The step's return value, or all results
+
+        Raises:
+            Exception: The error of the failed step
+        """
+        self.start()
+        results = await asyncio.wrap_future(self._done)
+        return results.get(step) if step else results
+
+    def status(self) -> Dict:
+        """Readiness report for the /ready endpoint"""
+        elapsed = None
+        if self._started_at is not None:
+            elapsed = round(time.perf_counter() - self._started_at, 3)
+        error = None
+        if self._done.done() and self._done.exception() is not None:
+            error = str(self._done.exception())
+        return {
+            "ready": self.ready,
+            "started": self._started_at is not None,
+            "elapsed_s": elapsed,
+            "error": error,
+            "steps": dict(self._status),
+        }
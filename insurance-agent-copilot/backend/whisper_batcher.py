@@ -0,0 +1,195 @@
+"""
+Whisper Batcher
+Micro-batching inference queue for whisper_server.py. Request threads enqueue decoded
+audio and wait on a future; one worker thread owns the model, collects up to
+WHISPER_MAX_BATCH clips or waits WHISPER_MAX_WAIT_MS after the first one, and runs the
+clips as one padded batch (30 s log-mel windows) through whisper.decode. Clips longer
+than one window go through model.transcribe on the same worker, one at a time.
+"""
+
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Dict, List
+
+import numpy as np
+import torch
+import whisper
+
+WHISPER_MAX_BATCH = int(os.getenv("WHISPER_MAX_BATCH", "8"))
+WHISPER_MAX_WAIT_MS = int(os.getenv("WHISPER_MAX_WAIT_MS", "30"))
+WHISPER_QUEUE_SIZE = int(os.getenv("WHISPER_QUEUE_SIZE", "64"))
+WHISPER_REQUEST_TIMEOUT_SECONDS = float(os.getenv("WHISPER_REQUEST_TIMEOUT_SECONDS", "120"))
+
+
+class QueueFullError(RuntimeError):
+    """Too many transcriptions are waiting"""
+
+
+class _Job:
+    __slots__ = ("audio", "language", "future", "enqueued")
+
+    def __init__(self, audio: np.ndarray, language: str):
+        self.audio = audio
+        self.language = language
+        self.future: Future = Future()
+        self.enqueued = time.monotonic()
+
+
+class TranscriptionBatcher:
+    """Batches concurrent transcriptions through one Whisper model"""
+
+    def __init__(
+        self,
+        model,
+        max_batch: int = WHISPER_MAX_BATCH,
+        max_wait_ms: int = WHISPER_MAX_WAIT_MS,
+        queue_size: int = WHISPER_QUEUE_SIZE
+    ):
+        """
+        Args:
+            model: Loaded Whisper model (only the worker thread uses it)
+            max_batch: Clips decoded together (1 turns batching off)
+            max_wait_ms: How long the first clip of a batch waits for company
+            queue_size: Clips waiting before new requests are refused
+        """
+        self.model = model
+        self.max_batch = max(1, max_batch)
+        self.max_wait = max_wait_ms / 1000
+        self._queue: "queue.Queue[_Job]" = queue.Queue(maxsize=max(1, queue_size))
+        self._fp16 = getattr(model.device, "type", "cpu") == "cuda"
+        self._n_mels = model.dims.n_mels
+        self._lock = threading.Lock()
+        self._counts = {
+            "requests": 0, "rejected": 0, "failed": 0, "batches": 0, "batched_clips": 0,
+            "long_clips": 0, "max_batch_seen": 0, "max_queue_depth": 0,
+        }
+        self._wait_ms = 0.0
+        self._infer_ms = 0.0
+        self._thread = threading.Thread(target=self._run, name="whisper-batcher", daemon=True)
+        self._thread.start()
+
+    # ---------------- Request threads ----------------
+
+    def transcribe(self, audio: np.ndarray, language: str = "en",
+                   timeout: float = WHISPER_REQUEST_TIMEOUT_SECONDS) -> Dict:
+        """
+        Queue a clip and wait for its transcription
+
+        Args:
+            audio: float32 mono 16 kHz samples
+            language: Spoken language
+            timeout: Seconds to wait for the result
+
+        Returns:
+            {"text": ..., "language": ...}
+
+        Raises:
+            QueueFullError: If the queue is full
+        """
+        job = _Job(audio, language)
+        try:
+            self._queue.put_nowait(job)
+        except queue.Full:
+            with self._lock:
+                self._counts["rejected"] += 1
+            raise QueueFullError("Transcription queue is full")
+        depth = self._queue.qsize()
+        with self._lock:
+            self._counts["requests"] += 1
+            self._counts["max_queue_depth"] = max(self._counts["max_queue_depth"], depth)
+        try:
+            return job.future.result(timeout)
+        except FutureTimeoutError:  # Not the builtin TimeoutError before Python 3.11
+            job.future.cancel()  # Skipped by the worker if it hasn't started yet
+            raise
+
+    # ---------------- Worker ----------------
+
+    def _collect(self) -> List[_Job]:
+        jobs = [self._queue.get()]
+        deadline = jobs[0].enqueued + self.max_wait
+        while len(jobs) < self.max_batch:
+            remaining = deadline - time.monotonic()
+            try:
+                jobs.append(self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return jobs
+
+    def _run(self):
+        while True:
+            # Requests that timed out while queued are dropped here
+            jobs = [job for job in self._collect() if job.future.set_running_or_notify_cancel()]
+            if not jobs:
+                continue
+            started = time.monotonic()
+            short = [job for job in jobs if len(job.audio) <= whisper.audio.N_SAMPLES]
+            long = [job for job in jobs if len(job.audio) > whisper.audio.N_SAMPLES]
+
+            # Clips that fit one window, batched per language
+            by_language: Dict[str, List[_Job]] = {}
+            for job in short:
+                by_language.setdefault(job.language, []).append(job)
+            for language, group in by_language.items():
+                self._decode_batch(group, language)
+
+            for job in long:
+                self._transcribe_long(job)
+
+            finished = time.monotonic()
+            with self._lock:
+                self._counts["batches"] += 1
+                self._counts["batched_clips"] += len(short)
+                self._counts["long_clips"] += len(long)
+                self._counts["max_batch_seen"] = max(self._counts["max_batch_seen"], len(jobs))
+                self._wait_ms += sum((started - job.enqueued) * 1000 for job in jobs)
+                self._infer_ms += (finished - started) * 1000
+
+    def _decode_batch(self, jobs: List[_Job], language: str):
+        try:
+            mel = torch.stack([
+                whisper.log_mel_spectrogram(whisper.pad_or_trim(job.audio), n_mels=self._n_mels)
+                for job in jobs
+            ]).to(self.model.device)
+            options = whisper.DecodingOptions(language=language, fp16=self._fp16, without_timestamps=True)
+            results = whisper.decode(self.model, mel, options)
+        except Exception as e:
+            self._fail(jobs, e)
+            return
+        for job, result in zip(jobs, results):
+            job.future.set_result({"text": result.text.strip(), "language": result.language or language})
+
+    def _transcribe_long(self, job: _Job):
+        try:
+            result = self.model.transcribe(job.audio, language=job.language, fp16=self._fp16)
+        except Exception as e:
+            self._fail([job], e)
+            return
+        job.future.set_result({"text": result["text"].strip(), "language": result.get("language", job.language)})
+
+    def _fail(self, jobs: List[_Job], error: Exception):
+        with self._lock:
+            self._counts["failed"] += len(jobs)
+        for job in jobs:
+            job.future.set_exception(error)
+
+    # ---------------- Metrics ----------------
+
+    def stats(self) -> Dict:
+        with self._lock:
+            batches = self._counts["batches"]
+            clips = self._counts["batched_clips"] + self._counts["long_clips"]
+            return {
+                "queue_depth": self._queue.qsize(),
+                "queue_capacity": self._queue.maxsize,
+                "max_batch": self.max_batch,
+                "max_wait_ms": round(self.max_wait * 1000),
+                **self._counts,
+                "avg_batch": round(clips / batches, 2) if batches else 0,
+                "avg_wait_ms": round(self._wait_ms / clips, 1) if clips else 0,
+                "avg_batch_ms": round(self._infer_ms / batches, 1) if batches else 0,
+            }
+
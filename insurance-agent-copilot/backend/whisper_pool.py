@@ -0,0 +1,317 @@
+"""
+Whisper Worker Pool
+Multi-process mode for whisper_server.py on many-core CPU boxes. WHISPER_WORKERS
+processes each load their own model with WHISPER_THREADS_PER_WORKER torch/OpenMP
+threads and batch their own requests (whisper_batcher). The server process only decodes
+uploads and dispatches each clip to the worker with the fewest clips in flight, so
+throughput scales with cores instead of one model's thread pool. Workers that die are
+restarted with exponential backoff, and their in-flight requests fail instead of hanging;
+a worker that keeps crashing (e.g. its model can't load) is given up on and reported as
+failed.
+"""
+
+import itertools
+import multiprocessing as mp
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Dict, List, Optional
+
+import numpy as np
+
+WHISPER_MODEL = os.getenv("WHISPER_MODEL", "base")
+WHISPER_DOWNLOAD_ROOT = "~/.cache/whisper"
+WHISPER_WORKERS = int(os.getenv("WHISPER_WORKERS", "1"))
+WHISPER_THREADS_PER_WORKER = int(os.getenv("WHISPER_THREADS_PER_WORKER", "0"))  # 0 = cores / workers
+WHISPER_QUEUE_SIZE = int(os.getenv("WHISPER_QUEUE_SIZE", "64"))
+WHISPER_REQUEST_TIMEOUT_SECONDS = float(os.getenv("WHISPER_REQUEST_TIMEOUT_SECONDS", "120"))
+# Restart backoff doubles per consecutive crash, from the base up to the cap; after
+# WHISPER_MAX_RESTARTS consecutive crashes the worker is left down. A worker that stayed up
+# for WHISPER_RESTART_RESET_SECONDS starts counting again from zero.
+WHISPER_MAX_RESTARTS = int(os.getenv("WHISPER_MAX_RESTARTS", "5"))
+WHISPER_RESTART_BACKOFF_SECONDS = float(os.getenv("WHISPER_RESTART_BACKOFF_SECONDS", "1"))
+WHISPER_RESTART_BACKOFF_MAX_SECONDS = float(os.getenv("WHISPER_RESTART_BACKOFF_MAX_SECONDS", "60"))
+WHISPER_RESTART_RESET_SECONDS = float(os.getenv("WHISPER_RESTART_RESET_SECONDS", "300"))
+
+_READY = "ready"
+_DONE = "done"
+_ERROR = "error"
+
+
+def _worker_main(worker_id: int, model_name: str, threads: int, jobs, results):
+    """Worker process: load a model with a fixed thread budget and serve jobs through a batcher"""
+    for var in ("OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS"):
+        os.environ[var] = str(threads)
+    import torch
+    torch.set_num_threads(threads)
+    torch.set_num_interop_threads(1)
+    import whisper
+    from whisper_batcher import TranscriptionBatcher
+
+    model = whisper.load_model(model_name, download_root=WHISPER_DOWNLOAD_ROOT)
+    batcher = TranscriptionBatcher(model)
+    results.put((_READY, worker_id, None, None, time.process_time()))
+
+    def run(job_id: int, audio: np.ndarray, language: str):
+        try:
+            value = batcher.transcribe(audio, language)
+            results.put((_DONE, worker_id, job_id, value, time.process_time()))
+        except Exception as e:
+            results.put((_ERROR, worker_id, job_id, f"{type(e).__name__}: {e}", time.process_time()))
+
+    # Enough request threads waiting on the batcher to fill its batches; the rest wait here
+    with ThreadPoolExecutor(max_workers=batcher.max_batch * 2, thread_name_prefix="whisper-job") as executor:
+        while True:
+            item = jobs.get()
+            if item is None:
+                return
+            executor.submit(run, *item)
+
+
+class _Worker:
+    """Server-side handle of one worker process"""
+
+    def __init__(self, worker_id: int):
+        self.id = worker_id
+        self.process: Optional[mp.process.BaseProcess] = None
+        self.jobs = None
+        self.ready = False
+        self.started = 0.0
+        self.in_flight: Dict[int, Future] = {}
+        self.sent_at: Dict[int, float] = {}
+        self.cpu_seconds = 0.0
+        self.counts = {"completed": 0, "failed": 0, "restarts": 0}
+        self.latency_ms = 0.0
+        self.crashes = 0  # Consecutive crashes
+        self.restart_at: Optional[float] = None  # Scheduled restart after a crash
+        self.gave_up = False
+        self.last_exit: Optional[int] = None
+
+    @property
+    def state(self) -> str:
+        if self.gave_up:
+            return "failed"
+        if self.restart_at is not None:
+            return "restarting"
+        return "ready" if self.ready else "starting"
+
+
+class WhisperPool:
+    """Least-loaded dispatcher over N Whisper worker processes"""
+
+    def __init__(
+        self,
+        workers: int = WHISPER_WORKERS,
+        threads_per_worker: int = WHISPER_THREADS_PER_WORKER,
+        model_name: str = WHISPER_MODEL,
+        queue_size: int = WHISPER_QUEUE_SIZE
+    ):
+        """
+        Args:
+            workers: Worker processes (one model each)
+            threads_per_worker: torch/OpenMP threads per worker (0 = cores / workers)
+            model_name: Whisper model every worker loads
+            queue_size: Clips in flight per worker before requests are refused
+        """
+        self.model_name = model_name
+        self.threads = threads_per_worker or max(1, (os.cpu_count() or 1) // max(1, workers))
+        self.capacity = max(1, queue_size) * max(1, workers)
+        self._ctx = mp.get_context("spawn")  # Fresh interpreters: no forked torch state
+        self._results = self._ctx.Queue()
+        self._workers = [_Worker(i) for i in range(max(1, workers))]
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._closed = False
+        self._counts = {"requests": 0, "rejected": 0, "timeouts": 0}
+        for worker in self._workers:
+            self._start(worker)
+        threading.Thread(target=self._read_results, name="whisper-pool-results", daemon=True).start()
+        threading.Thread(target=self._monitor, name="whisper-pool-monitor", daemon=True).start()
+
+    def _start(self, worker: _Worker):
+        worker.jobs = self._ctx.Queue()
+        worker.ready = False
+        worker.started = time.monotonic()
+        worker.cpu_seconds = 0.0
+        worker.process = self._ctx.Process(
+            target=_worker_main,
+            args=(worker.id, self.model_name, self.threads, worker.jobs, self._results),
+            name=f"whisper-worker-{worker.id}",
+            daemon=True,
+        )
+        worker.process.start()
+
+    # ---------------- Request threads ----------------
+
+    def transcribe(self, audio: np.ndarray, language: str = "en",
+                   timeout: float = WHISPER_REQUEST_TIMEOUT_SECONDS) -> Dict:
+        """
+        Send a clip to the least-loaded worker and wait for its transcription
+
+        Returns:
+            {"text": ..., "language": ...}
+
+        Raises:
+            QueueFullError: If every worker is at capacity
+        """
+        from whisper_batcher import QueueFullError
+
+        future: Future = Future()
+        with self._lock:
+            worker = self._pick()
+            in_flight = sum(len(w.in_flight) for w in self._workers)
+            if worker is None or in_flight >= self.capacity:
+                self._counts["rejected"] += 1
+                raise QueueFullError("All Whisper workers are busy" if worker else "No Whisper worker is running")
+            job_id = next(self._ids)
+            worker.in_flight[job_id] = future
+            worker.sent_at[job_id] = time.monotonic()
+            self._counts["requests"] += 1
+            jobs = worker.jobs
+        jobs.put((job_id, audio, language))
+
+        try:
+            return future.result(timeout)
+        except FutureTimeoutError:  # Not the builtin TimeoutError before Python 3.11
+            with self._lock:
+                if worker.in_flight.pop(job_id, None) is not None:
+                    worker.sent_at.pop(job_id, None)
+                self._counts["timeouts"] += 1
+            raise
+
+    def _pick(self) -> Optional[_Worker]:
+        """Fewest clips in flight among live workers (ready ones first), then least CPU used"""
+        alive = [w for w in self._workers if w.process is not None and w.process.is_alive()]
+        candidates = [w for w in alive if w.ready] or alive
+        if not candidates:
+            return None
+        return min(candidates, key=lambda w: (len(w.in_flight), w.cpu_seconds))
+
+    # ---------------- Background threads ----------------
+
+    def _read_results(self):
+        while not self._closed:
+            try:
+                kind, worker_id, job_id, value, cpu_seconds = self._results.get(timeout=1)
+            except queue.Empty:
+                continue
+            except (EOFError, OSError):
+                return
+            now = time.monotonic()
+            with self._lock:
+                worker = self._workers[worker_id]
+                worker.cpu_seconds = cpu_seconds
+                if kind == _READY:
+                    worker.ready = True
+                    print(f"✅ Whisper worker {worker_id} ready (pid {worker.process.pid}, {self.threads} threads)")
+                    continue
+                future = worker.in_flight.pop(job_id, None)
+                sent_at = worker.sent_at.pop(job_id, None)
+                if kind == _DONE:
+                    worker.counts["completed"] += 1
+                    if sent_at is not None:
+                        worker.latency_ms += (now - sent_at) * 1000
+                else:
+                    worker.counts["failed"] += 1
+            if future is None:
+                continue  # The request already timed out
+            if kind == _DONE:
+                future.set_result(value)
+            else:
+                future.set_exception(RuntimeError(value))
+
+    def _monitor(self):
+        while not self._closed:
+            time.sleep(0.5)
+            for worker in self._workers:
+                if self._closed:
+                    return
+                if worker.restart_at is not None:
+                    if time.monotonic() >= worker.restart_at:
+                        worker.restart_at = None
+                        with self._lock:
+                            worker.counts["restarts"] += 1
+                        self._start(worker)
+                elif not worker.gave_up and not worker.process.is_alive():
+                    self._worker_exited(worker)
+
+    def _worker_exited(self, worker: _Worker):
+        """Fail the worker's requests and schedule its restart (or give up on it)"""
+        now = time.monotonic()
+        with self._lock:
+            orphaned = list(worker.in_flight.values())
+            worker.in_flight.clear()
+            worker.sent_at.clear()
+            worker.counts["failed"] += len(orphaned)
+            worker.ready = False
+            worker.last_exit = worker.process.exitcode
+            if now - worker.started >= WHISPER_RESTART_RESET_SECONDS:
+                worker.crashes = 0
+            worker.crashes += 1
+            if worker.crashes > WHISPER_MAX_RESTARTS:
+                worker.gave_up = True
+            else:
+                delay = min(WHISPER_RESTART_BACKOFF_MAX_SECONDS,
+                            WHISPER_RESTART_BACKOFF_SECONDS * 2 ** (worker.crashes - 1))
+                worker.restart_at = now + delay
+        if worker.gave_up:
+            print(f"❌ Whisper worker {worker.id} exited ({worker.last_exit}) after "
+                  f"{WHISPER_MAX_RESTARTS} restarts; giving up on it")
+        else:
+            print(f"❌ Whisper worker {worker.id} exited ({worker.last_exit}); restarting in {delay:.1f}s")
+        for future in orphaned:
+            future.set_exception(RuntimeError(f"Whisper worker {worker.id} exited"))
+
+    def close(self, timeout: float = 5.0):
+        """Stop the workers (registered to run at exit)"""
+        self._closed = True
+        for worker in self._workers:
+            try:
+                worker.jobs.put(None)
+            except (OSError, ValueError):
+                pass
+        for worker in self._workers:
+            worker.process.join(timeout)
+            if worker.process.is_alive():
+                worker.process.terminate()
+
+    # ---------------- Metrics ----------------
+
+    def stats(self) -> Dict:
+        """Pool totals plus per-worker liveness, load and CPU utilization"""
+        now = time.monotonic()
+        with self._lock:
+            workers: List[Dict] = []
+            for w in self._workers:
+                uptime = max(now - w.started, 1e-6)
+                completed = w.counts["completed"]
+                workers.append({
+                    "id": w.id,
+                    "pid": w.process.pid if w.process else None,
+                    "alive": bool(w.process and w.process.is_alive()),
+                    "ready": w.ready,
+                    "state": w.state,
+                    "in_flight": len(w.in_flight),
+                    **w.counts,
+                    "cpu_seconds": round(w.cpu_seconds, 1),
+                    # Share of this worker's thread budget kept busy since it started
+                    "utilization": round(min(1.0, w.cpu_seconds / (uptime * self.threads)), 3),
+                    "avg_latency_ms": round(w.latency_ms / completed, 1) if completed else 0,
+                    "consecutive_crashes": w.crashes,
+                    "last_exit_code": w.last_exit,
+                    "restart_in_s": round(max(0.0, w.restart_at - now), 1) if w.restart_at is not None else None,
+                })
+            return {
+                "mode": "pool",
+                "model": self.model_name,
+                "workers": len(self._workers),
+                "ready_workers": sum(1 for w in workers if w["ready"] and w["alive"]),
+                "failed_workers": sum(1 for w in workers if w["state"] == "failed"),
+                "threads_per_worker": self.threads,
+                "in_flight": sum(w["in_flight"] for w in workers),
+                "capacity": self.capacity,
+                **self._counts,
+                "worker_stats": workers,
+            }
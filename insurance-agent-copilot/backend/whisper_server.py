@@ -3,24 +3,65 @@ Whisper Speech-to-Text Server
 Local speech recognition using OpenAI Whisper
 """
 
+import atexit
+import threading
+
 from flask import Flask, request, jsonify
 from flask_cors import CORS
 import whisper
-import tempfile
-import os
+
+import audio_decode
+from audio_decode import AudioDecodeError, decode_audio
+from whisper_batcher import QueueFullError, TranscriptionBatcher
+from whisper_pool import WHISPER_DOWNLOAD_ROOT, WHISPER_MODEL, WHISPER_WORKERS, WhisperPool
 
 app = Flask(__name__)
 CORS(app)
 
-# Load Whisper model (base model - good balance of speed and accuracy)
-# Options: tiny, base, small, medium, large
-print("Loading Whisper model...")
-model = whisper.load_model("base", download_root="~/.cache/whisper")
-print("✅ Whisper model loaded!")
+_transcriber = None
+_transcriber_lock = threading.Lock()
+
+
+def get_transcriber():
+    """
+    The batcher (one in-process model) or, with WHISPER_WORKERS > 1, the worker pool.
+    Created on first use rather than at import: pool workers are spawned processes that
+    re-import this module and must not load a model of their own here.
+    """
+    global _transcriber
+    with _transcriber_lock:
+        if _transcriber is None:
+            if WHISPER_WORKERS > 1:
+                print(f"Starting {WHISPER_WORKERS} Whisper workers...")
+                _transcriber = WhisperPool()
+                atexit.register(_transcriber.close)
+            else:
+                # Load Whisper model (base model - good balance of speed and accuracy)
+                # Options: tiny, base, small, medium, large
+                print("Loading Whisper model...")
+                model = whisper.load_model(WHISPER_MODEL, download_root=WHISPER_DOWNLOAD_ROOT)
+                print("✅ Whisper model loaded!")
+                # Concurrent requests are decoded together in small batches by one worker thread
+                _transcriber = TranscriptionBatcher(model)
+        return _transcriber
+
 
 @app.route('/health', methods=['GET'])
 def health():
-    return jsonify({"status": "healthy", "model": "whisper-base"})
+    transcriber = get_transcriber()
+    status = {"status": "healthy", "model": f"whisper-{WHISPER_MODEL}", "decode": audio_decode.stats()}
+    if isinstance(transcriber, WhisperPool):
+        pool = transcriber.stats()
+        status["workers"] = pool
+        if pool["failed_workers"] == pool["workers"]:
+            # Every worker crashed past its restart limit: nothing can transcribe
+            status["status"] = "unhealthy"
+            return jsonify(status), 503
+        if pool["ready_workers"] < pool["workers"]:
+            status["status"] = "degraded" if pool["ready_workers"] else "starting"
+    else:
+        status["batching"] = transcriber.stats()
+    return jsonify(status)
 
 @app.route('/transcribe', methods=['POST'])
 def transcribe():
@@ -36,28 +77,26 @@ def transcribe():
         
         audio_file = request.files['audio']
         
-        # Save to temporary file
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.webm') as temp_audio:
-            audio_file.save(temp_audio.name)
-            temp_path = temp_audio.name
+        # Decode in memory (ffmpeg over a pipe) instead of a temp file for Whisper to read back
+        try:
+            audio = decode_audio(audio_file.read())
+        except AudioDecodeError as e:
+            return jsonify({"error": f"Could not decode audio: {e}"}), 400
         
+        # Transcribe using Whisper (queued for the next batch, on the least-loaded worker in pool mode)
+        print(f"🎤 Transcribing audio...")
         try:
-            # Transcribe using Whisper
-            print(f"🎤 Transcribing audio...")
-            result = model.transcribe(temp_path, language='en')
-            text = result["text"].strip()
-            
-            print(f"✅ Transcription: {text}")
-            
-            return jsonify({
-                "text": text,
-                "language": result.get("language", "en")
-            })
+            result = get_transcriber().transcribe(audio, language='en')
+        except QueueFullError as e:
+            return jsonify({"error": str(e)}), 503, {"Retry-After": "1"}
+        text = result["text"]
+        
+        print(f"✅ Transcription: {text}")
         
-        finally:
-            # Clean up temporary file
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
+        return jsonify({
+            "text": text,
+            "language": result.get("language", "en")
+        })
     
     except Exception as e:
         print(f"❌ Transcription error: {e}")
@@ -67,4 +106,5 @@ if __name__ == '__main__':
     print("🚀 Starting Whisper server on http://localhost:5001")
     print("📝 Endpoint: POST /transcribe")
     print("💡 Send audio file as 'audio' in form-data")
+    get_transcriber()  # Load the model (or start the workers) before taking requests
     app.run(host='0.0.0.0', port=5001, debug=False)
@@ -72,6 +72,38 @@ def check_port(port):
     sock.close()
     return result == 0
 
+def wait_for_url(url, process, timeout=60, interval=0.1):
+    """
+    Poll an HTTP endpoint until it returns 200
+    
+    Returns False if the process exits or the timeout expires first
+    """
+    import urllib.request
+    import urllib.error
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if process.poll() is not None:
+            return False
+        try:
+            with urllib.request.urlopen(url, timeout=1) as response:
+                if response.status == 200:
+                    return True
+        except (urllib.error.URLError, ConnectionError, OSError):
+            pass
+        time.sleep(interval)
+    return False
+
+def wait_for_port(port, process, timeout=60, interval=0.1):
+    """Poll until something listens on the port (False if the process exits or times out)"""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if process.poll() is not None:
+            return False
+        if check_port(port):
+            return True
+        time.sleep(interval)
+    return False
+
 def main():
     print_header("Insurance Agent Copilot Startup")
     
@@ -115,9 +147,9 @@ def main():
         )
         processes.append(("Backend API", backend_process))
         print_success("Backend API starting...")
-        time.sleep(3)  # Wait for backend to initialize
         
-        if backend_process.poll() is not None:
+        # /health answers as soon as the server is up; the agent keeps warming up in the background
+        if not wait_for_url("http://localhost:5000/health", backend_process, timeout=30):
             print_error("Backend API failed to start")
             return
         print_success("Backend API running on http://localhost:5000")
@@ -138,9 +170,8 @@ def main():
         processes.append(("Whisper Server", whisper_process))
         print_success("Whisper Server starting...")
         print_info("Loading Whisper model (this may take a moment)...")
-        time.sleep(5)  # Wait for Whisper to load model
         
-        if whisper_process.poll() is not None:
+        if not wait_for_url("http://localhost:5001/health", whisper_process, timeout=300):
             print_error("Whisper Server failed to start")
             return
         print_success("Whisper Server running on http://localhost:5001")
@@ -180,9 +211,8 @@ def main():
         )
         processes.append(("Frontend", frontend_process))
         print_success("Frontend starting...")
-        time.sleep(5)  # Wait for Vite to start
         
-        if frontend_process.poll() is not None:
+        if not wait_for_port(3000, frontend_process, timeout=60):
             print_error("Frontend failed to start")
             return
         print_success("Frontend running on http://localhost:3000")
@@ -190,6 +220,12 @@ def main():
         print_error(f"Failed to start Frontend: {e}")
         return
     
+    # Wait for the backend agent warm-up to finish
+    if wait_for_url("http://localhost:5000/ready", backend_process, timeout=120):
+        print_success("Backend agent ready")
+    else:
+        print_warning("Backend agent still warming up - check http://localhost:5000/ready")
+    
     # All services started successfully
     print_header("All Services Running!")
     print_success("Backend API:     http://localhost:5000")
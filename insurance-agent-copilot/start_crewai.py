@@ -9,28 +9,59 @@ import sys
 import subprocess
 import time
 import signal
+import socket
+import urllib.request
+import urllib.error
+from importlib import metadata
+from importlib.util import find_spec
 from pathlib import Path
 
 def check_requirements():
     """Check if required dependencies are installed"""
     print("🔍 Checking CrewAI requirements...")
     
-    try:
-        import crewai
-        print(f"✅ CrewAI version: {crewai.__version__}")
-    except ImportError:
+    # Check installed versions without importing the packages (importing CrewAI takes seconds)
+    if find_spec("crewai") is not None:
+        print(f"✅ CrewAI version: {metadata.version('crewai')}")
+    else:
         print("❌ CrewAI not installed. Installing...")
         subprocess.run([sys.executable, "-m", "pip", "install", "-r", "backend/requirements_crewai.txt"])
     
-    try:
-        import fastapi
-        print(f"✅ FastAPI version: {fastapi.__version__}")
-    except ImportError:
+    if find_spec("fastapi") is not None:
+        print(f"✅ FastAPI version: {metadata.version('fastapi')}")
+    else:
         print("❌ FastAPI not installed")
         return False
     
     return True
 
+def wait_for_url(url, process, timeout=60, interval=0.1):
+    """Poll an HTTP endpoint until it returns 200 (False if the process exits or times out)"""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if process.poll() is not None:
+            return False
+        try:
+            with urllib.request.urlopen(url, timeout=1) as response:
+                if response.status == 200:
+                    return True
+        except (urllib.error.URLError, ConnectionError, OSError):
+            pass
+        time.sleep(interval)
+    return False
+
+def wait_for_port(port, process, timeout=60, interval=0.1):
+    """Poll until something listens on the port (False if the process exits or times out)"""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if process.poll() is not None:
+            return False
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            if sock.connect_ex(('localhost', port)) == 0:
+                return True
+        time.sleep(interval)
+    return False
+
 def start_crewai_backend():
     """Start the CrewAI backend server"""
     print("🚀 Starting CrewAI Backend (Port 5001)...")
@@ -157,13 +188,22 @@ def main():
         print("Please add your Gemini API key to .env file")
     
     try:
-        # Start backend
+        # Start backend (/health answers immediately, agents warm up in the background)
         backend_process = start_crewai_backend()
-        time.sleep(3)  # Give backend time to start
+        if not wait_for_url("http://localhost:5001/health", backend_process, timeout=30):
+            print("❌ Backend failed to start")
+            backend_process.terminate()
+            sys.exit(1)
         
-        # Start frontend
+        # Start frontend while the agents finish warming up
         frontend_process = start_frontend()
-        time.sleep(2)  # Give frontend time to start
+        if not wait_for_port(3000, frontend_process, timeout=60):
+            print("⚠️  Frontend not listening on port 3000 yet")
+        
+        if wait_for_url("http://localhost:5001/ready", backend_process, timeout=120):
+            print("✅ CrewAI agents ready")
+        else:
+            print("⚠️  Agents still warming up - check http://localhost:5001/ready")
         
         # Monitor both processes
         monitor_processes(backend_process, frontend_process)